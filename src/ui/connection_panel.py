@@ -2,7 +2,6 @@
 Панель подключения к диагностическому сканеру ELM327
 """
 
-import os
 import sys
 import time
 from typing import Dict, List, Optional, Tuple
@@ -18,6 +17,7 @@ from PyQt5.QtGui import (QFont, QColor, QPalette, QIcon, QPixmap,
                          QPainter, QPen, QBrush)
 
 from src.elm327_connector import ELM327Connector, ConnectionType
+from src.ui.icons import ICONS_DIR
 from src.utils.logger import setup_logger
 
 
@@ -361,18 +361,19 @@ class DeviceListWidget(QListWidget):
         icon_type = device_info.get("type", "unknown")
         
         if icon_type == "bluetooth":
-            icon_path = "assets/icons/bluetooth.png"
+            icon_path = f"{ICONS_DIR}/bluetooth.png"
         elif icon_type == "serial":
-            icon_path = "assets/icons/usb.png"
+            icon_path = f"{ICONS_DIR}/usb.png"
         elif icon_type == "wifi":
-            icon_path = "assets/icons/wifi.png"
+            icon_path = f"{ICONS_DIR}/wifi.png"
         else:
-            icon_path = "assets/icons/device.png"
+            icon_path = f"{ICONS_DIR}/device.png"
             
-        # Проверка существования иконки
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path).scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            icon_label.setPixmap(pixmap)
+        # Проверка существования иконки (путь может указывать в ресурс Qt,
+        # поэтому проверяется результат загрузки, а не файл на диске)
+        pixmap = QPixmap(icon_path)
+        if not pixmap.isNull():
+            icon_label.setPixmap(pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation))
         else:
             # Альтернативный текст
             icon_label.setText("●")
@@ -541,22 +542,22 @@ class ConnectionPanel(QWidget):
         
         # Вкладка Bluetooth
         self.bluetooth_tab = self.create_bluetooth_tab()
-        self.connection_tabs.addTab(self.bluetooth_tab, QIcon("assets/icons/bluetooth.png"), "Bluetooth")
+        self.connection_tabs.addTab(self.bluetooth_tab, QIcon(f"{ICONS_DIR}/bluetooth.png"), "Bluetooth")
         
         # Вкладка USB (COM-порт)
         self.serial_tab = self.create_serial_tab()
-        self.connection_tabs.addTab(self.serial_tab, QIcon("assets/icons/usb.png"), "USB (COM)")
+        self.connection_tabs.addTab(self.serial_tab, QIcon(f"{ICONS_DIR}/usb.png"), "USB (COM)")
         
         # Вкладка WiFi
         self.wifi_tab = self.create_wifi_tab()
-        self.connection_tabs.addTab(self.wifi_tab, QIcon("assets/icons/wifi.png"), "WiFi")
+        self.connection_tabs.addTab(self.wifi_tab, QIcon(f"{ICONS_DIR}/wifi.png"), "WiFi")
         
         connection_layout.addWidget(self.connection_tabs)
         
         # Кнопки управления
         button_layout = QHBoxLayout()
         
-        self.scan_button = QPushButton(QIcon("assets/icons/scan.png"), "Сканировать устройства")
+        self.scan_button = QPushButton(QIcon(f"{ICONS_DIR}/scan.png"), "Сканировать устройства")
         self.scan_button.setFont(QFont("Segoe UI", 10))
         self.scan_button.setMinimumHeight(35)
         self.scan_button.setStyleSheet("""
@@ -574,7 +575,7 @@ class ConnectionPanel(QWidget):
             }
         """)
         
-        self.connect_button = QPushButton(QIcon("assets/icons/connect.png"), "Подключиться")
+        self.connect_button = QPushButton(QIcon(f"{ICONS_DIR}/connect.png"), "Подключиться")
         self.connect_button.setFont(QFont("Segoe UI", 10, QFont.Bold))
         self.connect_button.setMinimumHeight(35)
         self.connect_button.setEnabled(False)
@@ -593,7 +594,7 @@ class ConnectionPanel(QWidget):
             }
         """)
         
-        self.disconnect_button = QPushButton(QIcon("assets/icons/disconnect.png"), "Отключиться")
+        self.disconnect_button = QPushButton(QIcon(f"{ICONS_DIR}/disconnect.png"), "Отключиться")
         self.disconnect_button.setFont(QFont("Segoe UI", 10))
         self.disconnect_button.setMinimumHeight(35)
         self.disconnect_button.setEnabled(False)
@@ -612,7 +613,7 @@ class ConnectionPanel(QWidget):
             }
         """)
         
-        self.settings_button = QPushButton(QIcon("assets/icons/settings.png"), "Настройки")
+        self.settings_button = QPushButton(QIcon(f"{ICONS_DIR}/settings.png"), "Настройки")
         self.settings_button.setFont(QFont("Segoe UI", 10))
         self.settings_button.setMinimumHeight(35)
         self.settings_button.setStyleSheet("""
@@ -9,16 +9,246 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                              QHeaderView, QSplitter, QFrame, QCheckBox,
                              QSpinBox, QDoubleSpinBox, QLineEdit, QMessageBox,
                              QFileDialog, QInputDialog, QListWidget, QListWidgetItem,
-                             QApplication, QStyleFactory)
-from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QDateTime, QSize, 
+                             QPlainTextEdit, QTableView, QAbstractItemView,
+                             QStyleFactory, QApplication)
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QDateTime, QSize, QAbstractTableModel,
                          QPropertyAnimation, QEasingCurve, QThread, pyqtSlot)
 from PyQt5.QtGui import (QFont, QIcon, QPalette, QColor, QBrush, QPen,
-                        QPainter, QLinearGradient, QFontMetrics)
+                        QPainter, QLinearGradient, QFontMetrics,
+                        QTextCharFormat, QTextCursor)
 import time
 import json
+import csv
+import copy
+import queue
+import random
 from datetime import datetime
 import os
 
+from ui.icons import ICONS_DIR
+
+# Цвета статусов в таблице основных показателей
+STATUS_BRUSHES = {
+    "Норма": QBrush(QColor("#4CAF50")),
+    "Предупреждение": QBrush(QColor("#FF9800")),
+    "Ошибка": QBrush(QColor("#FF5252")),
+}
+
+# Цвет и префикс сообщений лога по уровню
+LOG_LEVELS = {
+    "ERROR": ("#FF5252", "ERROR"),
+    "WARNING": ("#FF9800", "WARN"),
+    "SUCCESS": ("#4CAF50", "OK"),
+    "INFO": ("#2196F3", "INFO"),
+}
+
+# Имитация ответов адаптера на пользовательские команды
+SIMULATED_RESPONSES = (
+    "OK",
+    "41 00 BE 3F A8 13",
+    "NO DATA",
+    "SEARCHING...",
+    "UNABLE TO CONNECT"
+)
+
+# Команда чтения VIN (режим 09, PID 02)
+VIN_COMMAND = "0902"
+
+# Иконка и цвет статуса системы в дереве систем
+SYSTEM_STATUS_STYLES = {
+    "success": ("success", QBrush(QColor("#4CAF50"))),
+    "error": ("error", QBrush(QColor("#FF5252"))),
+    "working": ("working", QBrush(QColor("#2196F3"))),
+    "idle": ("system", QBrush(QColor("#666666"))),
+}
+
+class DiagnosticThread(QThread):
+    """Поток имитации диагностики (для демонстрации)"""
+    
+    progress = pyqtSignal(int)
+    system_started = pyqtSignal(str)
+    system_done = pyqtSignal(str, str, str)
+    
+    # Системы и условная длительность их проверки (в шагах по 50 мс)
+    SYSTEMS = [
+        ("Двигатель (ECU)", 40),
+        ("Антиблокировочная система (ABS)", 20),
+        ("Подушки безопасности", 15),
+        ("Иммобилайзер", 10),
+        ("Приборная панель", 10),
+        ("Климат-контроль", 5)
+    ]
+    
+    def __init__(self):
+        super().__init__()
+        self._running = True
+        self._system_index = 0
+        self._step = 0
+        self._done_steps = 0
+        self._total_steps = sum(s[1] for s in self.SYSTEMS)
+        
+    def run(self):
+        """Основной метод потока"""
+        # В реальном приложении здесь будет обмен с ЭБУ через движок диагностики.
+        # Шаги имитации выполняются по таймеру в цикле событий потока,
+        # поэтому остановка не ждет окончания sleep.
+        timer = QTimer()
+        timer.timeout.connect(self._tick, Qt.DirectConnection)
+        timer.start(50)
+        self.exec_()
+        timer.stop()
+        
+    def _tick(self):
+        """Один шаг имитации диагностики"""
+        if not self._running or self._system_index >= len(self.SYSTEMS):
+            self.quit()
+            return
+            
+        system_name, system_time = self.SYSTEMS[self._system_index]
+        if self._step == 0:
+            self.system_started.emit(system_name)
+            
+        self._step += 1
+        self._done_steps += 1
+        self.progress.emit(self._done_steps * 100 // self._total_steps)
+        
+        if self._step >= system_time:
+            self.system_done.emit(system_name, "0", f"{system_time}с")
+            self._system_index += 1
+            self._step = 0
+            
+    def stop(self):
+        """Остановка потока"""
+        self._running = False
+        self.quit()
+
+
+class ExportThread(QThread):
+    """Поток экспорта данных диагностики"""
+    
+    export_finished = pyqtSignal(str)
+    export_failed = pyqtSignal(str)
+    
+    def __init__(self, filename, format_type, data, headers=None, rows=None, indent=2):
+        super().__init__()
+        self.filename = filename
+        self.format_type = format_type
+        self.data = data
+        self.headers = headers
+        self.rows = rows
+        self.indent = indent
+        
+    def run(self):
+        """Запись файла экспорта"""
+        try:
+            if self.format_type == 'json':
+                # Запись по частям по мере кодирования, без построения всей строки
+                if self.indent is None:
+                    encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+                else:
+                    encoder = json.JSONEncoder(ensure_ascii=False, indent=self.indent)
+                with open(self.filename, 'w', encoding='utf-8') as f:
+                    for chunk in encoder.iterencode(self.data):
+                        f.write(chunk)
+            elif self.format_type == 'csv':
+                with open(self.filename, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f, delimiter=';')
+                    writer.writerow(self.headers)
+                    writer.writerows(self.rows)
+            elif self.format_type == 'excel':
+                import pandas as pd
+                pd.DataFrame(self.rows, columns=self.headers).to_excel(self.filename, index=False)
+            else:
+                raise ValueError(f"Неизвестный формат экспорта: {self.format_type}")
+                
+            self.export_finished.emit(self.filename)
+            
+        except ImportError:
+            self.export_failed.emit("Для экспорта в Excel установите библиотеки pandas и openpyxl")
+        except Exception as e:
+            self.export_failed.emit(str(e))
+
+
+class CommandThread(QThread):
+    """Поток обмена командами с адаптером"""
+    
+    response_received = pyqtSignal(str, str)
+    
+    def __init__(self):
+        super().__init__()
+        self._commands = queue.Queue()
+        
+    def send(self, command):
+        """Постановка команды в очередь на отправку"""
+        self._commands.put(command)
+        
+    def run(self):
+        """Последовательная отправка команд из очереди"""
+        while True:
+            command = self._commands.get()
+            if command is None:
+                break
+                
+            # В реальном приложении: отправка команды через ELM327
+            # response = diagnostics_engine.send_command(command)
+            
+            # Имитация ответа
+            if command == VIN_COMMAND:
+                response = "X9L212300N1234567"
+            else:
+                response = random.choice(SIMULATED_RESPONSES)
+                
+            self.response_received.emit(command, response)
+            
+    def stop(self):
+        """Остановка потока после уже поставленных команд"""
+        self._commands.put(None)
+
+
+class SummaryTableModel(QAbstractTableModel):
+    """Модель таблицы основных показателей"""
+    
+    HEADERS = ["Параметр", "Значение", "Единицы", "Статус"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._value_font = QFont("Segoe UI", 9, QFont.Bold)
+        
+    def set_rows(self, rows):
+        """Замена всех строк таблицы одним сбросом модели"""
+        self.beginResetModel()
+        self._rows = [tuple(row) for row in rows]
+        self.endResetModel()
+        
+    def rowCount(self, parent=None):
+        return len(self._rows)
+        
+    def columnCount(self, parent=None):
+        return len(self.HEADERS)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.ForegroundRole and index.column() == 3:
+            # Цветовое кодирование статуса
+            return STATUS_BRUSHES.get(self._rows[index.row()][3])
+        if role == Qt.FontRole and index.column() == 1:
+            # Выделение значений жирным
+            return self._value_font
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class DiagnosticPanel(QWidget):
     """Панель для выполнения диагностики"""
     
@@ -33,10 +263,24 @@ class DiagnosticPanel(QWidget):
         self.diagnostics_engine = None
         self.current_results = {}
         self.diagnostic_in_progress = False
+        self.diagnostic_thread = None
+        self.export_thread = None
+        self.save_thread = None
+        self.command_thread = None
+        
+        # Иконки статусов загружаются один раз на панель
+        self._icons = {name: QIcon(f"{ICONS_DIR}/{name}.png")
+                       for name in ("success", "error", "warning", "working", "system", "waiting")}
+        self._pixmaps = {name: icon.pixmap(32, 32) for name, icon in self._icons.items()}
+        
         self.setup_ui()
         self.setup_connections()
         self.setup_styles()
         
+        # Страница вкладки не получает closeEvent при выходе из приложения -
+        # потоки останавливаются по сигналу приложения
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
+        
     def setup_ui(self):
         """Настройка пользовательского интерфейса"""
         main_layout = QVBoxLayout(self)
@@ -100,13 +344,13 @@ class DiagnosticPanel(QWidget):
         
         # Кнопка сканирования VIN
         self.scan_vin_btn = QPushButton("Сканировать")
-        self.scan_vin_btn.setIcon(QIcon("assets/icons/scan.png"))
+        self.scan_vin_btn.setIcon(QIcon(f"{ICONS_DIR}/scan.png"))
         self.scan_vin_btn.setToolTip("Автоматическое сканирование VIN")
         self.scan_vin_btn.setMaximumWidth(120)
         
         # Кнопки управления
         self.full_diagnostic_btn = QPushButton("Полная диагностика")
-        self.full_diagnostic_btn.setIcon(QIcon("assets/icons/full_scan.png"))
+        self.full_diagnostic_btn.setIcon(QIcon(f"{ICONS_DIR}/full_scan.png"))
         self.full_diagnostic_btn.setFont(QFont("Segoe UI", 10, QFont.Bold))
         self.full_diagnostic_btn.setMinimumHeight(40)
         self.full_diagnostic_btn.setStyleSheet("""
@@ -125,23 +369,23 @@ class DiagnosticPanel(QWidget):
         """)
         
         self.quick_diagnostic_btn = QPushButton("Быстрая проверка")
-        self.quick_diagnostic_btn.setIcon(QIcon("assets/icons/quick_scan.png"))
+        self.quick_diagnostic_btn.setIcon(QIcon(f"{ICONS_DIR}/quick_scan.png"))
         self.quick_diagnostic_btn.setFont(QFont("Segoe UI", 10))
         self.quick_diagnostic_btn.setMinimumHeight(35)
         
         self.stop_diagnostic_btn = QPushButton("Остановить")
-        self.stop_diagnostic_btn.setIcon(QIcon("assets/icons/stop.png"))
+        self.stop_diagnostic_btn.setIcon(QIcon(f"{ICONS_DIR}/stop.png"))
         self.stop_diagnostic_btn.setFont(QFont("Segoe UI", 10))
         self.stop_diagnostic_btn.setMinimumHeight(35)
         self.stop_diagnostic_btn.setEnabled(False)
         
         self.save_results_btn = QPushButton("Сохранить результаты")
-        self.save_results_btn.setIcon(QIcon("assets/icons/save.png"))
+        self.save_results_btn.setIcon(QIcon(f"{ICONS_DIR}/save.png"))
         self.save_results_btn.setFont(QFont("Segoe UI", 10))
         self.save_results_btn.setMinimumHeight(35)
         
         # Чекбоксы выбора систем
-        systems_group = QGroupBox("Выбор систем")
+        self.systems_group = QGroupBox("Выбор систем")
         systems_layout = QGridLayout()
         
         self.engine_check = QCheckBox("Двигатель (ECU)")
@@ -160,7 +404,7 @@ class DiagnosticPanel(QWidget):
         systems_layout.addWidget(self.immo_check, 1, 0)
         systems_layout.addWidget(self.instrument_check, 1, 1)
         systems_layout.addWidget(self.ac_check, 1, 2)
-        systems_group.setLayout(systems_layout)
+        self.systems_group.setLayout(systems_layout)
         
         # Расположение элементов
         control_layout.addWidget(model_label, 0, 0)
@@ -174,7 +418,7 @@ class DiagnosticPanel(QWidget):
         control_layout.addWidget(self.stop_diagnostic_btn, 1, 4, 1, 2)
         control_layout.addWidget(self.save_results_btn, 2, 0, 1, 3)
         
-        control_layout.addWidget(systems_group, 3, 0, 1, 6)
+        control_layout.addWidget(self.systems_group, 3, 0, 1, 6)
         
         self.control_panel.setLayout(control_layout)
         
@@ -218,7 +462,7 @@ class DiagnosticPanel(QWidget):
         self.overall_status.setStyleSheet("color: #666666;")
         
         self.overall_icon = QLabel()
-        self.overall_icon.setPixmap(QIcon("assets/icons/waiting.png").pixmap(32, 32))
+        self.overall_icon.setPixmap(self._pixmaps["waiting"])
         
         self.diagnostic_time = QLabel("Время: --:--")
         self.diagnostic_time.setFont(QFont("Segoe UI", 10))
@@ -243,20 +487,18 @@ class DiagnosticPanel(QWidget):
         layout.addWidget(status_frame)
         
         # Таблица с основными показателями
-        self.summary_table = QTableWidget()
-        self.summary_table.setColumnCount(4)
-        self.summary_table.setHorizontalHeaderLabels([
-            "Параметр", "Значение", "Единицы", "Статус"
-        ])
+        self.summary_model = SummaryTableModel(self)
+        self.summary_table = QTableView()
+        self.summary_table.setModel(self.summary_model)
         self.summary_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.summary_table.setFont(QFont("Segoe UI", 9))
         self.summary_table.setAlternatingRowColors(True)
-        self.summary_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.summary_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
         layout.addWidget(self.summary_table)
         
         summary_widget.setLayout(layout)
-        self.results_tabs.addTab(summary_widget, QIcon("assets/icons/summary.png"), "Общая информация")
+        self.results_tabs.addTab(summary_widget, QIcon(f"{ICONS_DIR}/summary.png"), "Общая информация")
         
     def create_systems_tab(self):
         """Создание вкладки с системами"""
@@ -270,35 +512,24 @@ class DiagnosticPanel(QWidget):
         self.systems_tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
         self.systems_tree.setColumnWidth(0, 250)
         
-        # Предварительное заполнение дерева
-        systems = [
-            ("Двигатель (ECU)", "Ожидание", "0", "--:--"),
-            ("Антиблокировочная система (ABS)", "Ожидание", "0", "--:--"),
-            ("Подушки безопасности", "Ожидание", "0", "--:--"),
-            ("Иммобилайзер", "Ожидание", "0", "--:--"),
-            ("Приборная панель", "Ожидание", "0", "--:--"),
-            ("Климат-контроль", "Ожидание", "0", "--:--")
-        ]
+        # Дерево заполняется при первом показе панели (_populate_systems_tree)
+        self._sys_items = {}
         
-        for system in systems:
-            item = QTreeWidgetItem(self.systems_tree, system)
-            item.setIcon(0, QIcon("assets/icons/system.png"))
-            
         layout.addWidget(self.systems_tree)
         
         # Кнопки управления системами
         buttons_layout = QHBoxLayout()
         
         self.refresh_system_btn = QPushButton("Обновить систему")
-        self.refresh_system_btn.setIcon(QIcon("assets/icons/refresh.png"))
+        self.refresh_system_btn.setIcon(QIcon(f"{ICONS_DIR}/refresh.png"))
         self.refresh_system_btn.setEnabled(False)
         
         self.detail_system_btn = QPushButton("Детальная диагностика")
-        self.detail_system_btn.setIcon(QIcon("assets/icons/detail.png"))
+        self.detail_system_btn.setIcon(QIcon(f"{ICONS_DIR}/detail.png"))
         self.detail_system_btn.setEnabled(False)
         
         self.test_system_btn = QPushButton("Тест системы")
-        self.test_system_btn.setIcon(QIcon("assets/icons/test.png"))
+        self.test_system_btn.setIcon(QIcon(f"{ICONS_DIR}/test.png"))
         self.test_system_btn.setEnabled(False)
         
         buttons_layout.addWidget(self.refresh_system_btn)
@@ -309,7 +540,7 @@ class DiagnosticPanel(QWidget):
         layout.addLayout(buttons_layout)
         
         systems_widget.setLayout(layout)
-        self.results_tabs.addTab(systems_widget, QIcon("assets/icons/systems.png"), "Системы")
+        self.results_tabs.addTab(systems_widget, QIcon(f"{ICONS_DIR}/systems.png"), "Системы")
         
     def create_graphs_tab(self):
         """Создание вкладки с графиками"""
@@ -323,29 +554,22 @@ class DiagnosticPanel(QWidget):
         graph_param_label = QLabel("Параметр для графика:")
         graph_param_label.setFont(QFont("Segoe UI", 10))
         
+        # Список параметров заполняется при первом показе панели (_populate_graph_params)
         self.graph_param_combo = QComboBox()
-        self.graph_param_combo.addItems([
-            "Обороты двигателя (RPM)",
-            "Скорость автомобиля",
-            "Температура охлаждающей жидкости",
-            "Положение дроссельной заслонки",
-            "Напряжение бортовой сети",
-            "Расход воздуха"
-        ])
         self.graph_param_combo.setMinimumWidth(250)
         
         self.graph_type_combo = QComboBox()
         self.graph_type_combo.addItems(["Линейный график", "Столбчатая диаграмма", "Круговая диаграмма"])
         
         self.start_graph_btn = QPushButton("Начать запись")
-        self.start_graph_btn.setIcon(QIcon("assets/icons/record.png"))
+        self.start_graph_btn.setIcon(QIcon(f"{ICONS_DIR}/record.png"))
         
         self.stop_graph_btn = QPushButton("Остановить запись")
-        self.stop_graph_btn.setIcon(QIcon("assets/icons/stop_record.png"))
+        self.stop_graph_btn.setIcon(QIcon(f"{ICONS_DIR}/stop_record.png"))
         self.stop_graph_btn.setEnabled(False)
         
         self.clear_graph_btn = QPushButton("Очистить график")
-        self.clear_graph_btn.setIcon(QIcon("assets/icons/clear.png"))
+        self.clear_graph_btn.setIcon(QIcon(f"{ICONS_DIR}/clear.png"))
         
         graph_controls_layout.addWidget(graph_param_label)
         graph_controls_layout.addWidget(self.graph_param_combo)
@@ -392,7 +616,7 @@ class DiagnosticPanel(QWidget):
         layout.addWidget(graph_stats)
         
         graphs_widget.setLayout(layout)
-        self.results_tabs.addTab(graphs_widget, QIcon("assets/icons/graph.png"), "Графики")
+        self.results_tabs.addTab(graphs_widget, QIcon(f"{ICONS_DIR}/graph.png"), "Графики")
         
     def create_statistics_tab(self):
         """Создание вкладки со статистикой"""
@@ -432,13 +656,13 @@ class DiagnosticPanel(QWidget):
         export_layout = QHBoxLayout()
         
         self.export_csv_btn = QPushButton("Экспорт в CSV")
-        self.export_csv_btn.setIcon(QIcon("assets/icons/csv.png"))
+        self.export_csv_btn.setIcon(QIcon(f"{ICONS_DIR}/csv.png"))
         
         self.export_excel_btn = QPushButton("Экспорт в Excel")
-        self.export_excel_btn.setIcon(QIcon("assets/icons/excel.png"))
+        self.export_excel_btn.setIcon(QIcon(f"{ICONS_DIR}/excel.png"))
         
         self.export_json_btn = QPushButton("Экспорт в JSON")
-        self.export_json_btn.setIcon(QIcon("assets/icons/json.png"))
+        self.export_json_btn.setIcon(QIcon(f"{ICONS_DIR}/json.png"))
         
         export_layout.addWidget(self.export_csv_btn)
         export_layout.addWidget(self.export_excel_btn)
@@ -448,7 +672,7 @@ class DiagnosticPanel(QWidget):
         layout.addLayout(export_layout)
         
         stats_widget.setLayout(layout)
-        self.results_tabs.addTab(stats_widget, QIcon("assets/icons/stats.png"), "Статистика")
+        self.results_tabs.addTab(stats_widget, QIcon(f"{ICONS_DIR}/stats.png"), "Статистика")
         
     def create_details_panel(self):
         """Создание панели деталей"""
@@ -462,28 +686,41 @@ class DiagnosticPanel(QWidget):
         log_widget = QWidget()
         log_layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setFont(QFont("Courier New", 9))
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #d4d4d4;
                 font-family: 'Consolas', 'Courier New', monospace;
             }
         """)
         
+        # Форматы частей строки лога и очередь сообщений на вывод
+        self._log_time_format = QTextCharFormat()
+        self._log_time_format.setForeground(QColor("#999999"))
+        self._log_text_format = QTextCharFormat()
+        self._log_text_format.setForeground(QColor("#ffffff"))
+        self._log_formats = {}
+        for level, (color, _) in LOG_LEVELS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            fmt.setFontWeight(QFont.Bold)
+            self._log_formats[level] = fmt
+        self._pending_log = []
+        
         # Кнопки управления логом
         log_buttons = QHBoxLayout()
         
         self.clear_log_btn = QPushButton("Очистить лог")
-        self.clear_log_btn.setIcon(QIcon("assets/icons/clear.png"))
+        self.clear_log_btn.setIcon(QIcon(f"{ICONS_DIR}/clear.png"))
         
         self.save_log_btn = QPushButton("Сохранить лог")
-        self.save_log_btn.setIcon(QIcon("assets/icons/save.png"))
+        self.save_log_btn.setIcon(QIcon(f"{ICONS_DIR}/save.png"))
         
         self.pause_log_btn = QPushButton("Пауза")
-        self.pause_log_btn.setIcon(QIcon("assets/icons/pause.png"))
+        self.pause_log_btn.setIcon(QIcon(f"{ICONS_DIR}/pause.png"))
         self.pause_log_btn.setCheckable(True)
         
         log_buttons.addWidget(self.clear_log_btn)
@@ -506,7 +743,7 @@ class DiagnosticPanel(QWidget):
         raw_buttons = QHBoxLayout()
         
         self.copy_raw_btn = QPushButton("Копировать")
-        self.copy_raw_btn.setIcon(QIcon("assets/icons/copy.png"))
+        self.copy_raw_btn.setIcon(QIcon(f"{ICONS_DIR}/copy.png"))
         
         self.hex_view_check = QCheckBox("HEX вид")
         self.hex_view_check.setChecked(False)
@@ -533,7 +770,7 @@ class DiagnosticPanel(QWidget):
         self.command_edit.setFont(QFont("Courier New", 10))
         
         self.send_command_btn = QPushButton("Отправить")
-        self.send_command_btn.setIcon(QIcon("assets/icons/send.png"))
+        self.send_command_btn.setIcon(QIcon(f"{ICONS_DIR}/send.png"))
         
         command_input_layout.addWidget(self.command_edit)
         command_input_layout.addWidget(self.send_command_btn)
@@ -543,9 +780,9 @@ class DiagnosticPanel(QWidget):
         commands_widget.setLayout(commands_layout)
         
         # Добавление вкладок
-        self.details_tabs.addTab(log_widget, QIcon("assets/icons/log.png"), "Лог")
-        self.details_tabs.addTab(raw_widget, QIcon("assets/icons/raw.png"), "Сырые данные")
-        self.details_tabs.addTab(commands_widget, QIcon("assets/icons/command.png"), "Команды")
+        self.details_tabs.addTab(log_widget, QIcon(f"{ICONS_DIR}/log.png"), "Лог")
+        self.details_tabs.addTab(raw_widget, QIcon(f"{ICONS_DIR}/raw.png"), "Сырые данные")
+        self.details_tabs.addTab(commands_widget, QIcon(f"{ICONS_DIR}/command.png"), "Команды")
         
         details_layout.addWidget(self.details_tabs)
         self.details_panel.setLayout(details_layout)
@@ -629,10 +866,15 @@ class DiagnosticPanel(QWidget):
         self.command_edit.returnPressed.connect(self.send_custom_command)
         
         # Таймер обновления времени
+        # Показания выводятся с точностью до секунды, чаще обновлять нет смысла
         self.timer = QTimer()
+        self.timer.setInterval(1000)
         self.timer.timeout.connect(self.update_timer)
         self.elapsed_timer = QTimer()
+        self.elapsed_timer.setInterval(1000)
         self.elapsed_timer.timeout.connect(self.update_elapsed_time)
+        self._last_time_str = None
+        self._last_elapsed_seconds = None
         
         # Выбор системы в дереве
         self.systems_tree.itemClicked.connect(self.on_system_selected)
@@ -660,7 +902,7 @@ class DiagnosticPanel(QWidget):
                 border: 1px solid #cccccc;
                 border-radius: 3px;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #cccccc;
                 border-radius: 3px;
                 selection-background-color: #e0e0e0;
@@ -710,9 +952,10 @@ class DiagnosticPanel(QWidget):
         
         # Запускаем таймеры
         self.start_time = datetime.now()
+        self._last_elapsed_seconds = None
         self.start_time_label.setText(f"Начало: {self.start_time.strftime('%H:%M:%S')}")
-        self.timer.start(1000)  # Обновление каждую секунду
-        self.elapsed_timer.start(1000)
+        self.timer.start()
+        self.elapsed_timer.start()
         
         # Запускаем диагностику в отдельном потоке
         self.diagnostic_started.emit()
@@ -727,43 +970,30 @@ class DiagnosticPanel(QWidget):
         
     def simulate_diagnostic(self):
         """Имитация процесса диагностики (для демонстрации)"""
-        # В реальном приложении это будет выполняться в отдельном потоке
-        
-        systems = [
-            ("Двигатель (ECU)", 40),
-            ("Антиблокировочная система (ABS)", 20),
-            ("Подушки безопасности", 15),
-            ("Иммобилайзер", 10),
-            ("Приборная панель", 10),
-            ("Климат-контроль", 5)
-        ]
-        
-        total_progress = 0
-        for system_name, system_time in systems:
-            if not self.diagnostic_in_progress:
-                break
-                
-            # Обновляем текущее действие
-            self.current_action.setText(f"Диагностика {system_name}...")
-            self.log_message(f"Начата диагностика {system_name}", "INFO")
+        if self.diagnostic_thread and self.diagnostic_thread.isRunning():
+            self.diagnostic_thread.stop()
+            self.diagnostic_thread.wait()
             
-            # Имитация работы
-            for i in range(system_time):
-                if not self.diagnostic_in_progress:
-                    break
-                    
-                progress = total_progress + (i + 1) * (100 // sum(s[1] for s in systems))
-                self.progress_bar.setValue(min(progress, 100))
-                QApplication.processEvents()
-                time.sleep(0.05)
-                
-            total_progress += system_time * (100 // sum(s[1] for s in systems))
-            
-            # Обновляем статус системы
-            self.update_system_status(system_name, "Завершено", "0", f"{system_time}с")
-            self.log_message(f"Диагностика {system_name} завершена", "SUCCESS")
-            
-        if self.diagnostic_in_progress:
+        self.diagnostic_thread = DiagnosticThread()
+        self.diagnostic_thread.progress.connect(self.progress_bar.setValue)
+        self.diagnostic_thread.system_started.connect(self.on_system_started)
+        self.diagnostic_thread.system_done.connect(self.on_system_done)
+        self.diagnostic_thread.finished.connect(self.on_diagnostic_thread_finished)
+        self.diagnostic_thread.start()
+        
+    def on_system_started(self, system_name):
+        """Начало диагностики системы"""
+        self.current_action.setText(f"Диагностика {system_name}...")
+        self.log_message(f"Начата диагностика {system_name}", "INFO")
+        
+    def on_system_done(self, system_name, errors, duration):
+        """Завершение диагностики системы"""
+        self.update_system_status(system_name, "Завершено", errors, duration)
+        self.log_message(f"Диагностика {system_name} завершена", "SUCCESS")
+        
+    def on_diagnostic_thread_finished(self):
+        """Завершение потока диагностики"""
+        if self.sender() is self.diagnostic_thread and self.diagnostic_in_progress:
             self.finish_diagnostic()
             
     def finish_diagnostic(self):
@@ -779,7 +1009,7 @@ class DiagnosticPanel(QWidget):
         # Обновляем общий статус
         self.overall_status.setText("Статус: Завершена успешно")
         self.overall_status.setStyleSheet("color: #4CAF50;")
-        self.overall_icon.setPixmap(QIcon("assets/icons/success.png").pixmap(32, 32))
+        self.overall_icon.setPixmap(self._pixmaps["success"])
         
         # Обновляем статистику
         self.errors_count.setText("Ошибок: 2")
@@ -796,12 +1026,14 @@ class DiagnosticPanel(QWidget):
         """Остановка диагностики"""
         if self.diagnostic_in_progress:
             self.diagnostic_in_progress = False
+            if self.diagnostic_thread:
+                self.diagnostic_thread.stop()
             self.timer.stop()
             self.elapsed_timer.stop()
             
             self.overall_status.setText("Статус: Прервана пользователем")
             self.overall_status.setStyleSheet("color: #FF9800;")
-            self.overall_icon.setPixmap(QIcon("assets/icons/warning.png").pixmap(32, 32))
+            self.overall_icon.setPixmap(self._pixmaps["warning"])
             
             self.current_action.setText("Диагностика прервана")
             self.log_message("Диагностика прервана пользователем", "WARNING")
@@ -814,67 +1046,116 @@ class DiagnosticPanel(QWidget):
         
     def save_results(self):
         """Сохранение результатов диагностики"""
-        filename, _ = QFileDialog.getSaveFileName(
+        filename, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Сохранить результаты диагностики",
             f"diagnostic_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "JSON files (*.json);;Text files (*.txt);;All files (*.*)"
+            "JSON files (*.json);;JSON files, formatted (*.json);;Text files (*.txt);;All files (*.*)"
         )
         
         if filename:
-            try:
-                results = {
-                    'timestamp': datetime.now().isoformat(),
-                    'vehicle_model': self.model_combo.currentText(),
-                    'vin': self.vin_edit.text(),
-                    'diagnostic_results': self.current_results
-                }
-                
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, ensure_ascii=False, indent=2)
-                    
-                self.log_message(f"Результаты сохранены в {filename}", "SUCCESS")
+            if self.save_thread and self.save_thread.isRunning():
+                self.log_message("Сохранение результатов уже выполняется", "WARNING")
+                return
                 
-            except Exception as e:
-                self.log_message(f"Ошибка при сохранении: {str(e)}", "ERROR")
+            results = {
+                'timestamp': datetime.now().isoformat(),
+                'vehicle_model': self.model_combo.currentText(),
+                'vin': self.vin_edit.text(),
+                'diagnostic_results': copy.deepcopy(self.current_results)
+            }
+            
+            # Отступы нужны только для чтения человеком, по умолчанию JSON компактный
+            pretty = "formatted" in selected_filter or "Text" in selected_filter
+            
+            self.save_thread = ExportThread(filename, 'json', results, indent=2 if pretty else None)
+            self.save_thread.export_finished.connect(
+                lambda name: self.log_message(f"Результаты сохранены в {name}", "SUCCESS"))
+            self.save_thread.export_failed.connect(
+                lambda error: self.log_message(f"Ошибка при сохранении: {error}", "ERROR"))
+            self.save_thread.start()
                 
     def scan_vin(self):
         """Сканирование VIN кода"""
         self.log_message("Сканирование VIN кода...", "INFO")
-        # В реальном приложении: отправка команды для чтения VIN
-        # Пока имитируем
-        simulated_vin = "X9L212300N1234567"
-        self.vin_edit.setText(simulated_vin)
-        self.log_message(f"VIN найден: {simulated_vin}", "SUCCESS")
+        self.send_command(VIN_COMMAND)
+        
+    def send_command(self, command):
+        """Отправка команды адаптеру в потоке обмена"""
+        if not self.command_thread:
+            self.command_thread = CommandThread()
+            self.command_thread.response_received.connect(self.on_command_response)
+            self.command_thread.start()
+        self.command_thread.send(command)
+        
+    def on_command_response(self, command, response):
+        """Обработка ответа адаптера"""
+        if command == VIN_COMMAND:
+            self.vin_edit.setText(response)
+            self.log_message(f"VIN найден: {response}", "SUCCESS")
+            return
+            
+        # Добавляем ответ
+        response_item = QListWidgetItem(f"< {response}")
+        response_item.setForeground(QBrush(QColor("#4CAF50")))
+        self.commands_list.addItem(response_item)
+        
+        # Прокрутка к последнему элементу
+        self.commands_list.scrollToBottom()
+        
+        # Добавление в лог
+        self.log_message(f"Команда отправлена: {command} -> {response}", "INFO")
+        
+        # Добавление в сырые данные
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        block = f"[{timestamp}] > {command}\n[{timestamp}] < {response}\n"
+        if not self.raw_data_text.document().isEmpty():
+            block = "\n" + block
+        cursor = self.raw_data_text.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(block)
+        self.raw_data_text.setTextCursor(cursor)
         
     def log_message(self, message, level="INFO"):
         """Добавление сообщения в лог"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        
-        if level == "ERROR":
-            color = "#FF5252"
-            prefix = "ERROR"
-        elif level == "WARNING":
-            color = "#FF9800"
-            prefix = "WARN"
-        elif level == "SUCCESS":
-            color = "#4CAF50"
-            prefix = "OK"
-        else:
-            color = "#2196F3"
-            prefix = "INFO"
+        now = time.time()
+        timestamp = f"{time.strftime('%H:%M:%S', time.localtime(now))}.{int(now * 1000) % 1000:03d}"
+        
+        if level not in LOG_LEVELS:
+            level = "INFO"
             
         if not self.pause_log_btn.isChecked():
-            self.log_text.append(f'<font color="#999999">[{timestamp}]</font> '
-                               f'<font color="{color}"><b>[{prefix}]</b></font> '
-                               f'<font color="#ffffff">{message}</font>')
-            # Автопрокрутка вниз
-            self.log_text.verticalScrollBar().setValue(
-                self.log_text.verticalScrollBar().maximum()
-            )
+            # Сообщения выводятся пакетом, чтобы не перерисовывать лог на каждое сообщение
+            if not self._pending_log:
+                QTimer.singleShot(50, self._flush_log)
+            self._pending_log.append((timestamp, level, message))
             
+    def _flush_log(self):
+        """Вывод накопленных сообщений в лог"""
+        if not self._pending_log:
+            return
+            
+        document = self.log_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for timestamp, level, message in self._pending_log:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(f"[{timestamp}] ", self._log_time_format)
+            cursor.insertText(f"[{LOG_LEVELS[level][1]}]", self._log_formats[level])
+            cursor.insertText(f" {message}", self._log_text_format)
+        cursor.endEditBlock()
+        self._pending_log.clear()
+        
+        # Автопрокрутка вниз
+        self.log_text.verticalScrollBar().setValue(
+            self.log_text.verticalScrollBar().maximum()
+        )
+        
     def clear_log(self):
         """Очистка лога"""
+        self._pending_log.clear()
         self.log_text.clear()
         self.log_message("Лог очищен", "INFO")
         
@@ -889,8 +1170,15 @@ class DiagnosticPanel(QWidget):
         
         if filename:
             try:
+                self._flush_log()
+                
+                # Запись по строкам документа без построения всего текста в памяти
                 with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.log_text.toPlainText())
+                    block = self.log_text.document().firstBlock()
+                    while block.isValid():
+                        f.write(block.text())
+                        f.write("\n")
+                        block = block.next()
                 self.log_message(f"Лог сохранен в {filename}", "SUCCESS")
             except Exception as e:
                 self.log_message(f"Ошибка при сохранении лога: {str(e)}", "ERROR")
@@ -898,38 +1186,45 @@ class DiagnosticPanel(QWidget):
     def update_timer(self):
         """Обновление таймера"""
         current_time = datetime.now().strftime("%H:%M:%S")
+        if current_time == self._last_time_str:
+            return
+        self._last_time_str = current_time
         self.timer_label.setText(f"Текущее: {current_time}")
         
     def update_elapsed_time(self):
         """Обновление прошедшего времени"""
         if hasattr(self, 'start_time'):
-            elapsed = datetime.now() - self.start_time
-            hours, remainder = divmod(elapsed.seconds, 3600)
+            elapsed_seconds = int((datetime.now() - self.start_time).total_seconds())
+            if elapsed_seconds == self._last_elapsed_seconds:
+                return
+            self._last_elapsed_seconds = elapsed_seconds
+            hours, remainder = divmod(elapsed_seconds, 3600)
             minutes, seconds = divmod(remainder, 60)
             self.elapsed_time_label.setText(f"Прошло: {hours:02d}:{minutes:02d}:{seconds:02d}")
             
     def update_system_status(self, system_name, status, errors, duration):
         """Обновление статуса системы в дереве"""
-        for i in range(self.systems_tree.topLevelItemCount()):
-            item = self.systems_tree.topLevelItem(i)
-            if system_name in item.text(0):
-                item.setText(1, status)
-                item.setText(2, errors)
-                item.setText(3, duration)
-                
-                # Обновляем иконку в зависимости от статуса
-                if status == "Завершено":
-                    if errors == "0":
-                        item.setIcon(0, QIcon("assets/icons/success.png"))
-                        item.setForeground(1, QBrush(QColor("#4CAF50")))
-                    else:
-                        item.setIcon(0, QIcon("assets/icons/error.png"))
-                        item.setForeground(1, QBrush(QColor("#FF5252")))
-                elif status == "Выполняется":
-                    item.setIcon(0, QIcon("assets/icons/working.png"))
-                    item.setForeground(1, QBrush(QColor("#2196F3")))
-                    
-                break
+        item = self._sys_items.get(system_name)
+        if item is None:
+            item = next((v for k, v in self._sys_items.items() if system_name in k), None)
+        if item is None:
+            return
+            
+        item.setText(1, status)
+        item.setText(2, errors)
+        item.setText(3, duration)
+        
+        # Обновляем иконку в зависимости от статуса
+        if status == "Завершено":
+            style = SYSTEM_STATUS_STYLES["success" if errors == "0" else "error"]
+        elif status == "Выполняется":
+            style = SYSTEM_STATUS_STYLES["working"]
+        else:
+            return
+            
+        icon_name, brush = style
+        item.setIcon(0, self._icons[icon_name])
+        item.setForeground(1, brush)
                 
     def populate_summary_table(self):
         """Заполнение таблицы с основными показателями"""
@@ -951,28 +1246,8 @@ class DiagnosticPanel(QWidget):
             ["Остаточный ресурс масла", "8500", "км", "Норма"],
         ]
         
-        self.summary_table.setRowCount(len(data))
+        self.summary_model.set_rows(data)
         
-        for row_idx, row_data in enumerate(data):
-            for col_idx, cell_data in enumerate(row_data):
-                item = QTableWidgetItem(cell_data)
-                item.setTextAlignment(Qt.AlignCenter)
-                
-                # Цветовое кодирование статуса
-                if col_idx == 3:  # Столбец статуса
-                    if cell_data == "Норма":
-                        item.setForeground(QBrush(QColor("#4CAF50")))
-                    elif cell_data == "Предупреждение":
-                        item.setForeground(QBrush(QColor("#FF9800")))
-                    elif cell_data == "Ошибка":
-                        item.setForeground(QBrush(QColor("#FF5252")))
-                        
-                # Выделение значений жирным
-                if col_idx == 1:
-                    item.setFont(QFont("Segoe UI", 9, QFont.Bold))
-                    
-                self.summary_table.setItem(row_idx, col_idx, item)
-                
     def update_controls_state(self):
         """Обновление состояния элементов управления"""
         is_connected = self.diagnostics_engine is not None
@@ -987,10 +1262,8 @@ class DiagnosticPanel(QWidget):
         self.vin_edit.setEnabled(not is_diagnosing)
         self.scan_vin_btn.setEnabled(not is_diagnosing)
         
-        # Блокировка чекбоксов во время диагностики
-        for check in [self.engine_check, self.abs_check, self.airbag_check,
-                     self.immo_check, self.instrument_check, self.ac_check]:
-            check.setEnabled(not is_diagnosing)
+        # Блокировка чекбоксов во время диагностики (наследуется от группы)
+        self.systems_group.setEnabled(not is_diagnosing)
             
     def reset_results(self):
         """Сброс результатов"""
@@ -1000,24 +1273,62 @@ class DiagnosticPanel(QWidget):
         # Сброс статуса
         self.overall_status.setText("Статус: Выполняется")
         self.overall_status.setStyleSheet("color: #2196F3;")
-        self.overall_icon.setPixmap(QIcon("assets/icons/working.png").pixmap(32, 32))
+        self.overall_icon.setPixmap(self._pixmaps["working"])
         
         self.errors_count.setText("Ошибок: 0")
         self.warnings_count.setText("Предупреждений: 0")
         self.systems_checked.setText("Проверено систем: 0/6")
         
         # Сброс таблицы
-        self.summary_table.setRowCount(0)
+        self.summary_model.set_rows([])
         
         # Сброс дерева систем
-        for i in range(self.systems_tree.topLevelItemCount()):
-            item = self.systems_tree.topLevelItem(i)
-            item.setText(1, "Ожидание")
-            item.setText(2, "0")
-            item.setText(3, "--:--")
-            item.setIcon(0, QIcon("assets/icons/system.png"))
-            item.setForeground(1, QBrush(QColor("#666666")))
+        self._populate_systems_tree()
+        icon_name, brush = SYSTEM_STATUS_STYLES["idle"]
+        self.systems_tree.setUpdatesEnabled(False)
+        try:
+            for item in self._sys_items.values():
+                item.setText(1, "Ожидание")
+                item.setText(2, "0")
+                item.setText(3, "--:--")
+                item.setIcon(0, self._icons[icon_name])
+                item.setForeground(1, brush)
+        finally:
+            self.systems_tree.setUpdatesEnabled(True)
+            
+    def _populate_systems_tree(self):
+        """Предварительное заполнение дерева систем"""
+        if self._sys_items:
+            return
+            
+        systems = [
+            ("Двигатель (ECU)", "Ожидание", "0", "--:--"),
+            ("Антиблокировочная система (ABS)", "Ожидание", "0", "--:--"),
+            ("Подушки безопасности", "Ожидание", "0", "--:--"),
+            ("Иммобилайзер", "Ожидание", "0", "--:--"),
+            ("Приборная панель", "Ожидание", "0", "--:--"),
+            ("Климат-контроль", "Ожидание", "0", "--:--")
+        ]
+        
+        for system in systems:
+            item = QTreeWidgetItem(self.systems_tree, system)
+            item.setIcon(0, self._icons["system"])
+            self._sys_items[system[0]] = item
+            
+    def _populate_graph_params(self):
+        """Заполнение списка параметров для графиков"""
+        if self.graph_param_combo.count():
+            return
             
+        self.graph_param_combo.addItems([
+            "Обороты двигателя (RPM)",
+            "Скорость автомобиля",
+            "Температура охлаждающей жидкости",
+            "Положение дроссельной заслонки",
+            "Напряжение бортовой сети",
+            "Расход воздуха"
+        ])
+        
     def on_system_selected(self, item, column):
         """Обработка выбора системы"""
         system_name = item.text(0)
@@ -1079,10 +1390,33 @@ class DiagnosticPanel(QWidget):
         )
         
         if filename:
+            if self.export_thread and self.export_thread.isRunning():
+                self.log_message("Экспорт уже выполняется", "WARNING")
+                return
+                
             self.log_message(f"Экспорт данных в {format_type.upper()} начат", "INFO")
-            # Здесь будет реализация экспорта
-            time.sleep(1)  # Имитация процесса
-            self.log_message(f"Данные экспортированы в {filename}", "SUCCESS")
+            
+            # Снимок данных делается в потоке интерфейса, запись файла - в отдельном потоке
+            headers = [self.stats_table.horizontalHeaderItem(col).text()
+                       for col in range(self.stats_table.columnCount())]
+            rows = []
+            for row in range(self.stats_table.rowCount()):
+                rows.append([self.stats_table.item(row, col).text() if self.stats_table.item(row, col) else ""
+                             for col in range(self.stats_table.columnCount())])
+            data = {
+                'timestamp': datetime.now().isoformat(),
+                'vehicle_model': self.model_combo.currentText(),
+                'vin': self.vin_edit.text(),
+                'statistics': [dict(zip(headers, row)) for row in rows],
+                'diagnostic_results': copy.deepcopy(self.current_results)
+            }
+            
+            self.export_thread = ExportThread(filename, format_type, data, headers, rows)
+            self.export_thread.export_finished.connect(
+                lambda name: self.log_message(f"Данные экспортированы в {name}", "SUCCESS"))
+            self.export_thread.export_failed.connect(
+                lambda error: self.log_message(f"Ошибка при экспорте: {error}", "ERROR"))
+            self.export_thread.start()
             
     def send_custom_command(self):
         """Отправка пользовательской команды"""
@@ -1094,40 +1428,13 @@ class DiagnosticPanel(QWidget):
         item = QListWidgetItem(f"> {command}")
         item.setForeground(QBrush(QColor("#2196F3")))
         self.commands_list.addItem(item)
-        
-        # В реальном приложении: отправка команды через ELM327
-        # response = self.diagnostics_engine.send_command(command)
-        
-        # Имитация ответа
-        simulated_responses = [
-            "OK",
-            "41 00 BE 3F A8 13",
-            "NO DATA",
-            "SEARCHING...",
-            "UNABLE TO CONNECT"
-        ]
-        
-        import random
-        response = random.choice(simulated_responses)
-        
-        # Добавляем ответ
-        response_item = QListWidgetItem(f"< {response}")
-        response_item.setForeground(QBrush(QColor("#4CAF50")))
-        self.commands_list.addItem(response_item)
-        
-        # Прокрутка к последнему элементу
         self.commands_list.scrollToBottom()
         
         # Очистка поля ввода
         self.command_edit.clear()
         
-        # Добавление в лог
-        self.log_message(f"Команда отправлена: {command} -> {response}", "INFO")
-        
-        # Добавление в сырые данные
-        self.raw_data_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] > {command}")
-        self.raw_data_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] < {response}")
-        self.raw_data_text.append("")
+        # Ответ обрабатывается в on_command_response
+        self.send_command(command)
         
     def set_diagnostics_engine(self, engine):
         """Установка движка диагностики"""
@@ -1139,10 +1446,31 @@ class DiagnosticPanel(QWidget):
         super().resizeEvent(event)
         # Можно добавить адаптацию интерфейса при изменении размера
         
+    def shutdown(self):
+        """Остановка фоновых потоков панели (повторный вызов безопасен)"""
+        if self.diagnostic_thread and self.diagnostic_thread.isRunning():
+            self.diagnostic_thread.stop()
+            self.diagnostic_thread.wait()
+            
+        if self.command_thread and self.command_thread.isRunning():
+            self.command_thread.stop()
+            self.command_thread.wait()
+            
+        for thread in (self.export_thread, self.save_thread):
+            if thread and thread.isRunning():
+                thread.wait()
+                
+    def closeEvent(self, event):
+        """Обработка закрытия панели"""
+        self.shutdown()
+        super().closeEvent(event)
+        
     def showEvent(self, event):
         """Обработка показа виджета"""
         super().showEvent(event)
         # Инициализация при первом показе
         if not hasattr(self, '_initialized'):
             self._initialized = True
+            self._populate_systems_tree()
+            self._populate_graph_params()
             self.log_message("Панель диагностики готова к работе", "INFO")
\ No newline at end of file
@@ -4,16 +4,608 @@
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QTableWidget, QTableWidgetItem,
-                             QHeaderView, QGroupBox, QTreeWidget, QTreeWidgetItem,
+                             QTableView, QAbstractItemView, QHeaderView, QGroupBox, QTreeWidget, QTreeWidgetItem,
                              QTextEdit, QComboBox, QCheckBox, QSpinBox,
                              QSplitter, QMessageBox, QProgressBar,
                              QTabWidget, QFrame, QToolBar, QAction, 
-                             QFileDialog, QMenu, QApplication, QStyle)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QDateTime
+                             QFileDialog, QMenu, QApplication, QStyle,
+                             QStyledItemDelegate)
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QDateTime, QThread, QTimeLine,
+                          QAbstractTableModel, QModelIndex)
 from PyQt5.QtGui import QFont, QIcon, QColor, QBrush
 import json
 import csv
-import os
+import copy
+import html
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict
+import numpy as np
+
+from ui.icons import TOOLBAR_ICON_SIZE, get_icon
+
+# orjson - необязательная зависимость, без нее используется стандартный json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Читаемые названия модулей, статусов и приоритетов
+_MODULE_NAMES = {
+    "ENGINE": "Двигатель (ECU)",
+    "ABS": "ABS",
+    "AIRBAG": "Подушки безопасности",
+    "IMMO": "Иммобилайзер",
+    "INSTRUMENT": "Приборная панель",
+    "AC": "Климат-контроль"
+}
+
+_STATUS_TEXTS = {
+    "ACTIVE": "Активная",
+    "PENDING": "Ожидающая",
+    "PERMANENT": "Постоянная",
+    "STORED": "Сохраненная"
+}
+
+# Обратные словари для разбора сохраненных отчетов
+_MODULES_BY_NAME = {name: module for module, name in _MODULE_NAMES.items()}
+_STATUSES_BY_TEXT = {text: status for status, text in _STATUS_TEXTS.items()}
+
+# Порядок статусов для сортировки по столбцу статуса
+_STATUS_IDS = {status: i for i, status in enumerate(_STATUS_TEXTS)}
+
+_SEVERITY_TEXTS = {
+    "HIGH": "Высокий",
+    "MEDIUM": "Средний",
+    "LOW": "Низкий",
+    "INFO": "Информация"
+}
+
+# Фон строк таблицы по статусу ошибки
+_STATUS_BRUSHES = {
+    "ACTIVE": QBrush(QColor(255, 200, 200)),     # Светло-красный
+    "PENDING": QBrush(QColor(255, 255, 200)),    # Светло-желтый
+    "PERMANENT": QBrush(QColor(200, 200, 255))   # Светло-синий
+}
+_DEFAULT_BRUSH = QBrush(QColor(240, 240, 240))   # Светло-серый
+_CODE_BRUSH = QBrush(Qt.blue)
+_CHECKED_BG = QBrush(QColor(200, 255, 200))      # Светло-зеленый - проверенная ошибка
+
+# Роль модели с признаком проверенной строки
+CHECKED_ROLE = Qt.UserRole + 2
+
+# Кисти по номеру статуса из _STATUS_IDS (последняя - для неизвестных статусов)
+_STATUS_BRUSH_BY_ID = tuple(_STATUS_BRUSHES.get(status, _DEFAULT_BRUSH)
+                            for status in _STATUS_IDS) + (_DEFAULT_BRUSH,)
+
+# Начальная ширина столбцов таблицы ошибок (0 - растягиваемый столбец)
+ERROR_COLUMN_WIDTHS = (130, 70, 90, 0, 90, 140, 140, 90)
+
+# Размер буфера файлов при сохранении и загрузке отчетов
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Число строк CSV, разбираемых за один проход
+CSV_BATCH_SIZE = 5000
+
+# Пункт списка для ошибок без причин/решений в базе
+_NO_INFO_BULLET = "• Нет информации<br>"
+
+# Формат отметок времени в записях ошибок
+_TS_FMT = 'yyyy-MM-dd HH:mm:ss'
+
+# Пустая запись для кодов, отсутствующих в базе (только для чтения)
+_EMPTY = {}
+
+# (описание, приоритет, значение) для кодов, отсутствующих в базе
+_UNKNOWN_TRIPLE = ("Неизвестная ошибка", "Неизвестно", "Нет информации")
+
+
+class ErrorDatabaseThread(QThread):
+    """Поток для загрузки базы данных ошибок"""
+    
+    database_loaded = pyqtSignal(dict)
+    database_missing = pyqtSignal()
+    load_failed = pyqtSignal(str)
+    
+    def __init__(self, db_path):
+        super().__init__()
+        self.db_path = db_path
+        
+    def run(self):
+        """Чтение и разбор файла базы данных"""
+        try:
+            with open(self.db_path, 'rb') as f:
+                database = json_loads(f.read())
+            self.database_loaded.emit(database)
+        except FileNotFoundError:
+            self.database_missing.emit()
+        except Exception as e:
+            self.load_failed.emit(str(e))
+
+
+# Пример ошибок, возвращаемых при чтении (для демонстрации)
+DEMO_ERRORS = {
+    "ENGINE": [
+        {
+            "code": "P0100",
+            "status": "ACTIVE",
+            "first_occurrence": "2024-01-15 14:30:22",
+            "last_occurrence": "2024-01-20 09:15:45",
+            "count": 5,
+            "freeze_frame": {
+                "rpm": 2450,
+                "speed": 80,
+                "coolant_temp": 92,
+                "load": 65
+            }
+        },
+        {
+            "code": "P0110",
+            "status": "PENDING",
+            "first_occurrence": "2024-01-18 16:45:12",
+            "last_occurrence": "2024-01-20 09:15:45",
+            "count": 2,
+            "freeze_frame": {
+                "rpm": 1200,
+                "speed": 0,
+                "coolant_temp": 85,
+                "load": 25
+            }
+        }
+    ],
+    "ABS": [
+        {
+            "code": "C0128",
+            "status": "ACTIVE",
+            "first_occurrence": "2024-01-10 08:20:33",
+            "last_occurrence": "2024-01-20 09:15:45",
+            "count": 12,
+            "freeze_frame": {
+                "speed": 60,
+                "brake_pressure": 0,
+                "wheel_speed_fl": 60,
+                "wheel_speed_fr": 59
+            }
+        }
+    ]
+}
+
+
+@dataclass
+class LoadedError:
+    """Считанный код неисправности"""
+    __slots__ = ("code", "status", "first_occurrence", "last_occurrence", "count", "freeze_frame")
+    
+    code: str
+    status: str
+    first_occurrence: str
+    last_occurrence: str
+    count: int
+    freeze_frame: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Преобразование в словарь"""
+        return {
+            "code": self.code,
+            "status": self.status,
+            "first_occurrence": self.first_occurrence,
+            "last_occurrence": self.last_occurrence,
+            "count": self.count,
+            "freeze_frame": self.freeze_frame
+        }
+        
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LoadedError':
+        """Создание из словаря (код и статус интернируются - в больших
+        отчетах они повторяются тысячи раз)"""
+        return cls(
+            code=sys.intern(data.get("code", "")),
+            status=sys.intern(data.get("status", "")),
+            first_occurrence=data.get("first_occurrence", ""),
+            last_occurrence=data.get("last_occurrence", ""),
+            count=data.get("count", 0),
+            freeze_frame=data.get("freeze_frame", {})
+        )
+
+
+def load_error_records(raw_errors):
+    """Преобразование словаря {модуль: [ошибки]} в записи LoadedError"""
+    from_dict = LoadedError.from_dict
+    return {sys.intern(module): [from_dict(error) for error in errors]
+            for module, errors in raw_errors.items()}
+
+
+def dump_error_records(loaded_errors):
+    """Преобразование записей LoadedError обратно в словари для сохранения"""
+    return {module: [error.to_dict() for error in errors]
+            for module, errors in loaded_errors.items()}
+
+
+def json_loads(raw):
+    """Разбор JSON из байтов (orjson, если установлен)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(obj):
+    """Сериализация в JSON с отступами в байты UTF-8 (orjson, если установлен)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def write_errors_json(filename, loaded_errors, error_database):
+    """Запись отчета об ошибках в JSON формате"""
+    report = {
+        "timestamp": QDateTime.currentDateTime().toString(_TS_FMT),
+        "vehicle": "Chevrolet Niva",
+        "total_errors": sum(len(errors) for errors in loaded_errors.values()),
+        "errors": dump_error_records(loaded_errors)
+    }
+    
+    # json.dump с отступами пишет множеством мелких кусков - пишем одним блоком байтов
+    with open(filename, 'wb') as f:
+        f.write(json_dumps(report))
+
+
+def write_errors_csv(filename, loaded_errors, error_database):
+    """Запись отчета об ошибках в CSV формате"""
+    with open(filename, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(['Модуль', 'Код ошибки', 'Статус', 'Описание', 'Приоритет', 
+                       'Первое появление', 'Последнее появление', 'Количество'])
+        
+        # Локальные ссылки вместо поиска атрибутов в каждой строке
+        get_data = error_database.get
+        get_status = _STATUS_TEXTS.get
+        get_severity = _SEVERITY_TEXTS.get
+        
+        rows = []
+        for module, errors in loaded_errors.items():
+            module_name = _MODULE_NAMES.get(module, module)
+            for error in errors:
+                error_data = get_data(error.code, _EMPTY)
+                rows.append((
+                    module_name,
+                    error.code,
+                    get_status(error.status, error.status),
+                    error_data.get('description', 'Неизвестная ошибка'),
+                    get_severity(error_data.get('severity', 'UNKNOWN'), "Неизвестно"),
+                    error.first_occurrence,
+                    error.last_occurrence,
+                    error.count
+                ))
+        writer.writerows(rows)
+
+
+def write_errors_txt(filename, loaded_errors, error_database):
+    """Запись отчета об ошибках в текстовом формате"""
+    with open(filename, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write("=" * 60 + "\n")
+        f.write("ОТЧЕТ О ДИАГНОСТИЧЕСКИХ ОШИБКАХ\n")
+        f.write("=" * 60 + "\n\n")
+        f.write(f"Автомобиль: Chevrolet Niva\n")
+        f.write(f"Дата и время: {QDateTime.currentDateTime().toString('dd.MM.yyyy HH:mm:ss')}\n")
+        f.write(f"Всего ошибок: {sum(len(errors) for errors in loaded_errors.values())}\n\n")
+        
+        get_data = error_database.get
+        get_status = _STATUS_TEXTS.get
+        get_severity = _SEVERITY_TEXTS.get
+        
+        for module, errors in loaded_errors.items():
+            if errors:
+                # Строки модуля собираются в список и пишутся одним вызовом
+                chunks = [
+                    f"\n{'-' * 60}\n",
+                    f"Модуль: {_MODULE_NAMES.get(module, module)}\n",
+                    f"{'-' * 60}\n\n"
+                ]
+                
+                for error in errors:
+                    error_data = get_data(error.code, _EMPTY)
+                    chunks.append(
+                        f"Код: {error.code}\n"
+                        f"Статус: {get_status(error.status, error.status)}\n"
+                        f"Описание: {error_data.get('description', 'Неизвестная ошибка')}\n"
+                        f"Приоритет: {get_severity(error_data.get('severity', 'UNKNOWN'), 'Неизвестно')}\n"
+                        f"Первое появление: {error.first_occurrence}\n"
+                        f"Последнее появление: {error.last_occurrence}\n"
+                        f"Количество: {error.count}\n\n"
+                    )
+                f.writelines(chunks)
+
+
+class ErrorExportThread(QThread):
+    """Поток сохранения отчета об ошибках"""
+    
+    export_finished = pyqtSignal(str)
+    export_failed = pyqtSignal(str)
+    
+    def __init__(self, filename, loaded_errors, error_database):
+        super().__init__()
+        self.filename = filename
+        self.loaded_errors = loaded_errors
+        self.error_database = error_database
+        
+    def run(self):
+        """Запись файла отчета"""
+        try:
+            if self.filename.endswith('.json'):
+                write_errors_json(self.filename, self.loaded_errors, self.error_database)
+            elif self.filename.endswith('.csv'):
+                write_errors_csv(self.filename, self.loaded_errors, self.error_database)
+            else:
+                write_errors_txt(self.filename, self.loaded_errors, self.error_database)
+                
+            self.export_finished.emit(self.filename)
+            
+        except Exception as e:
+            self.export_failed.emit(str(e))
+
+
+def read_errors_json(filename):
+    """Чтение ошибок из JSON отчета (None, если в файле нет раздела errors)"""
+    with open(filename, 'rb') as f:
+        data = json_loads(f.read())
+        
+    if "errors" not in data:
+        return None
+    return load_error_records(data["errors"])
+
+
+class ErrorImportThread(QThread):
+    """Поток загрузки отчета об ошибках из JSON файла"""
+    
+    import_finished = pyqtSignal(str, dict)
+    import_failed = pyqtSignal(str)
+    
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+        
+    def run(self):
+        """Чтение и разбор файла отчета"""
+        try:
+            loaded = read_errors_json(self.filename)
+            if loaded is None:
+                self.import_failed.emit("В файле нет раздела errors")
+                return
+            self.import_finished.emit(self.filename, loaded)
+            
+        except Exception as e:
+            self.import_failed.emit(str(e))
+
+
+class ReadErrorsThread(QThread):
+    """Поток для чтения ошибок из модулей"""
+    
+    errors_read = pyqtSignal(dict)
+    
+    def __init__(self):
+        super().__init__()
+        # Прогресс читается таймером панели, сигнал на каждый шаг не нужен
+        self.progress = 0
+        
+    def run(self):
+        """Чтение ошибок (эмуляция обмена с ЭБУ)"""
+        for step, delay in ((25, 100), (50, 200), (75, 200)):
+            self.msleep(delay)
+            if self.isInterruptionRequested():
+                return
+            self.progress = step
+            
+        self.msleep(200)
+        if not self.isInterruptionRequested():
+            self.errors_read.emit(load_error_records(copy.deepcopy(DEMO_ERRORS)))
+
+
+class ErrorTableModel(QAbstractTableModel):
+    """Модель таблицы ошибок: строки хранятся плоским списком (модуль, ошибка)
+
+    Сортируемые столбцы дублируются в массивах numpy, поэтому фильтр по модулю
+    строится маской, а сортировка - через argsort по номерам видимых строк.
+    """
+
+    HEADERS = ["Модуль", "Код", "Статус", "Описание",
+               "Приоритет", "Первое появление", "Последнее появление", "Количество"]
+
+    def __init__(self, panel):
+        super().__init__(panel)
+        self._panel = panel
+        self._rows = []
+        self._module_ids = {}
+        self._modules = np.empty(0, dtype=np.int16)
+        self._statuses = np.empty(0, dtype=np.int8)
+        self._counts = np.empty(0, dtype=np.int32)
+        self._visible = np.empty(0, dtype=np.intp)
+        self._module_filter = None
+        self._sort_column = None
+        self._sort_order = Qt.AscendingOrder
+        self._checked = set()
+
+    def set_rows(self, rows):
+        """Замена всех строк одним сбросом модели"""
+        self.beginResetModel()
+        count = len(rows)
+        self._rows = rows
+        self._modules = np.fromiter((self._module_id(module) for module, _ in rows),
+                                    dtype=np.int16, count=count)
+        self._statuses = np.fromiter((_STATUS_IDS.get(error.status, len(_STATUS_IDS)) for _, error in rows),
+                                     dtype=np.int8, count=count)
+        self._counts = np.fromiter((error.count for _, error in rows),
+                                   dtype=np.int32, count=count)
+        self._checked = set()
+        self._update_visible()
+        self.endResetModel()
+
+    @property
+    def module_filter(self):
+        """Модуль, ошибки которого показаны (None - все модули)"""
+        return self._module_filter
+
+    def set_module_filter(self, module):
+        """Показ ошибок только одного модуля (None - все модули)"""
+        if module == self._module_filter:
+            return
+        self.beginResetModel()
+        self._module_filter = module
+        self._update_visible()
+        self.endResetModel()
+
+    def append_row(self, module, error):
+        """Добавление одной строки в конец таблицы"""
+        self.append_rows([(module, error)])
+
+    def append_rows(self, rows):
+        """Добавление строк в конец таблицы одной вставкой"""
+        if not rows:
+            return
+        first_source = len(self._rows)
+        self._rows.extend(rows)
+        self._modules = np.concatenate((self._modules, np.fromiter(
+            (self._module_id(module) for module, _ in rows), dtype=np.int16, count=len(rows))))
+        self._statuses = np.concatenate((self._statuses, np.fromiter(
+            (_STATUS_IDS.get(error.status, len(_STATUS_IDS)) for _, error in rows),
+            dtype=np.int8, count=len(rows))))
+        self._counts = np.concatenate((self._counts, np.fromiter(
+            (error.count for _, error in rows), dtype=np.int32, count=len(rows))))
+        
+        sources = np.arange(first_source, len(self._rows))
+        if self._module_filter is not None:
+            module_id = self._module_ids.get(self._module_filter, -1)
+            sources = sources[self._modules[first_source:] == module_id]
+        if len(sources):
+            row = len(self._visible)
+            self.beginInsertRows(QModelIndex(), row, row + len(sources) - 1)
+            self._visible = np.concatenate((self._visible, sources))
+            self.endInsertRows()
+
+    def row_at(self, row):
+        """Получение пары (модуль, ошибка) по номеру строки"""
+        return self._rows[self._visible[row]]
+
+    def mark_checked(self, row):
+        """Пометка строки как проверенной (фон рисует CheckedRowDelegate)"""
+        self._checked.add(id(self.row_at(row)[1]))
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Сортировка видимых строк"""
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_sources = [int(self._visible[index.row()]) for index in old_indexes]
+        
+        self._sort_column = column
+        self._sort_order = order
+        self._update_visible()
+        
+        positions = {int(source): row for row, source in enumerate(self._visible)}
+        self.changePersistentIndexList(old_indexes, [
+            self.index(positions[source], index.column()) if source in positions else QModelIndex()
+            for index, source in zip(old_indexes, old_sources)
+        ])
+        self.layoutChanged.emit()
+
+    def _module_id(self, module):
+        """Числовой номер модуля для массива фильтрации"""
+        module_id = self._module_ids.get(module)
+        if module_id is None:
+            module_id = self._module_ids[module] = len(self._module_ids)
+        return module_id
+
+    def _update_visible(self):
+        """Пересчет номеров видимых строк с учетом фильтра и сортировки"""
+        if self._module_filter is None:
+            visible = np.arange(len(self._rows))
+        else:
+            module_id = self._module_ids.get(self._module_filter)
+            if module_id is None:
+                visible = np.empty(0, dtype=np.intp)
+            else:
+                visible = np.flatnonzero(self._modules == module_id)
+            
+        column = self._sort_column
+        if column is not None and len(visible) > 1:
+            if column == 7:
+                keys = self._counts[visible]
+            elif column == 2:
+                keys = self._statuses[visible]
+            else:
+                keys = np.array([self._display(*self._rows[i], column) for i in visible])
+            if self._sort_order == Qt.DescendingOrder:
+                # Устойчивая сортировка по убыванию: равные строки сохраняют
+                # тот же порядок, что и при сортировке по возрастанию
+                order = len(keys) - 1 - np.argsort(keys[::-1], kind="stable")[::-1]
+            else:
+                order = np.argsort(keys, kind="stable")
+            visible = visible[order]
+            
+        self._visible = visible
+
+    def _display(self, module, error, col):
+        """Текст ячейки"""
+        if col == 0:
+            return _MODULE_NAMES.get(module, module)
+        if col == 1:
+            return error.code
+        if col == 2:
+            status = error.status
+            return _STATUS_TEXTS.get(status, status)
+        if col == 3:
+            return self._panel._code_cache.get(error.code, _UNKNOWN_TRIPLE)[0]
+        if col == 4:
+            return self._panel._code_cache.get(error.code, _UNKNOWN_TRIPLE)[1]
+        if col == 5:
+            return error.first_occurrence
+        if col == 6:
+            return error.last_occurrence
+        return error.count
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        source = self._visible[index.row()]
+        module, error = self._rows[source]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            return self._display(module, error, col)
+        if role == Qt.UserRole:
+            return module
+        if role == Qt.UserRole + 1:
+            return error
+        if role == CHECKED_ROLE:
+            return id(error) in self._checked
+        if role == Qt.BackgroundRole:
+            return _STATUS_BRUSH_BY_ID[self._statuses[source]]
+        if role == Qt.ForegroundRole and col == 1:
+            return _CODE_BRUSH
+        if role == Qt.TextAlignmentRole and col == 7:
+            return Qt.AlignCenter
+        return None
+
+
+class CheckedRowDelegate(QStyledItemDelegate):
+    """Делегат, закрашивающий проверенные строки одним фоном"""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.data(CHECKED_ROLE):
+            option.backgroundBrush = _CHECKED_BG
+
 
 class ErrorPanel(QWidget):
     """Панель для работы с диагностическими кодами неисправностей"""
@@ -28,10 +620,41 @@ class ErrorPanel(QWidget):
         self.error_database = {}
         self.loaded_errors = {}
         self.current_ecu = None
+        self._code_cache = {}
+        self._code_index = {}
+        self._total_errors = 0
+        self._fitting_columns = False
+        self._columns_user_resized = False
+        self._rendered_details_cache = {}
+        self.database_thread = None
+        self.read_thread = None
+        self.save_thread = None
+        self.load_thread = None
+        
+        # Отложенное обновление деталей при быстрой смене выбора
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(80)
+        self._select_timer.timeout.connect(self._do_display_selected)
+        
+        # Анимация прогресса очистки ошибок
+        self._clear_timeline = QTimeLine(700, self)
+        self._clear_timeline.setFrameRange(0, 100)
+        self._clear_timeline.setCurveShape(QTimeLine.LinearCurve)
+        
+        # Опрос прогресса фонового чтения ошибок
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._update_read_progress)
+        
         self.init_ui()
         self.load_error_database()
         self.setup_connections()
         
+        # Страница вкладки не получает closeEvent при выходе из приложения -
+        # потоки останавливаются по сигналу приложения
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
+        
     def init_ui(self):
         """Инициализация пользовательского интерфейса"""
         main_layout = QVBoxLayout(self)
@@ -63,11 +686,11 @@ class ErrorPanel(QWidget):
     def create_toolbar(self):
         """Создание панели инструментов"""
         self.toolbar = QToolBar("Панель ошибок")
-        self.toolbar.setIconSize(QSize(24, 24))
+        self.toolbar.setIconSize(TOOLBAR_ICON_SIZE)
         
         # Кнопка чтения ошибок
         self.read_errors_action = QAction(
-            QIcon.fromTheme("view-refresh", QIcon("assets/icons/refresh.png")),
+            QIcon.fromTheme("view-refresh", get_icon("refresh")),
             "Считать ошибки",
             self
         )
@@ -77,7 +700,7 @@ class ErrorPanel(QWidget):
         
         # Кнопка очистки ошибок
         self.clear_errors_action = QAction(
-            QIcon.fromTheme("edit-clear", QIcon("assets/icons/clear.png")),
+            QIcon.fromTheme("edit-clear", get_icon("clear")),
             "Очистить ошибки",
             self
         )
@@ -88,7 +711,7 @@ class ErrorPanel(QWidget):
         
         # Кнопка сохранения ошибок
         self.save_errors_action = QAction(
-            QIcon.fromTheme("document-save", QIcon("assets/icons/save.png")),
+            QIcon.fromTheme("document-save", get_icon("save")),
             "Сохранить",
             self
         )
@@ -98,7 +721,7 @@ class ErrorPanel(QWidget):
         
         # Кнопка загрузки ошибок
         self.load_errors_action = QAction(
-            QIcon.fromTheme("document-open", QIcon("assets/icons/open.png")),
+            QIcon.fromTheme("document-open", get_icon("open")),
             "Загрузить",
             self
         )
@@ -109,7 +732,7 @@ class ErrorPanel(QWidget):
         
         # Кнопка печати
         self.print_action = QAction(
-            QIcon.fromTheme("document-print", QIcon("assets/icons/print.png")),
+            QIcon.fromTheme("document-print", get_icon("print")),
             "Печать",
             self
         )
@@ -142,9 +765,11 @@ class ErrorPanel(QWidget):
         header_layout = QHBoxLayout(header_frame)
         
         self.error_count_label = QLabel("Ошибок не обнаружено")
+        self.error_count_label.setTextFormat(Qt.PlainText)
         self.error_count_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
         
         self.last_update_label = QLabel("")
+        self.last_update_label.setTextFormat(Qt.PlainText)
         self.last_update_label.setAlignment(Qt.AlignRight)
         
         header_layout.addWidget(self.error_count_label)
@@ -153,30 +778,22 @@ class ErrorPanel(QWidget):
         layout.addWidget(header_frame)
         
         # Таблица ошибок
-        self.error_table = QTableWidget()
-        self.error_table.setColumnCount(8)
-        self.error_table.setHorizontalHeaderLabels([
-            "Модуль", "Код", "Статус", "Описание", 
-            "Приоритет", "Первое появление", "Последнее появление", "Количество"
-        ])
+        self.error_model = ErrorTableModel(self)
+        
+        self.error_table = QTableView()
+        self.error_table.setModel(self.error_model)
+        self.error_table.setItemDelegate(CheckedRowDelegate(self.error_table))
         
         # Настройка таблицы
-        self.error_table.setAlternatingRowColors(True)
-        self.error_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.error_table.setSelectionMode(QTableWidget.SingleSelection)
+        # Фон строк задается статусом ошибки, чередование цветов все равно перекрывается
+        self.error_table.setAlternatingRowColors(False)
+        self.error_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.error_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.error_table.setSortingEnabled(True)
-        self.error_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.error_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
         # Настройка заголовков
-        header = self.error_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Модуль
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Код
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # Статус
-        header.setSectionResizeMode(3, QHeaderView.Stretch)           # Описание
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Приоритет
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)  # Первое появление
-        header.setSectionResizeMode(6, QHeaderView.ResizeToContents)  # Последнее появление
-        header.setSectionResizeMode(7, QHeaderView.ResizeToContents)  # Количество
+        self.apply_header_resize_modes()
         
         # Контекстное меню для таблицы
         self.error_table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -184,6 +801,46 @@ class ErrorPanel(QWidget):
         
         layout.addWidget(self.error_table)
         
+    def apply_header_resize_modes(self):
+        """Установка режимов изменения размеров столбцов таблицы ошибок"""
+        # ResizeToContents измеряет все ячейки при каждом изменении модели,
+        # поэтому ширины задаются заранее и подгоняются один раз после заполнения
+        header = self.error_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)           # Описание
+        for col, width in enumerate(ERROR_COLUMN_WIDTHS):
+            if width:
+                header.resizeSection(col, width)
+        header.sectionResized.connect(self.on_error_column_resized)
+        
+    def on_error_column_resized(self, col, old_size, new_size):
+        """Запоминание ручного изменения ширины столбцов"""
+        if not self._fitting_columns and col != 3:
+            self._columns_user_resized = True
+            
+    def fit_error_columns(self):
+        """Однократная подгонка ширины столбцов под содержимое"""
+        if self._columns_user_resized:
+            return
+        self._fitting_columns = True
+        try:
+            for col, width in enumerate(ERROR_COLUMN_WIDTHS):
+                if width:
+                    self.error_table.resizeColumnToContents(col)
+        finally:
+            self._fitting_columns = False
+        
+    def begin_table_update(self):
+        """Отключение сортировки и перерисовки на время заполнения"""
+        self.error_table.setUpdatesEnabled(False)
+        self.error_table.setSortingEnabled(False)
+        
+    def end_table_update(self):
+        """Восстановление сортировки и перерисовки, подгонка столбцов"""
+        self.error_table.setSortingEnabled(True)
+        self.fit_error_columns()
+        self.error_table.setUpdatesEnabled(True)
+        
     def create_error_details_panel(self):
         """Создание панели деталей ошибки"""
         self.error_details_panel = QTabWidget()
@@ -196,19 +853,13 @@ class ErrorPanel(QWidget):
         info_group = QGroupBox("Информация об ошибке")
         info_layout = QVBoxLayout()
         
-        self.error_code_label = QLabel("Код ошибки: -")
-        self.error_code_label.setStyleSheet("font-weight: bold; font-size: 11pt;")
-        
-        self.error_module_label = QLabel("Модуль: -")
-        self.error_description_label = QLabel("Описание: -")
-        self.error_meaning_label = QLabel("Значение: -")
-        self.error_conditions_label = QLabel("Условия возникновения: -")
+        # Вся информация выводится одной меткой, чтобы обновлять её за один проход
+        self.error_info_label = QLabel()
+        self.error_info_label.setTextFormat(Qt.RichText)
+        self.error_info_label.setWordWrap(True)
+        self.set_error_info("-", "-", "-", "-", "-")
         
-        info_layout.addWidget(self.error_code_label)
-        info_layout.addWidget(self.error_module_label)
-        info_layout.addWidget(self.error_description_label)
-        info_layout.addWidget(self.error_meaning_label)
-        info_layout.addWidget(self.error_conditions_label)
+        info_layout.addWidget(self.error_info_label)
         
         info_group.setLayout(info_layout)
         details_layout.addWidget(info_group)
@@ -219,10 +870,12 @@ class ErrorPanel(QWidget):
         
         self.error_causes_text = QTextEdit()
         self.error_causes_text.setReadOnly(True)
+        self.error_causes_text.setAcceptRichText(False)
         self.error_causes_text.setMaximumHeight(80)
         
         self.error_solutions_text = QTextEdit()
         self.error_solutions_text.setReadOnly(True)
+        self.error_solutions_text.setAcceptRichText(False)
         self.error_solutions_text.setMaximumHeight(80)
         
         action_layout.addWidget(QLabel("Возможные причины:"))
@@ -247,7 +900,7 @@ class ErrorPanel(QWidget):
         tech_group.setLayout(tech_layout)
         details_layout.addWidget(tech_group)
         
-        self.error_details_panel.addTab(self.details_tab, QIcon("assets/icons/info.png"), "Информация")
+        self.error_details_panel.addTab(self.details_tab, get_icon("info"), "Информация")
         
         # Вкладка 2: График возникновения ошибки
         self.history_tab = QWidget()
@@ -265,7 +918,7 @@ class ErrorPanel(QWidget):
         history_layout.addWidget(history_label)
         history_layout.addWidget(self.history_placeholder)
         
-        self.error_details_panel.addTab(self.history_tab, QIcon("assets/icons/chart.png"), "История")
+        self.error_details_panel.addTab(self.history_tab, get_icon("chart"), "История")
         
         # Вкладка 3: Действия
         self.actions_tab = QWidget()
@@ -276,15 +929,15 @@ class ErrorPanel(QWidget):
         immediate_layout = QVBoxLayout()
         
         self.test_sensor_btn = QPushButton("Протестировать датчик")
-        self.test_sensor_btn.setIcon(QIcon("assets/icons/sensor.png"))
+        self.test_sensor_btn.setIcon(get_icon("sensor"))
         self.test_sensor_btn.setEnabled(False)
         
         self.check_wiring_btn = QPushButton("Проверить проводку")
-        self.check_wiring_btn.setIcon(QIcon("assets/icons/wiring.png"))
+        self.check_wiring_btn.setIcon(get_icon("wiring"))
         self.check_wiring_btn.setEnabled(False)
         
         self.reset_adaptation_btn = QPushButton("Сбросить адаптацию")
-        self.reset_adaptation_btn.setIcon(QIcon("assets/icons/reset.png"))
+        self.reset_adaptation_btn.setIcon(get_icon("reset"))
         self.reset_adaptation_btn.setEnabled(False)
         
         immediate_layout.addWidget(self.test_sensor_btn)
@@ -316,7 +969,7 @@ class ErrorPanel(QWidget):
         actions_layout.addWidget(settings_group)
         actions_layout.addStretch()
         
-        self.error_details_panel.addTab(self.actions_tab, QIcon("assets/icons/tools.png"), "Действия")
+        self.error_details_panel.addTab(self.actions_tab, get_icon("tools"), "Действия")
         
     def create_status_bar(self):
         """Создание статус бара"""
@@ -325,11 +978,13 @@ class ErrorPanel(QWidget):
         status_layout = QHBoxLayout(self.status_frame)
         
         self.status_label = QLabel("Готов к чтению ошибок")
+        self.status_label.setTextFormat(Qt.PlainText)
         self.progress_bar = QProgressBar()
         self.progress_bar.setMaximumWidth(200)
         self.progress_bar.setVisible(False)
         
         self.ecu_status_label = QLabel("ECU: Не подключен")
+        self.ecu_status_label.setTextFormat(Qt.PlainText)
         self.ecu_status_label.setAlignment(Qt.AlignRight)
         
         status_layout.addWidget(self.status_label)
@@ -346,9 +1001,13 @@ class ErrorPanel(QWidget):
         self.print_action.triggered.connect(self.on_print_report)
         self.ecu_combo.currentIndexChanged.connect(self.on_ecu_changed)
         
+        # Анимация очистки ошибок
+        self._clear_timeline.frameChanged.connect(self.progress_bar.setValue)
+        self._clear_timeline.finished.connect(self.complete_clear_errors)
+        
         # Таблица ошибок
-        self.error_table.itemSelectionChanged.connect(self.on_error_selected)
-        self.error_table.itemDoubleClicked.connect(self.on_error_double_clicked)
+        self.error_table.selectionModel().selectionChanged.connect(self.on_error_selected)
+        self.error_table.doubleClicked.connect(self.on_error_double_clicked)
         
         # Вкладка действий
         self.test_sensor_btn.clicked.connect(self.on_test_sensor)
@@ -359,22 +1018,46 @@ class ErrorPanel(QWidget):
         
     def load_error_database(self):
         """Загрузка базы данных ошибок"""
-        try:
-            # Загрузка из файла или ресурсов
-            db_path = "config/error_codes.json"
-            if os.path.exists(db_path):
-                with open(db_path, 'r', encoding='utf-8') as f:
-                    self.error_database = json.load(f)
-            else:
-                # Загрузка встроенной базы данных
-                self.load_default_error_database()
-                
-            self.status_label.setText(f"База данных ошибок загружена: {len(self.error_database)} записей")
-            
-        except Exception as e:
-            self.status_label.setText(f"Ошибка загрузки базы данных: {str(e)}")
-            self.load_default_error_database()
-            
+        # Встроенная база доступна сразу, файл читается в фоновом потоке
+        self.load_default_error_database()
+        self.build_code_cache()
+        
+        self.status_label.setText("Загрузка базы данных ошибок...")
+        self.database_thread = ErrorDatabaseThread("config/error_codes.json")
+        self.database_thread.database_loaded.connect(self.on_database_loaded, Qt.QueuedConnection)
+        self.database_thread.database_missing.connect(self.on_database_missing, Qt.QueuedConnection)
+        self.database_thread.load_failed.connect(self.on_database_load_failed, Qt.QueuedConnection)
+        self.database_thread.start()
+        
+    def on_database_missing(self):
+        """Файла базы нет - остается встроенная база данных"""
+        self.status_label.setText(f"База данных ошибок загружена: {len(self.error_database)} записей")
+        
+    def on_database_loaded(self, database):
+        """Применение загруженной базы данных ошибок"""
+        self.error_database = database
+        self.build_code_cache()
+        if self.loaded_errors:
+            self.update_error_table()
+        self.status_label.setText(f"База данных ошибок загружена: {len(self.error_database)} записей")
+        
+    def on_database_load_failed(self, error):
+        """Обработка ошибки загрузки базы данных"""
+        self.status_label.setText(f"Ошибка загрузки базы данных: {error}")
+        
+    def build_code_cache(self):
+        """Построение кэша (описание, приоритет, значение) по кодам ошибок"""
+        self._rendered_details_cache = {}
+        unknown_description, unknown_severity, unknown_meaning = _UNKNOWN_TRIPLE
+        self._code_cache = {
+            code: (
+                data.get("description", unknown_description),
+                _SEVERITY_TEXTS.get(data.get("severity", "UNKNOWN"), unknown_severity),
+                data.get("meaning", unknown_meaning)
+            )
+            for code, data in self.error_database.items()
+        }
+        
     def load_default_error_database(self):
         """Загрузка стандартной базы данных ошибок для Chevrolet Niva"""
         self.error_database = {
@@ -455,66 +1138,37 @@ class ErrorPanel(QWidget):
         
     def on_read_errors(self):
         """Обработка чтения ошибок"""
+        if self.read_thread and self.read_thread.isRunning():
+            return
+            
         self.status_label.setText("Чтение ошибок...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         
-        # Эмуляция процесса чтения
-        QTimer.singleShot(100, lambda: self.progress_bar.setValue(25))
-        QTimer.singleShot(300, lambda: self.progress_bar.setValue(50))
-        QTimer.singleShot(500, lambda: self.progress_bar.setValue(75))
-        QTimer.singleShot(700, self.process_loaded_errors)
+        # Чтение выполняется в отдельном потоке
+        self.read_thread = ReadErrorsThread()
+        self.read_thread.errors_read.connect(self._on_errors_received, Qt.QueuedConnection)
+        self.read_thread.start()
+        self._progress_timer.start()
         
         self.read_errors_requested.emit()
         
-    def process_loaded_errors(self):
+    def _on_errors_received(self, loaded_errors):
+        """Обработка ошибок, считанных в фоновом потоке"""
+        self._progress_timer.stop()
+        self.process_loaded_errors(loaded_errors)
+        
+    def _update_read_progress(self):
+        """Отображение прогресса чтения ошибок"""
+        if self.read_thread:
+            self.progress_bar.setValue(self.read_thread.progress)
+        
+    def process_loaded_errors(self, loaded_errors=None):
         """Обработка загруженных ошибок"""
-        # Пример загруженных ошибок (для демонстрации)
-        self.loaded_errors = {
-            "ENGINE": [
-                {
-                    "code": "P0100",
-                    "status": "ACTIVE",
-                    "first_occurrence": "2024-01-15 14:30:22",
-                    "last_occurrence": "2024-01-20 09:15:45",
-                    "count": 5,
-                    "freeze_frame": {
-                        "rpm": 2450,
-                        "speed": 80,
-                        "coolant_temp": 92,
-                        "load": 65
-                    }
-                },
-                {
-                    "code": "P0110",
-                    "status": "PENDING",
-                    "first_occurrence": "2024-01-18 16:45:12",
-                    "last_occurrence": "2024-01-20 09:15:45",
-                    "count": 2,
-                    "freeze_frame": {
-                        "rpm": 1200,
-                        "speed": 0,
-                        "coolant_temp": 85,
-                        "load": 25
-                    }
-                }
-            ],
-            "ABS": [
-                {
-                    "code": "C0128",
-                    "status": "ACTIVE",
-                    "first_occurrence": "2024-01-10 08:20:33",
-                    "last_occurrence": "2024-01-20 09:15:45",
-                    "count": 12,
-                    "freeze_frame": {
-                        "speed": 60,
-                        "brake_pressure": 0,
-                        "wheel_speed_fl": 60,
-                        "wheel_speed_fr": 59
-                    }
-                }
-            ]
-        }
+        if loaded_errors is None:
+            loaded_errors = load_error_records(copy.deepcopy(DEMO_ERRORS))
+        self.loaded_errors = loaded_errors
+        self._total_errors = None
         
         self.update_error_table()
         self.progress_bar.setValue(100)
@@ -524,190 +1178,128 @@ class ErrorPanel(QWidget):
         
     def update_error_table(self):
         """Обновление таблицы ошибок"""
-        self.error_table.setRowCount(0)
+        rows = [(module, error)
+                for module, errors in self.loaded_errors.items()
+                for error in errors]
+        self._total_errors = len(rows)
+        self._code_index = {(module, error.code): error for module, error in rows}
         
-        total_errors = 0
-        for module, errors in self.loaded_errors.items():
-            for error in errors:
-                total_errors += 1
-                row = self.error_table.rowCount()
-                self.error_table.insertRow(row)
-                
-                # Цвет строки в зависимости от статуса
-                color = self.get_error_color(error["status"])
-                
-                # Модуль
-                module_item = QTableWidgetItem(self.get_module_name(module))
-                module_item.setBackground(color)
-                self.error_table.setItem(row, 0, module_item)
-                
-                # Код ошибки
-                code_item = QTableWidgetItem(error["code"])
-                code_item.setBackground(color)
-                code_item.setForeground(QBrush(Qt.blue))
-                self.error_table.setItem(row, 1, code_item)
-                
-                # Статус
-                status_item = QTableWidgetItem(self.get_status_text(error["status"]))
-                status_item.setBackground(color)
-                self.error_table.setItem(row, 2, status_item)
-                
-                # Описание
-                description = self.error_database.get(error["code"], {}).get("description", "Неизвестная ошибка")
-                desc_item = QTableWidgetItem(description)
-                desc_item.setBackground(color)
-                self.error_table.setItem(row, 3, desc_item)
-                
-                # Приоритет
-                severity = self.error_database.get(error["code"], {}).get("severity", "UNKNOWN")
-                severity_item = QTableWidgetItem(self.get_severity_text(severity))
-                severity_item.setBackground(color)
-                self.error_table.setItem(row, 4, severity_item)
-                
-                # Первое появление
-                first_item = QTableWidgetItem(error["first_occurrence"])
-                first_item.setBackground(color)
-                self.error_table.setItem(row, 5, first_item)
-                
-                # Последнее появление
-                last_item = QTableWidgetItem(error["last_occurrence"])
-                last_item.setBackground(color)
-                self.error_table.setItem(row, 6, last_item)
-                
-                # Количество
-                count_item = QTableWidgetItem(str(error["count"]))
-                count_item.setBackground(color)
-                count_item.setTextAlignment(Qt.AlignCenter)
-                self.error_table.setItem(row, 7, count_item)
-        
-        # Обновление заголовка
-        if total_errors == 0:
+        self.begin_table_update()
+        try:
+            self.error_model.set_rows(rows)
+        finally:
+            self.end_table_update()
+        
+        self.update_error_count_label()
+        
+    def update_error_count_label(self):
+        """Обновление заголовка с количеством ошибок"""
+        module = self.error_model.module_filter
+        if module is not None:
+            module_name = self.get_module_name(module)
+            self.error_count_label.setText(f"{module_name}: {self.error_model.rowCount()} ошибок")
+        elif self._total_errors == 0:
             self.error_count_label.setText("Ошибок не обнаружено")
             self.error_count_label.setStyleSheet("font-weight: bold; color: green; font-size: 12pt;")
         else:
-            self.error_count_label.setText(f"Обнаружено ошибок: {total_errors}")
+            self.error_count_label.setText(f"Обнаружено ошибок: {self._total_errors}")
             self.error_count_label.setStyleSheet("font-weight: bold; color: red; font-size: 12pt;")
             
     def get_error_color(self, status):
-        """Получение цвета для строки в зависимости от статуса ошибки"""
-        if status == "ACTIVE":
-            return QColor(255, 200, 200)  # Светло-красный
-        elif status == "PENDING":
-            return QColor(255, 255, 200)  # Светло-желтый
-        elif status == "PERMANENT":
-            return QColor(200, 200, 255)  # Светло-синий
-        else:
-            return QColor(240, 240, 240)  # Светло-серый
-            
+        """Получение кисти фона строки в зависимости от статуса ошибки"""
+        return _STATUS_BRUSHES.get(status, _DEFAULT_BRUSH)
+        
     def get_module_name(self, module_code):
         """Получение читаемого имени модуля"""
-        module_names = {
-            "ENGINE": "Двигатель (ECU)",
-            "ABS": "ABS",
-            "AIRBAG": "Подушки безопасности",
-            "IMMO": "Иммобилайзер",
-            "INSTRUMENT": "Приборная панель",
-            "AC": "Климат-контроль"
-        }
-        return module_names.get(module_code, module_code)
+        return _MODULE_NAMES.get(module_code, module_code)
         
     def get_status_text(self, status):
         """Получение читаемого текста статуса"""
-        status_texts = {
-            "ACTIVE": "Активная",
-            "PENDING": "Ожидающая",
-            "PERMANENT": "Постоянная",
-            "STORED": "Сохраненная"
-        }
-        return status_texts.get(status, status)
+        return _STATUS_TEXTS.get(status, status)
         
     def get_severity_text(self, severity):
         """Получение читаемого текста приоритета"""
-        severity_texts = {
-            "HIGH": "Высокий",
-            "MEDIUM": "Средний",
-            "LOW": "Низкий",
-            "INFO": "Информация"
-        }
-        return severity_texts.get(severity, "Неизвестно")
+        return _SEVERITY_TEXTS.get(severity, "Неизвестно")
         
     def count_total_errors(self):
         """Подсчет общего количества ошибок"""
-        total = 0
-        for errors in self.loaded_errors.values():
-            total += len(errors)
-        return total
+        if self._total_errors is None:
+            self._total_errors = sum(len(errors) for errors in self.loaded_errors.values())
+        return self._total_errors
+        
+    def selected_error(self):
+        """Получение пары (модуль, ошибка) для выбранной строки таблицы"""
+        index = self.error_table.currentIndex()
+        if not index.isValid():
+            return None
+        return index.data(Qt.UserRole), index.data(Qt.UserRole + 1)
         
     def on_error_selected(self):
         """Обработка выбора ошибки в таблице"""
-        selected_items = self.error_table.selectedItems()
-        if not selected_items:
+        self._select_timer.start()
+        
+    def _do_display_selected(self):
+        """Отображение деталей ошибки после завершения смены выбора"""
+        index = self.error_table.currentIndex()
+        if not index.isValid():
             return
             
-        row = selected_items[0].row()
-        error_code = self.error_table.item(row, 1).text()
-        module_code = ""
-        
-        # Определяем модуль по строке таблицы
-        for module, errors in self.loaded_errors.items():
-            for error in errors:
-                if error["code"] == error_code:
-                    module_code = module
-                    break
+        # Модуль и ошибка хранятся в самой строке модели
+        module_code = index.data(Qt.UserRole)
+        error = index.data(Qt.UserRole + 1)
+        error_code = error.code
         
-        self.display_error_details(error_code, module_code, row)
+        self.display_error_details(error_code, module_code, index.row(), error)
         self.error_selected.emit(error_code)
         
-    def display_error_details(self, error_code, module_code, row):
+    def display_error_details(self, error_code, module_code, row, loaded_error=None):
         """Отображение деталей выбранной ошибки"""
         error_data = self.error_database.get(error_code, {})
-        loaded_error = None
         
-        # Находим загруженную ошибку
-        for module, errors in self.loaded_errors.items():
-            for error in errors:
-                if error["code"] == error_code:
-                    loaded_error = error
-                    module_code = module
-                    break
+        # Находим загруженную ошибку, если она не передана из таблицы
+        if loaded_error is None:
+            loaded_error = self._code_index.get((module_code, error_code))
         
         # Обновление основной информации
-        self.error_code_label.setText(f"Код ошибки: {error_code}")
-        self.error_module_label.setText(f"Модуль: {self.get_module_name(module_code)}")
-        self.error_description_label.setText(f"Описание: {error_data.get('description', 'Неизвестная ошибка')}")
-        self.error_meaning_label.setText(f"Значение: {error_data.get('meaning', 'Нет информации')}")
-        self.error_conditions_label.setText(f"Условия возникновения: {error_data.get('conditions', 'Нет информации')}")
+        self.set_error_info(
+            error_code,
+            self.get_module_name(module_code),
+            error_data.get('description', 'Неизвестная ошибка'),
+            error_data.get('meaning', 'Нет информации'),
+            error_data.get('conditions', 'Нет информации')
+        )
         
         # Обновление причин и решений
-        causes = error_data.get('causes', ['Нет информации'])
-        solutions = error_data.get('solutions', ['Нет информации'])
+        rendered = self._rendered_details_cache.get(error_code)
+        if rendered is None:
+            causes = error_data.get('causes', ['Нет информации'])
+            solutions = error_data.get('solutions', ['Нет информации'])
+            rendered = (
+                '\n'.join(f"• {cause}" for cause in causes),
+                '\n'.join(f"• {solution}" for solution in solutions)
+            )
+            self._rendered_details_cache[error_code] = rendered
         
-        self.error_causes_text.setText('\n'.join([f"• {cause}" for cause in causes]))
-        self.error_solutions_text.setText('\n'.join([f"• {solution}" for solution in solutions]))
+        self.error_causes_text.setPlainText(rendered[0])
+        self.error_solutions_text.setPlainText(rendered[1])
         
         # Обновление технической информации
-        self.tech_info_table.setRowCount(0)
-        
+        tech_info = []
         if loaded_error:
             # Добавляем техническую информацию из загруженной ошибки
             tech_info = [
-                ("Статус", self.get_status_text(loaded_error["status"])),
-                ("Количество появлений", str(loaded_error["count"])),
-                ("Первое появление", loaded_error["first_occurrence"]),
-                ("Последнее появление", loaded_error["last_occurrence"])
+                ("Статус", self.get_status_text(loaded_error.status)),
+                ("Количество появлений", str(loaded_error.count)),
+                ("Первое появление", loaded_error.first_occurrence),
+                ("Последнее появление", loaded_error.last_occurrence)
             ]
             
             # Добавляем данные из freeze frame
-            if "freeze_frame" in loaded_error:
-                for key, value in loaded_error["freeze_frame"].items():
+            if loaded_error.freeze_frame:
+                for key, value in loaded_error.freeze_frame.items():
                     tech_info.append((f"Freeze Frame: {key}", str(value)))
-            
-            self.tech_info_table.setRowCount(len(tech_info))
-            for i, (param, value) in enumerate(tech_info):
-                param_item = QTableWidgetItem(param)
-                value_item = QTableWidgetItem(value)
-                self.tech_info_table.setItem(i, 0, param_item)
-                self.tech_info_table.setItem(i, 1, value_item)
+        
+        self.fill_tech_info_table(tech_info)
         
         # Активация кнопок действий
         self.test_sensor_btn.setEnabled(True)
@@ -716,11 +1308,38 @@ class ErrorPanel(QWidget):
         self.monitor_checkbox.setEnabled(True)
         self.threshold_spinbox.setEnabled(True)
         
-    def on_error_double_clicked(self, item):
+    def fill_tech_info_table(self, tech_info):
+        """Заполнение таблицы технической информации за один проход"""
+        table = self.tech_info_table
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(tech_info))
+            for i, pair in enumerate(tech_info):
+                # Уже созданные ячейки переиспользуются, меняется только текст
+                for col, text in enumerate(pair):
+                    item = table.item(i, col)
+                    if item is None:
+                        table.setItem(i, col, QTableWidgetItem(text))
+                    else:
+                        item.setText(text)
+        finally:
+            table.setUpdatesEnabled(True)
+            
+    def set_error_info(self, code, module, description, meaning, conditions):
+        """Заполнение метки с основной информацией об ошибке"""
+        self.error_info_label.setText(
+            f'<span style="font-weight: bold; font-size: 11pt;">Код ошибки: {html.escape(code)}</span><br>'
+            f"Модуль: {html.escape(module)}<br>"
+            f"Описание: {html.escape(description)}<br>"
+            f"Значение: {html.escape(meaning)}<br>"
+            f"Условия возникновения: {html.escape(conditions)}"
+        )
+        
+    def on_error_double_clicked(self, index):
         """Обработка двойного клика по ошибке"""
         # Открытие дополнительной информации
-        error_code = self.error_table.item(item.row(), 1).text()
-        self.show_error_details_dialog(error_code)
+        _, error = self.error_model.row_at(index.row())
+        self.show_error_details_dialog(error.code)
         
     def show_error_details_dialog(self, error_code):
         """Показать диалог с детальной информацией об ошибке"""
@@ -729,15 +1348,24 @@ class ErrorPanel(QWidget):
         dialog.setIcon(QMessageBox.Information)
         
         error_data = self.error_database.get(error_code, {})
-        message = f"""
-        <b>Код ошибки:</b> {error_code}<br><br>
-        <b>Описание:</b> {error_data.get('description', 'Неизвестная ошибка')}<br><br>
-        <b>Значение:</b> {error_data.get('meaning', 'Нет информации')}<br><br>
-        <b>Возможные причины:</b><br>
-        {chr(10).join([f'• {cause}' for cause in error_data.get('causes', ['Нет информации'])])}<br><br>
-        <b>Рекомендуемые решения:</b><br>
-        {chr(10).join([f'• {solution}' for solution in error_data.get('solutions', ['Нет информации'])])}
-        """
+        parts = [
+            "<b>Код ошибки:</b> ", html.escape(error_code),
+            "<br><br><b>Описание:</b> ", html.escape(error_data.get('description', 'Неизвестная ошибка')),
+            "<br><br><b>Значение:</b> ", html.escape(error_data.get('meaning', 'Нет информации')),
+            "<br><br><b>Возможные причины:</b><br>"
+        ]
+        causes = error_data.get('causes')
+        if causes:
+            parts.extend(f"• {html.escape(cause)}<br>" for cause in causes)
+        else:
+            parts.append(_NO_INFO_BULLET)
+        parts.append("<br><b>Рекомендуемые решения:</b><br>")
+        solutions = error_data.get('solutions')
+        if solutions:
+            parts.extend(f"• {html.escape(solution)}<br>" for solution in solutions)
+        else:
+            parts.append(_NO_INFO_BULLET)
+        message = "".join(parts)
         
         dialog.setTextFormat(Qt.RichText)
         dialog.setText(message)
@@ -760,10 +1388,7 @@ class ErrorPanel(QWidget):
             self.progress_bar.setValue(0)
             
             # Эмуляция процесса очистки
-            QTimer.singleShot(100, lambda: self.progress_bar.setValue(25))
-            QTimer.singleShot(300, lambda: self.progress_bar.setValue(50))
-            QTimer.singleShot(500, lambda: self.progress_bar.setValue(75))
-            QTimer.singleShot(700, self.complete_clear_errors)
+            self._clear_timeline.start()
             
             self.clear_errors_requested.emit()
             
@@ -781,11 +1406,7 @@ class ErrorPanel(QWidget):
         
     def reset_error_details(self):
         """Сброс детальной панели ошибок"""
-        self.error_code_label.setText("Код ошибки: -")
-        self.error_module_label.setText("Модуль: -")
-        self.error_description_label.setText("Описание: -")
-        self.error_meaning_label.setText("Значение: -")
-        self.error_conditions_label.setText("Условия возникновения: -")
+        self.set_error_info("-", "-", "-", "-", "-")
         self.error_causes_text.clear()
         self.error_solutions_text.clear()
         self.tech_info_table.setRowCount(0)
@@ -811,77 +1432,37 @@ class ErrorPanel(QWidget):
         )
         
         if filename:
-            try:
-                if filename.endswith('.json'):
-                    self.save_errors_json(filename)
-                elif filename.endswith('.csv'):
-                    self.save_errors_csv(filename)
-                else:
-                    self.save_errors_txt(filename)
-                    
-                self.status_label.setText(f"Ошибки сохранены в {filename}")
+            if self.save_thread and self.save_thread.isRunning():
+                return
                 
-            except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Не удалось сохранить файл: {str(e)}")
+            # Поток работает со снимком ошибок, чтобы не зависеть от изменений таблицы
+            self.save_thread = ErrorExportThread(filename, copy.deepcopy(self.loaded_errors),
+                                                 self.error_database)
+            self.save_thread.export_finished.connect(self.on_errors_saved)
+            self.save_thread.export_failed.connect(self.on_errors_save_failed)
+            self.status_label.setText("Сохранение ошибок...")
+            self.save_thread.start()
                 
+    def on_errors_saved(self, filename):
+        """Завершение сохранения ошибок"""
+        self.status_label.setText(f"Ошибки сохранены в {filename}")
+        
+    def on_errors_save_failed(self, error):
+        """Ошибка сохранения ошибок"""
+        self.status_label.setText("Ошибка сохранения")
+        QMessageBox.critical(self, "Ошибка", f"Не удалось сохранить файл: {error}")
+        
     def save_errors_json(self, filename):
         """Сохранение ошибок в JSON формате"""
-        report = {
-            "timestamp": QDateTime.currentDateTime().toString('yyyy-MM-dd HH:mm:ss'),
-            "vehicle": "Chevrolet Niva",
-            "total_errors": self.count_total_errors(),
-            "errors": self.loaded_errors
-        }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        write_errors_json(filename, self.loaded_errors, self.error_database)
             
     def save_errors_csv(self, filename):
         """Сохранение ошибок в CSV формате"""
-        with open(filename, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f, delimiter=';')
-            writer.writerow(['Модуль', 'Код ошибки', 'Статус', 'Описание', 'Приоритет', 
-                           'Первое появление', 'Последнее появление', 'Количество'])
-            
-            for module, errors in self.loaded_errors.items():
-                for error in errors:
-                    error_data = self.error_database.get(error["code"], {})
-                    writer.writerow([
-                        self.get_module_name(module),
-                        error["code"],
-                        self.get_status_text(error["status"]),
-                        error_data.get('description', 'Неизвестная ошибка'),
-                        self.get_severity_text(error_data.get('severity', 'UNKNOWN')),
-                        error["first_occurrence"],
-                        error["last_occurrence"],
-                        error["count"]
-                    ])
+        write_errors_csv(filename, self.loaded_errors, self.error_database)
                     
     def save_errors_txt(self, filename):
         """Сохранение ошибок в текстовом формате"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("ОТЧЕТ О ДИАГНОСТИЧЕСКИХ ОШИБКАХ\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Автомобиль: Chevrolet Niva\n")
-            f.write(f"Дата и время: {QDateTime.currentDateTime().toString('dd.MM.yyyy HH:mm:ss')}\n")
-            f.write(f"Всего ошибок: {self.count_total_errors()}\n\n")
-            
-            for module, errors in self.loaded_errors.items():
-                if errors:
-                    f.write(f"\n{'-' * 60}\n")
-                    f.write(f"Модуль: {self.get_module_name(module)}\n")
-                    f.write(f"{'-' * 60}\n\n")
-                    
-                    for error in errors:
-                        error_data = self.error_database.get(error["code"], {})
-                        f.write(f"Код: {error['code']}\n")
-                        f.write(f"Статус: {self.get_status_text(error['status'])}\n")
-                        f.write(f"Описание: {error_data.get('description', 'Неизвестная ошибка')}\n")
-                        f.write(f"Приоритет: {self.get_severity_text(error_data.get('severity', 'UNKNOWN'))}\n")
-                        f.write(f"Первое появление: {error['first_occurrence']}\n")
-                        f.write(f"Последнее появление: {error['last_occurrence']}\n")
-                        f.write(f"Количество: {error['count']}\n\n")
+        write_errors_txt(filename, self.loaded_errors, self.error_database)
                         
     def on_load_errors(self):
         """Загрузка ошибок из файла"""
@@ -893,10 +1474,20 @@ class ErrorPanel(QWidget):
         )
         
         if filename:
+            if filename.endswith('.json'):
+                # Разбор JSON может занимать секунды, выполняем его вне GUI потока
+                if self.load_thread and self.load_thread.isRunning():
+                    return
+                    
+                self.load_thread = ErrorImportThread(filename)
+                self.load_thread.import_finished.connect(self.on_errors_file_loaded)
+                self.load_thread.import_failed.connect(self.on_errors_load_failed)
+                self.status_label.setText("Загрузка ошибок...")
+                self.load_thread.start()
+                return
+                
             try:
-                if filename.endswith('.json'):
-                    self.load_errors_json(filename)
-                elif filename.endswith('.csv'):
+                if filename.endswith('.csv'):
                     self.load_errors_csv(filename)
                 elif filename.endswith('.txt'):
                     self.load_errors_txt(filename)
@@ -905,25 +1496,105 @@ class ErrorPanel(QWidget):
                 self.status_label.setText(f"Ошибки загружены из {filename}")
                 
             except Exception as e:
-                QMessageBox.critical(self, "Ошибка", f"Не удалось загрузить файл: {str(e)}")
+                self.on_errors_load_failed(str(e))
                 
+    def on_errors_file_loaded(self, filename, loaded_errors):
+        """Завершение фоновой загрузки ошибок"""
+        self.set_loaded_errors(loaded_errors)
+        self.update_error_table()
+        self.status_label.setText(f"Ошибки загружены из {filename}")
+        
+    def on_errors_load_failed(self, error):
+        """Ошибка загрузки ошибок"""
+        self.status_label.setText("Ошибка загрузки")
+        QMessageBox.critical(self, "Ошибка", f"Не удалось загрузить файл: {error}")
+        
+    def set_loaded_errors(self, loaded_errors):
+        """Замена загруженных ошибок с перестроением индекса кодов"""
+        self.loaded_errors = loaded_errors
+        self._total_errors = None
+        self._code_index = {(module, error.code): error
+                            for module, errors in loaded_errors.items()
+                            for error in errors}
+        
     def load_errors_json(self, filename):
         """Загрузка ошибок из JSON файла"""
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        if "errors" in data:
-            self.loaded_errors = data["errors"]
+        loaded = read_errors_json(filename)
+        if loaded is not None:
+            self.set_loaded_errors(loaded)
             
     def load_errors_csv(self, filename):
         """Загрузка ошибок из CSV файла"""
-        # Упрощенная реализация
-        pass
+        loaded = {}
+        with open(filename, 'r', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            reader = csv.reader(f, delimiter=';')
+            next(reader, None)  # Заголовок
+            
+            batch = []
+            for row in reader:
+                batch.append(row)
+                if len(batch) >= CSV_BATCH_SIZE:
+                    self._ingest_csv_batch(batch, loaded)
+                    batch.clear()
+            if batch:
+                self._ingest_csv_batch(batch, loaded)
+                
+        self.set_loaded_errors(loaded)
+        
+    def _ingest_csv_batch(self, batch, loaded):
+        """Разбор пачки строк CSV отчета в записи ошибок"""
+        get_module = _MODULES_BY_NAME.get
+        get_status = _STATUSES_BY_TEXT.get
+        
+        # Сначала группируем пачку локально, затем одним extend на модуль
+        grouped = {}
+        for row in batch:
+            if len(row) < 8:
+                continue
+            module_name, code, status_text = row[0], row[1], row[2]
+            grouped.setdefault(get_module(module_name, module_name), []).append(LoadedError(
+                code=sys.intern(code),
+                status=get_status(status_text, status_text),
+                first_occurrence=row[5],
+                last_occurrence=row[6],
+                count=int(row[7]) if row[7].isdigit() else 0,
+                freeze_frame={}
+            ))
+            
+        for module, errors in grouped.items():
+            loaded.setdefault(module, []).extend(errors)
         
     def load_errors_txt(self, filename):
         """Загрузка ошибок из текстового файла"""
-        # Упрощенная реализация
-        pass
+        get_module = _MODULES_BY_NAME.get
+        get_status = _STATUSES_BY_TEXT.get
+        
+        loaded = {}
+        errors = None
+        fields = {}
+        with open(filename, 'r', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            for line in f:
+                key, sep, value = line.rstrip('\n').partition(': ')
+                if not sep:
+                    continue
+                if key == "Модуль":
+                    errors = loaded.setdefault(get_module(value, value), [])
+                elif errors is not None:
+                    fields[key] = value
+                    # "Количество" - последнее поле записи об ошибке
+                    if key == "Количество":
+                        status_text = fields.get("Статус", "")
+                        errors.append(LoadedError(
+                            code=fields.get("Код", ""),
+                            status=get_status(status_text, status_text),
+                            first_occurrence=fields.get("Первое появление", ""),
+                            last_occurrence=fields.get("Последнее появление", ""),
+                            count=int(value) if value.isdigit() else 0,
+                            freeze_frame={}
+                        ))
+                        fields = {}
+                        
+        self.set_loaded_errors(loaded)
         
     def on_print_report(self):
         """Печать отчета об ошибках"""
@@ -948,41 +1619,26 @@ class ErrorPanel(QWidget):
         
     def filter_errors_by_ecu(self, ecu):
         """Фильтрация ошибок по выбранному ECU"""
-        if ecu == "ALL" or not self.loaded_errors:
-            self.update_error_table()
-        else:
-            # Фильтруем и показываем только ошибки выбранного модуля
-            self.error_table.setRowCount(0)
-            
-            if ecu in self.loaded_errors:
-                errors = self.loaded_errors[ecu]
-                for error in errors:
-                    self.add_error_to_table(error, ecu)
-                    
-            # Обновление заголовка
-            error_count = len(self.loaded_errors.get(ecu, []))
-            module_name = self.get_module_name(ecu)
-            self.error_count_label.setText(f"{module_name}: {error_count} ошибок")
+        # Фильтр применяется моделью по маске модулей, без перестроения строк
+        self.begin_table_update()
+        try:
+            self.error_model.set_module_filter(None if ecu == "ALL" else ecu)
+        finally:
+            self.end_table_update()
             
+        self.update_error_count_label()
+        
     def add_error_to_table(self, error, module):
         """Добавление ошибки в таблицу"""
-        row = self.error_table.rowCount()
-        self.error_table.insertRow(row)
-        
-        color = self.get_error_color(error["status"])
-        
-        # Модуль
-        module_item = QTableWidgetItem(self.get_module_name(module))
-        module_item.setBackground(color)
-        self.error_table.setItem(row, 0, module_item)
-        
-        # Код ошибки
-        code_item = QTableWidgetItem(error["code"])
-        code_item.setBackground(color)
-        self.error_table.setItem(row, 1, code_item)
+        self.add_errors_to_table([error], module)
         
-        # Остальные столбцы аналогично update_error_table()
-        # ... (полная реализация)
+    def add_errors_to_table(self, errors, module):
+        """Добавление ошибок модуля в таблицу одной вставкой"""
+        self.begin_table_update()
+        try:
+            self.error_model.append_rows([(module, error) for error in errors])
+        finally:
+            self.end_table_update()
         
     def show_table_context_menu(self, position):
         """Показать контекстное меню таблицы"""
@@ -1019,35 +1675,31 @@ class ErrorPanel(QWidget):
         
     def copy_error_code(self):
         """Копирование кода ошибки в буфер обмена"""
-        selected_items = self.error_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            error_code = self.error_table.item(row, 1).text()
+        selected = self.selected_error()
+        if selected:
+            error_code = selected[1].code
             clipboard = QApplication.clipboard()
             clipboard.setText(error_code)
             self.status_label.setText(f"Код ошибки {error_code} скопирован в буфер")
             
     def search_error_in_database(self):
         """Поиск ошибки в базе данных (внешний поиск)"""
-        selected_items = self.error_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            error_code = self.error_table.item(row, 1).text()
+        selected = self.selected_error()
+        if selected:
+            error_code = selected[1].code
             self.status_label.setText(f"Поиск информации по ошибке {error_code}...")
             # Здесь можно реализовать поиск в интернете или расширенной базе
             
     def mark_error_as_checked(self):
         """Пометка ошибки как проверенной"""
-        selected_items = self.error_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            error_code = self.error_table.item(row, 1).text()
+        index = self.error_table.currentIndex()
+        if index.isValid():
+            row = index.row()
+            error_code = self.error_model.row_at(row)[1].code
             
-            # Изменяем цвет строки
-            for col in range(self.error_table.columnCount()):
-                item = self.error_table.item(row, col)
-                if item:
-                    item.setBackground(QColor(200, 255, 200))  # Светло-зеленый
+            # Изменяем цвет строки - делегат перерисует ее за один проход
+            self.error_model.mark_checked(row)
+            self.error_table.viewport().update()
             
             self.status_label.setText(f"Ошибка {error_code} помечена как проверенная")
             
@@ -1058,10 +1710,9 @@ class ErrorPanel(QWidget):
             return
             
         errors_to_export = []
-        for row in selected_rows:
-            error_code = self.error_table.item(row.row(), 1).text()
-            module = self.error_table.item(row.row(), 0).text()
-            errors_to_export.append((module, error_code))
+        for index in selected_rows:
+            module, error = self.error_model.row_at(index.row())
+            errors_to_export.append((self.get_module_name(module), error.code))
         
         # Экспорт выбранных ошибок
         filename, _ = QFileDialog.getSaveFileName(
@@ -1083,30 +1734,27 @@ class ErrorPanel(QWidget):
                 
     def on_test_sensor(self):
         """Тестирование датчика связанного с ошибкой"""
-        selected_items = self.error_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            error_code = self.error_table.item(row, 1).text()
+        selected = self.selected_error()
+        if selected:
+            error_code = selected[1].code
             self.status_label.setText(f"Тестирование датчика для ошибки {error_code}...")
             
             # Здесь будет реализация тестирования датчика
             
     def on_check_wiring(self):
         """Проверка проводки"""
-        selected_items = self.error_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            error_code = self.error_table.item(row, 1).text()
+        selected = self.selected_error()
+        if selected:
+            error_code = selected[1].code
             self.status_label.setText(f"Проверка проводки для ошибки {error_code}...")
             
             # Здесь будет реализация проверки проводки
             
     def on_reset_adaptation(self):
         """Сброс адаптации"""
-        selected_items = self.error_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            error_code = self.error_table.item(row, 1).text()
+        selected = self.selected_error()
+        if selected:
+            error_code = selected[1].code
             
             reply = QMessageBox.question(
                 self,
@@ -1136,33 +1784,45 @@ class ErrorPanel(QWidget):
         """Обновление статуса подключения к ECU"""
         self.ecu_status_label.setText(f"ECU: {status}")
         
-    def add_error(self, module, error_code, status="ACTIVE", count=1):
-        """Добавление ошибки вручную (для тестирования)"""
+    def add_error(self, module, error_code, status="ACTIVE", count=1, bulk=False):
+        """Добавление ошибки вручную (для тестирования)
+        
+        При bulk=True таблица не обновляется - вызывающий код делает
+        update_error_table() один раз после добавления всех ошибок.
+        """
+        now = QDateTime.currentDateTime().toString(_TS_FMT)
+        
         if module not in self.loaded_errors:
             self.loaded_errors[module] = []
             
-        # Проверяем, нет ли уже такой ошибки
-        for error in self.loaded_errors[module]:
-            if error["code"] == error_code:
-                error["count"] += count
-                error["last_occurrence"] = QDateTime.currentDateTime().toString('yyyy-MM-dd HH:mm:ss')
-                if status == "ACTIVE" and error["status"] != "ACTIVE":
-                    error["status"] = status
+        # Проверяем, нет ли уже такой ошибки (по индексу, без перебора списка)
+        error = self._code_index.get((module, error_code))
+        if error is not None:
+            error.count += count
+            error.last_occurrence = now
+            if status == "ACTIVE" and error.status != "ACTIVE":
+                error.status = status
+            if not bulk:
                 self.update_error_table()
-                return
-                
+            return
+            
         # Добавляем новую ошибку
-        new_error = {
-            "code": error_code,
-            "status": status,
-            "first_occurrence": QDateTime.currentDateTime().toString('yyyy-MM-dd HH:mm:ss'),
-            "last_occurrence": QDateTime.currentDateTime().toString('yyyy-MM-dd HH:mm:ss'),
-            "count": count,
-            "freeze_frame": {}
-        }
+        new_error = LoadedError(
+            code=error_code,
+            status=status,
+            first_occurrence=now,
+            last_occurrence=now,
+            count=count,
+            freeze_frame={}
+        )
         
         self.loaded_errors[module].append(new_error)
-        self.update_error_table()
+        self._code_index[(module, error_code)] = new_error
+        if bulk:
+            # Счетчик пересчитается лениво в count_total_errors()
+            self._total_errors = None
+        else:
+            self.update_error_table()
         
     def clear_all(self):
         """Полная очистка всех ошибок"""
@@ -1173,23 +1833,38 @@ class ErrorPanel(QWidget):
         
     def get_error_summary(self):
         """Получение сводки по ошибкам"""
+        get_data = self.error_database.get
+        all_errors = [error for errors in self.loaded_errors.values() for error in errors]
+        severity_counter = Counter(get_data(error.code, _EMPTY).get("severity", "UNKNOWN")
+                                   for error in all_errors)
+        status_counter = Counter(error.status for error in all_errors)
+        
         summary = {
             "total": self.count_total_errors(),
-            "by_module": {},
-            "by_severity": {"HIGH": 0, "MEDIUM": 0, "LOW": 0, "INFO": 0},
-            "by_status": {"ACTIVE": 0, "PENDING": 0, "PERMANENT": 0}
+            "by_module": {module: len(errors) for module, errors in self.loaded_errors.items()},
+            "by_severity": {key: severity_counter.get(key, 0) for key in ("HIGH", "MEDIUM", "LOW", "INFO")},
+            "by_status": {key: status_counter.get(key, 0) for key in ("ACTIVE", "PENDING", "PERMANENT")}
         }
         
-        for module, errors in self.loaded_errors.items():
-            summary["by_module"][module] = len(errors)
+        return summary
+        
+    def shutdown(self):
+        """Остановка фоновых потоков панели (повторный вызов безопасен)"""
+        if self.database_thread and self.database_thread.isRunning():
+            self.database_thread.wait()
             
-            for error in errors:
-                error_data = self.error_database.get(error["code"], {})
-                severity = error_data.get("severity", "UNKNOWN")
-                if severity in summary["by_severity"]:
-                    summary["by_severity"][severity] += 1
-                    
-                if error["status"] in summary["by_status"]:
-                    summary["by_status"][error["status"]] += 1
-                    
-        return summary
\ No newline at end of file
+        if self.save_thread and self.save_thread.isRunning():
+            self.save_thread.wait()
+            
+        if self.load_thread and self.load_thread.isRunning():
+            self.load_thread.wait()
+            
+        self._progress_timer.stop()
+        if self.read_thread and self.read_thread.isRunning():
+            self.read_thread.requestInterruption()
+            self.read_thread.wait()
+            
+    def closeEvent(self, event):
+        """Обработка закрытия панели"""
+        self.shutdown()
+        super().closeEvent(event)
\ No newline at end of file
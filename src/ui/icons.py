@@ -0,0 +1,35 @@
+"""
+Иконки приложения
+"""
+
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QIcon, QPixmap
+
+# Иконки собираются в ресурс Qt (pyrcc5 assets/icons.qrc -o src/ui/icons_rc.py),
+# чтобы не обращаться к диску при каждом QIcon. Без собранного модуля
+# используется каталог assets/icons.
+try:
+    import ui.icons_rc  # noqa: F401
+    ICONS_DIR = ":/icons"
+except ImportError:
+    ICONS_DIR = "assets/icons"
+
+# Кэш иконок: одна загрузка PNG на имя
+_ICON_CACHE = {}
+TOOLBAR_ICON_SIZE = QSize(24, 24)
+
+
+def get_icon(name):
+    """Получение иконки из кэша"""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = QIcon()
+        pixmap = QPixmap(f"{ICONS_DIR}/{name}.png")
+        if not pixmap.isNull():
+            icon.addPixmap(pixmap)
+            # Готовый вариант под размер панели инструментов, чтобы не масштабировать при отрисовке
+            if pixmap.size() != TOOLBAR_ICON_SIZE:
+                icon.addPixmap(pixmap.scaled(TOOLBAR_ICON_SIZE, Qt.KeepAspectRatio,
+                                             Qt.SmoothTransformation))
+        _ICON_CACHE[name] = icon
+    return icon
\ No newline at end of file
@@ -5,22 +5,33 @@
 
 import sys
 import os
+import math
+import random
+import time
 from datetime import datetime
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
                             QGroupBox, QLabel, QPushButton, QComboBox, 
                             QCheckBox, QSpinBox, QDoubleSpinBox, QTabWidget,
-                            QTableWidget, QTableWidgetItem, QHeaderView,
+                            QTableView, QHeaderView,
                             QSplitter, QFileDialog, QMessageBox, QScrollArea,
-                            QFrame, QProgressBar, QToolButton, QMenu, QAction)
+                            QFrame, QProgressBar, QToolButton, QMenu, QAction,
+                            QApplication)
 from PyQt5.QtCore import (Qt, QTimer, QThread, pyqtSignal, pyqtSlot, 
-                         QDateTime, QSettings, QSize)
+                         QDateTime, QSettings, QSize, QAbstractTableModel,
+                         QModelIndex)
 from PyQt5.QtGui import (QFont, QColor, QPen, QBrush, QLinearGradient,
-                        QPainter, QIcon, QPalette)
+                        QPainter, QPalette, QStandardItem,
+                        QStandardItemModel)
 import pyqtgraph as pg
 import numpy as np
-from collections import deque
+from collections import defaultdict
+from collections.abc import Mapping
 import json
 import csv
+import functools
+from operator import methodcaller
+import threading
+from contextlib import contextmanager
 
 from ui.widgets.gauges import (CircularGauge, LinearGauge, DigitalGauge,
                               TachometerGauge, SpeedometerGauge, TemperatureGauge,
@@ -29,9 +40,678 @@ from ui.widgets.charts import (RealTimeChart, HistoricalChart,
                               ScatterPlot, BarChart)
 from ui.widgets.indicators import (LEDIndicator, StatusIndicator, 
                                   WarningLight, ValueIndicator)
+from ui.icons import get_icon
 from utils.helpers import format_value, color_gradient
 from utils.logger import get_logger
 
+# Буфер файла записи и период сброса буфера на диск (с)
+RECORDING_BUFFER_SIZE = 1024 * 1024
+RECORDING_FLUSH_INTERVAL = 1.0
+
+# Минимальный интервал между сообщениями о размере файла записи (с)
+RECORDING_SIZE_INTERVAL = 0.5
+
+# Период обновления таблицы значений (мс), независимо от частоты опроса
+TABLE_REFRESH_INTERVAL = 500
+
+# Минимальный интервал между обновлениями статусной панели (нс)
+STATUS_REFRESH_INTERVAL = 1_000_000_000
+
+# Число точек сводки всей истории для вкладки "История"
+HISTORY_SUMMARY_CAPACITY = 1024
+
+# Цвета индикаторов (создаются один раз и переиспользуются)
+_COLOR_RED = QColor(255, 0, 0)
+_COLOR_GREEN = QColor(0, 255, 0)
+_COLOR_ORANGE = QColor(255, 165, 0)
+_COLOR_YELLOW = QColor(255, 255, 0)
+
+# Диапазоны тестовых значений по PID (для оборотов - шум вокруг синусоиды)
+_MOCK_RANGES = {
+    '010C': (-50, 50),
+    '010D': (0, 120),
+    '0105': (85, 95),
+    '0111': (0, 30),
+    '0142': (13.5, 14.5),
+    '0110': (5, 20),
+    '010B': (95, 105)
+}
+_MOCK_DEFAULT_RANGE = (0, 100)
+
+# Минимальное изменение значения, заметное на датчике (меньшие изменения не перерисовываются)
+_GAUGE_RESOLUTION = {
+    '010C': 50,      # об/мин
+    '010D': 1,       # км/ч
+    '0105': 0.5,     # °C
+    '0111': 0.5,     # %
+    '0142': 0.05,    # V
+    '0110': 0.5,     # г/с
+    '010B': 1        # кПа
+}
+_DEFAULT_RESOLUTION = 0.5
+
+# Стандартные PID (если нет config/pid_list.json)
+DEFAULT_PIDS = [
+    {"name": "Обороты двигателя", "pid": "010C", "unit": "об/мин"},
+    {"name": "Скорость", "pid": "010D", "unit": "км/ч"},
+    {"name": "Температура ОЖ", "pid": "0105", "unit": "°C"},
+    {"name": "Положение дросселя", "pid": "0111", "unit": "%"},
+    {"name": "Напряжение", "pid": "0142", "unit": "V"},
+    {"name": "Расход воздуха", "pid": "0110", "unit": "г/с"},
+    {"name": "Давление в коллекторе", "pid": "010B", "unit": "кПа"},
+    {"name": "Температура впускного воздуха", "pid": "010F", "unit": "°C"},
+    {"name": "Угол опережения", "pid": "010E", "unit": "град"},
+    {"name": "Долговременная коррекция топлива", "pid": "0107", "unit": "%"},
+    {"name": "Кратковременная коррекция топлива", "pid": "0106", "unit": "%"},
+    {"name": "Давление топлива", "pid": "010A", "unit": "кПа"},
+    {"name": "Уровень топлива", "pid": "012F", "unit": "%"},
+    {"name": "Пробег", "pid": "0131", "unit": "км"},
+    {"name": "Температура масла", "pid": "015C", "unit": "°C"},
+    {"name": "Абсолютное давление", "pid": "0133", "unit": "кПа"},
+]
+
+
+def _pid_display_text(pid_info):
+    """Текст пункта списка PID"""
+    return f"{pid_info.get('name', '')} ({pid_info.get('pid', '')}) - {pid_info.get('unit', '')}"
+
+
+# Готовые пункты списка PID: (текст, данные пункта)
+DEFAULT_PID_ENTRIES = tuple((_pid_display_text(info), info) for info in DEFAULT_PIDS)
+
+
+@functools.lru_cache(maxsize=1)
+def load_pid_entries(config_path, mtime):
+    """Пункты списка PID из файла конфигурации (mtime - ключ кэша)"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        pid_data = json.load(f)
+        
+    entries = []
+    for category, pids in pid_data.items():
+        entries.append((f"--- {category} ---", None))
+        for pid_info in pids:
+            entries.append((_pid_display_text(pid_info), pid_info))
+    return tuple(entries)
+
+
+_isoformat = methodcaller('isoformat')
+
+
+def iso_timestamps(stamps):
+    """Строки ISO 8601 для массива настенного времени (с от эпохи)"""
+    return list(map(_isoformat, map(datetime.fromtimestamp, stamps.tolist())))
+
+
+class HistoryRing:
+    """Кольцевой буфер истории параметров на NumPy
+    
+    Строка массива соответствует PID, столбец - кадру по модулю емкости.
+    Запись кадра - O(1) без сдвига и перераспределения памяти. Значения
+    хранятся в float64, чтобы экспорт и запись отдавали их без потери точности.
+    
+    Статистика за всё время (минимум, максимум, сумма, число значений)
+    хранится массивами по тем же строкам и обновляется для всего кадра
+    несколькими операциями NumPy.
+    """
+    
+    def __init__(self, capacity, pid_capacity=16):
+        self.capacity = capacity
+        self.values = np.full((pid_capacity, capacity), np.nan, np.float64)
+        self.timestamps = np.empty(capacity, np.int64)
+        self.pid_rows = {}
+        self.write = 0
+        self.stat_min = np.full(pid_capacity, np.inf)
+        self.stat_max = np.full(pid_capacity, -np.inf)
+        self.stat_sum = np.zeros(pid_capacity)
+        self.stat_count = np.zeros(pid_capacity, np.int64)
+        # Буфер читается потоком записи, поэтому запись и чтение идут под блокировкой
+        self.lock = threading.Lock()
+        
+    def __len__(self):
+        return min(self.write, self.capacity)
+        
+    def row(self, pid):
+        """Номер строки PID (новые PID получают следующую свободную строку)"""
+        row = self.pid_rows.get(pid)
+        if row is None:
+            row = len(self.pid_rows)
+            if row == self.values.shape[0]:
+                self._grow(row * 2)
+            self.pid_rows[pid] = row
+        return row
+        
+    def _grow(self, pid_capacity):
+        """Расширение массивов значений и статистики до pid_capacity строк"""
+        rows = self.values.shape[0]
+        grown = np.full((pid_capacity, self.capacity), np.nan, np.float64)
+        grown[:rows] = self.values
+        self.values = grown
+        
+        for name, fill in (('stat_min', np.inf), ('stat_max', -np.inf),
+                           ('stat_sum', 0), ('stat_count', 0)):
+            old = getattr(self, name)
+            stat = np.full(pid_capacity, fill, old.dtype)
+            stat[:rows] = old
+            setattr(self, name, stat)
+        
+    def append(self, data, timestamp):
+        """Запись кадра {pid: значение}"""
+        with self.lock:
+            slot = self.write % self.capacity
+            # PID, отсутствующие в кадре, остаются NaN
+            self.values[:, slot] = np.nan
+            rows = [self.row(pid) for pid in data]  # может расширить массивы
+            self.values[rows, slot] = list(data.values())
+            self.timestamps[slot] = timestamp
+            self.write += 1
+            
+            # Статистика по столбцу кадра; fmin/fmax пропускают NaN отсутствующих PID
+            used = len(self.pid_rows)
+            column = self.values[:used, slot]
+            present = ~np.isnan(column)
+            np.fmin(self.stat_min[:used], column, out=self.stat_min[:used])
+            np.fmax(self.stat_max[:used], column, out=self.stat_max[:used])
+            np.add(self.stat_sum[:used], column, out=self.stat_sum[:used], where=present)
+            self.stat_count[:used] += present
+            
+    def stats(self, pid):
+        """Статистика PID {'min', 'max', 'sum', 'count'} (None - PID не встречался)"""
+        row = self.pid_rows.get(pid)
+        if row is None:
+            return None
+        return {'min': float(self.stat_min[row]), 'max': float(self.stat_max[row]),
+                'sum': float(self.stat_sum[row]), 'count': int(self.stat_count[row])}
+            
+    def snapshot(self, since, pids):
+        """Копия кадров с номера since до текущего для списка PID
+        
+        Возвращает (новая позиция, отметки времени, значения [PID x кадры]).
+        Данные копируются не более чем двумя непрерывными срезами - до и
+        после точки переноса кольца.
+        """
+        with self.lock:
+            write = self.write
+            if since > write:
+                # Буфер был очищен - читаем с начала
+                since = 0
+            # Кадры, уже перезаписанные по кругу, потеряны
+            since = max(since, write - self.capacity)
+            count = write - since
+            if not count:
+                return write, None, None
+                
+            start = since % self.capacity
+            first = min(count, self.capacity - start)
+            rest = count - first
+            
+            timestamps = np.empty(count, np.int64)
+            timestamps[:first] = self.timestamps[start:start + first]
+            timestamps[first:] = self.timestamps[:rest]
+            
+            values = np.full((len(pids), count), np.nan, np.float64)
+            for i, pid in enumerate(pids):
+                row = self.pid_rows.get(pid)
+                if row is not None:
+                    values[i, :first] = self.values[row, start:start + first]
+                    values[i, first:] = self.values[row, :rest]
+                    
+        return write, timestamps, values
+        
+    def clear(self):
+        """Очистка буфера"""
+        with self.lock:
+            self.values.fill(np.nan)
+            self.pid_rows.clear()
+            self.write = 0
+            self.stat_min.fill(np.inf)
+            self.stat_max.fill(-np.inf)
+            self.stat_sum.fill(0)
+            self.stat_count.fill(0)
+
+
+class HistoryStats(Mapping):
+    """Статистика буфера истории в виде словаря {pid: {'min', 'max', 'sum', 'count'}}
+    
+    Словари строятся при обращении из массивов HistoryRing; порядок PID -
+    порядок их первого появления.
+    """
+    
+    def __init__(self, history):
+        self.history = history
+        
+    def __getitem__(self, pid):
+        stats = self.history.stats(pid)
+        if stats is None:
+            raise KeyError(pid)
+        return stats
+        
+    def __iter__(self):
+        return iter(list(self.history.pid_rows))
+        
+    def __len__(self):
+        return len(self.history.pid_rows)
+
+
+class StretchedHistory:
+    """Прореженная сводка всей истории в памяти фиксированного размера
+    
+    Сохраняется каждый stride-й кадр. Когда буфер заполняется, каждая
+    вторая точка отбрасывается, а шаг удваивается - точки остаются
+    равномерно распределенными по всему времени записи. Прием кадра - O(1)
+    амортизированно, без прореживания всей истории при каждой отрисовке.
+    """
+    
+    def __init__(self, capacity, pid_capacity=16):
+        self.capacity = capacity
+        self.values = np.full((pid_capacity, capacity), np.nan, np.float64)
+        self.timestamps = np.empty(capacity, np.int64)
+        self.pid_rows = {}
+        self.count = 0
+        self.stride = 1
+        self.skipped = 0
+        # Номер изменения сводки - график перерисовывается только при его смене
+        self.version = 0
+        
+    def __len__(self):
+        return self.count
+        
+    def row(self, pid):
+        """Номер строки PID (новые PID получают следующую свободную строку)"""
+        row = self.pid_rows.get(pid)
+        if row is None:
+            row = len(self.pid_rows)
+            if row == self.values.shape[0]:
+                grown = np.full((row * 2, self.capacity), np.nan, np.float64)
+                grown[:row] = self.values
+                self.values = grown
+            self.pid_rows[pid] = row
+        return row
+        
+    def ingest(self, data, timestamp):
+        """Прием кадра {pid: значение}"""
+        self.skipped += 1
+        if self.skipped < self.stride:
+            return
+        self.skipped = 0
+        
+        if self.count == self.capacity:
+            # Растяжение: остается каждая вторая точка, шаг удваивается
+            half = self.capacity // 2
+            self.values[:, :half] = self.values[:, 0::2]
+            self.values[:, half:] = np.nan
+            self.timestamps[:half] = self.timestamps[0::2]
+            self.count = half
+            self.stride *= 2
+            
+        slot = self.count
+        for pid, value in data.items():
+            row = self.row(pid)  # может расширить self.values
+            self.values[row, slot] = value
+        self.timestamps[slot] = timestamp
+        self.count += 1
+        self.version += 1
+        
+    def snapshot(self):
+        """Отметки времени и значения {pid: массив} сводки (копии)"""
+        count = self.count
+        values = {pid: self.values[row, :count].copy() for pid, row in self.pid_rows.items()}
+        return self.timestamps[:count].copy(), values
+        
+    def clear(self):
+        """Очистка сводки"""
+        self.values.fill(np.nan)
+        self.pid_rows.clear()
+        self.count = 0
+        self.stride = 1
+        self.skipped = 0
+        self.version += 1
+
+
+class RecordingWorker(QThread):
+    """Поток записи кадров данных в CSV файл
+    
+    Кадры берутся прямо из кольцевого буфера истории панели: GUI поток
+    только будит поток записи, копирование, форматирование и работа
+    с диском выполняются здесь.
+    """
+    
+    write_failed = pyqtSignal(str)
+    bytes_written_changed = pyqtSignal(int)
+    frames_dropped = pyqtSignal(int)
+    
+    def __init__(self, filename, history, pids, wall_epoch, mono_epoch):
+        super().__init__()
+        self.filename = filename
+        self.history = history
+        # Порядок столбцов фиксируется на время записи
+        self.pids = tuple(pids)
+        self.wall_epoch = wall_epoch
+        self.mono_epoch = mono_epoch
+        # Записываются только кадры, поступившие после начала записи
+        self.position = history.write
+        # Кадры, перезаписанные в кольце до того, как поток успел их прочитать
+        self.dropped = 0
+        self.wakeup = threading.Event()
+        self.stopping = False
+        # Все значения числовые - строка собирается одним %-форматированием без csv
+        self.row_format = ",".join(["%s"] + ["%.3f"] * len(self.pids)) + "\r\n"
+        
+    def notify(self):
+        """Сообщение о новых кадрах в буфере"""
+        self.wakeup.set()
+        
+    def stop(self):
+        """Завершение записи после сброса оставшихся кадров"""
+        self.stopping = True
+        self.wakeup.set()
+        
+    def format_rows(self, timestamps, values):
+        """Строки CSV для блока кадров"""
+        stamps = self.wall_epoch + (timestamps - self.mono_epoch) / 1e9
+        missing = np.isnan(values).any(axis=0)
+        row_format = self.row_format
+        
+        lines = []
+        for iso, row, has_missing in zip(iso_timestamps(stamps), values.T.tolist(), missing.tolist()):
+            if has_missing:
+                # Пропущенные значения пишутся пустыми полями
+                fields = ["" if value != value else "%.3f" % value for value in row]
+                lines.append(",".join([iso] + fields) + "\r\n")
+            else:
+                lines.append(row_format % (iso, *row))
+        return "".join(lines).encode()
+        
+    def run(self):
+        """Запись новых кадров из буфера истории"""
+        try:
+            with open(self.filename, 'wb', buffering=RECORDING_BUFFER_SIZE) as f:
+                header = (",".join(("Timestamp",) + self.pids) + "\r\n").encode()
+                f.write(header)
+                written = len(header)
+                
+                pending = False
+                last_report = 0
+                reported_dropped = 0
+                last_flush = time.monotonic()
+                while True:
+                    # Ожидание с таймаутом: при остановке опроса накопленные
+                    # строки все равно сбрасываются на диск не позже чем через секунду
+                    self.wakeup.wait(RECORDING_FLUSH_INTERVAL)
+                    self.wakeup.clear()
+                    # Флаг читается до снимка, чтобы последний снимок включил все кадры
+                    finished = self.stopping
+                    
+                    since = self.position
+                    self.position, timestamps, values = self.history.snapshot(since, self.pids)
+                    # После очистки буфера снимок читается с начала
+                    if since > self.position:
+                        since = 0
+                    received = 0 if timestamps is None else len(timestamps)
+                    self.dropped += self.position - since - received
+                    if timestamps is not None:
+                        data = self.format_rows(timestamps, values)
+                        f.write(data)
+                        written += len(data)
+                        pending = True
+                        
+                    now = time.monotonic()
+                    if finished or now - last_report >= RECORDING_SIZE_INTERVAL:
+                        self.bytes_written_changed.emit(written)
+                        if self.dropped != reported_dropped:
+                            self.frames_dropped.emit(self.dropped)
+                            reported_dropped = self.dropped
+                        last_report = now
+                    if finished:
+                        break
+                        
+                    # Сброс на диск не чаще раза в секунду при любой частоте опроса,
+                    # но и не реже - при сбое теряется не больше секунды записи
+                    if pending and now - last_flush >= RECORDING_FLUSH_INTERVAL:
+                        f.flush()
+                        pending = False
+                        last_flush = now
+                        
+        except Exception as e:
+            self.write_failed.emit(str(e))
+
+
+class ExportThread(QThread):
+    """Поток сохранения истории параметров в файл
+    
+    Получает снимок истории, сделанный в потоке интерфейса
+    (LiveDataPanel.history_snapshot), поэтому опрос и запись в буфер
+    продолжаются во время сохранения.
+    """
+    
+    export_finished = pyqtSignal(str)
+    export_failed = pyqtSignal(str)
+    
+    def __init__(self, filename, format_type, snapshot):
+        super().__init__()
+        self.filename = filename
+        self.format_type = format_type
+        self.snapshot = snapshot
+        
+    def run(self):
+        """Запись файла"""
+        try:
+            if self.format_type == 'csv':
+                self.write_csv()
+            elif self.format_type == 'json':
+                self.write_json()
+            elif self.format_type == 'excel':
+                self.write_excel()
+            else:
+                raise ValueError(f"Неизвестный формат сохранения: {self.format_type}")
+                
+            self.export_finished.emit(self.filename)
+            
+        except ImportError:
+            self.export_failed.emit("Для сохранения в Excel установите библиотеку pandas и openpyxl")
+        except Exception as e:
+            self.export_failed.emit(str(e))
+            
+    def write_csv(self):
+        """Сохранение в CSV"""
+        snapshot = self.snapshot
+        with open(self.filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            
+            # Заголовок
+            writer.writerow(['Timestamp'] + snapshot['names'])
+            
+            # Данные: массив снимка переводится в списки Python один раз,
+            # NaN (нет значения в кадре) пишется пустой ячейкой
+            for iso, frame in zip(iso_timestamps(snapshot['times']), snapshot['values'].T.tolist()):
+                row = [iso]
+                row += ['' if value != value else value for value in frame]
+                writer.writerow(row)
+                
+    def write_json(self):
+        """Сохранение в JSON"""
+        snapshot = self.snapshot
+        data = {
+            'metadata': {
+                'export_time': datetime.now().isoformat(),
+                'parameters_count': len(snapshot['pids']),
+                'data_points': len(snapshot['times'])
+            },
+            'parameters': {},
+            'data': []
+        }
+        
+        # Параметры
+        for pid, name, unit, history in zip(snapshot['pids'], snapshot['names'],
+                                            snapshot['units'], snapshot['stats']):
+            data['parameters'][pid] = {
+                'name': name,
+                'unit': unit,
+                'min': history['min'],
+                'max': history['max'],
+                'average': history['sum'] / history['count'] if history['count'] > 0 else 0
+            }
+            
+        # Данные
+        pids = snapshot['pids']
+        for iso, frame in zip(iso_timestamps(snapshot['times']), snapshot['values'].T.tolist()):
+            entry = {'timestamp': iso}
+            entry.update((pid, value) for pid, value in zip(pids, frame) if value == value)
+            data['data'].append(entry)
+            
+        with open(self.filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            
+    def write_excel(self):
+        """Сохранение в Excel"""
+        import pandas as pd
+        
+        snapshot = self.snapshot
+        data_dict = {'Timestamp': iso_timestamps(snapshot['times'])}
+        for name, row in zip(snapshot['names'], snapshot['values']):
+            # NaN (нет значения в кадре) pandas запишет пустой ячейкой
+            data_dict[name] = row
+            
+        pd.DataFrame(data_dict).to_excel(self.filename, index=False)
+
+
+class LiveDataModel(QAbstractTableModel):
+    """Модель таблицы значений: строка на PID, ячейки форматируются при запросе
+    
+    Модель хранит только последние значения и ссылку на статистику панели;
+    текст строится в data() лишь для видимых ячеек, обновление кадра -
+    один сигнал dataChanged.
+    """
+    
+    HEADERS = ["Параметр", "Текущее значение", "Минимум", "Максимум", "Среднее", "Единицы"]
+    
+    def __init__(self, stats, parent=None):
+        super().__init__(parent)
+        self._stats = stats
+        self._rows = []  # (pid, имя, единицы)
+        self._row_index = {}  # pid -> номер строки
+        self._values = {}
+        self._sort_column = None
+        self._sort_order = Qt.AscendingOrder
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        if role == Qt.DisplayRole:
+            return self._display(self._rows[index.row()], index.column())
+        if role == Qt.TextAlignmentRole and 1 <= index.column() <= 4:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+        
+    def has_row(self, pid):
+        """Есть ли в таблице строка PID"""
+        return pid in self._row_index
+        
+    def append_rows(self, rows):
+        """Добавление строк (pid, имя, единицы) в конец таблицы одной вставкой"""
+        if not rows:
+            return
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row + len(rows) - 1)
+        self._rows.extend(rows)
+        self._row_index.update((pid, row + i) for i, (pid, _, _) in enumerate(rows))
+        self.endInsertRows()
+        if self._sort_column is not None:
+            # Новые строки встают на свои места в текущей сортировке
+            self.sort(self._sort_column, self._sort_order)
+        
+    def set_values(self, data):
+        """Новые значения кадра {pid: значение}"""
+        self._values.update(data)
+        rows = [self._row_index[pid] for pid in data if pid in self._row_index]
+        if not rows:
+            return
+        if self._sort_column in (1, 2, 3, 4):
+            # Сортировка по значениям - порядок строк пересчитывается; layoutChanged
+            # и так обновляет все ячейки, отдельный dataChanged не нужен.
+            # Порядок по имени или единицам от значений не зависит
+            self.sort(self._sort_column, self._sort_order)
+            return
+        # Изменились только строки PID кадра - перерисовывается их диапазон
+        self.dataChanged.emit(self.index(min(rows), 1), self.index(max(rows), 4),
+                              [Qt.DisplayRole])
+        
+    def text_rows(self):
+        """Текст всех ячеек таблицы (для копирования и экспорта)"""
+        columns = range(len(self.HEADERS))
+        return [[self._display(row, column) for column in columns] for row in self._rows]
+        
+    def clear(self):
+        """Удаление всех строк"""
+        self.beginResetModel()
+        self._rows = []
+        self._row_index = {}
+        self._values.clear()
+        self.endResetModel()
+        
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Сортировка строк"""
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_pids = [self._rows[index.row()][0] for index in old_indexes]
+        
+        self._sort_column = column
+        self._sort_order = order
+        self._rows.sort(key=lambda row: self._sort_key(row, column),
+                        reverse=order == Qt.DescendingOrder)
+        
+        self._row_index = {row[0]: position for position, row in enumerate(self._rows)}
+        self.changePersistentIndexList(old_indexes, [
+            self.index(self._row_index[pid], index.column())
+            for index, pid in zip(old_indexes, old_pids)
+        ])
+        self.layoutChanged.emit()
+        
+    def _number(self, pid, column):
+        """Числовое значение ячейки (None - значения нет)"""
+        value = self._values.get(pid)
+        if column == 1 or value is None:
+            return value
+        stats = self._stats.get(pid)
+        if not stats or not stats['count']:
+            return value
+        if column == 2:
+            return stats['min']
+        if column == 3:
+            return stats['max']
+        return stats['sum'] / stats['count']
+        
+    def _display(self, row, column):
+        """Текст ячейки"""
+        pid, name, unit = row
+        if column == 0:
+            return name
+        if column == 5:
+            return unit
+        value = self._number(pid, column)
+        return '' if value is None else format_value(value, unit)
+        
+    def _sort_key(self, row, column):
+        """Ключ сортировки строки: числа по значению, текст по алфавиту"""
+        if column == 0:
+            return (0, row[1])
+        if column == 5:
+            return (0, row[2])
+        value = self._number(row[0], column)
+        return (1, 0) if value is None else (0, value)
+
+
 class LiveDataPanel(QWidget):
     """Панель отображения текущих данных в реальном времени"""
     
@@ -45,19 +725,51 @@ class LiveDataPanel(QWidget):
         
         # Данные и состояние
         self.current_data = {}
-        self.historical_data = {}
         self.max_history_points = 1000
+        self.history = HistoryRing(self.max_history_points)
+        # Статистика по PID - представление массивов статистики history
+        self.historical_data = HistoryStats(self.history)
+        # Сводка всей истории для вкладки "История" (окно history - только последние кадры)
+        self.history_summary = StretchedHistory(HISTORY_SUMMARY_CAPACITY)
+        self._summary_shown = -1
         self.sampling_interval = 100  # мс
         self.is_recording = False
         self.recording_start_time = None
+        self._recording_start_ns = 0
         self.recording_file = None
+        self.recording_worker = None
+        self.export_thread = None
         self.selected_pids = []
+        # {pid: (имя, единицы)} из списка PID - заполняется вместе с ним
+        self._pid_info = {}
         
         # Компоненты UI
         self.gauges = {}
+        # Все датчики (основные и динамические) по PID - для обновления одним поиском
+        self._all_gauges = defaultdict(list)
         self.charts = {}
         self.indicators = {}
         
+        # Кадры помечаются time.monotonic_ns(), настенное время восстанавливается по этой паре
+        self._wall_epoch = time.time()
+        self._mono_epoch = time.monotonic_ns()
+        
+        # Значения, последними отправленные датчикам
+        self._last_emitted = {}
+        
+        # Генератор тестовых данных
+        self._rng = np.random.default_rng()
+        # (выбранные PID, PID кадра, нижние и верхние границы) - пересчитывается при смене выбора
+        self._mock_layout = None
+        
+        # Отметка кадра, по которому последний раз обновлялась статусная панель
+        self._status_shown = 0
+        
+        # Последний еще не показанный в таблице кадр
+        self._table_pending = None
+        self.table_timer = QTimer()
+        self.table_timer.setInterval(TABLE_REFRESH_INTERVAL)
+        
         # Поток для сбора данных
         self.data_thread = None
         self.data_timer = QTimer()
@@ -66,6 +778,10 @@ class LiveDataPanel(QWidget):
         self.setup_connections()
         self.load_settings()
         
+        # Страница вкладки не получает closeEvent при выходе из приложения -
+        # запись и сохранение завершаются по сигналу приложения
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
+        
     def init_ui(self):
         """Инициализация пользовательского интерфейса"""
         main_layout = QVBoxLayout(self)
@@ -98,6 +814,7 @@ class LiveDataPanel(QWidget):
         
         # Таймер для обновления данных
         self.data_timer.timeout.connect(self.update_display)
+        self.table_timer.timeout.connect(self.refresh_data_table)
         
     def create_top_panel(self):
         """Создание верхней панели управления"""
@@ -107,7 +824,7 @@ class LiveDataPanel(QWidget):
         
         # Кнопка старт/стоп
         self.start_stop_btn = QPushButton()
-        self.start_stop_btn.setIcon(QIcon("assets/icons/play.png"))
+        self.start_stop_btn.setIcon(get_icon("play"))
         self.start_stop_btn.setText("Старт")
         self.start_stop_btn.setMinimumWidth(100)
         self.start_stop_btn.setCheckable(True)
@@ -115,7 +832,7 @@ class LiveDataPanel(QWidget):
         
         # Кнопка записи
         self.record_btn = QPushButton()
-        self.record_btn.setIcon(QIcon("assets/icons/record.png"))
+        self.record_btn.setIcon(get_icon("record"))
         self.record_btn.setText("Запись")
         self.record_btn.setCheckable(True)
         layout.addWidget(self.record_btn)
@@ -139,28 +856,28 @@ class LiveDataPanel(QWidget):
         
         # Кнопка добавления PID
         self.add_pid_btn = QPushButton()
-        self.add_pid_btn.setIcon(QIcon("assets/icons/add.png"))
+        self.add_pid_btn.setIcon(get_icon("add"))
         self.add_pid_btn.setText("Добавить")
         self.add_pid_btn.clicked.connect(self.add_selected_pid)
         layout.addWidget(self.add_pid_btn)
         
         # Кнопка очистки
         self.clear_btn = QPushButton()
-        self.clear_btn.setIcon(QIcon("assets/icons/clear.png"))
+        self.clear_btn.setIcon(get_icon("clear"))
         self.clear_btn.setText("Очистить")
         self.clear_btn.clicked.connect(self.clear_data)
         layout.addWidget(self.clear_btn)
         
         # Кнопка сохранения
         self.save_btn = QPushButton()
-        self.save_btn.setIcon(QIcon("assets/icons/save.png"))
+        self.save_btn.setIcon(get_icon("save"))
         self.save_btn.setText("Сохранить")
         self.save_btn.clicked.connect(self.save_data)
         layout.addWidget(self.save_btn)
         
         # Кнопка настроек
         settings_btn = QToolButton()
-        settings_btn.setIcon(QIcon("assets/icons/settings.png"))
+        settings_btn.setIcon(get_icon("settings"))
         settings_btn.setText("Настройки")
         settings_btn.setPopupMode(QToolButton.InstantPopup)
         settings_menu = self.create_settings_menu()
@@ -301,6 +1018,12 @@ class LiveDataPanel(QWidget):
         self.map_gauge.setUnit("кПа")
         layout.addWidget(self.map_gauge, 1, 3)
         
+        for pid, gauge in (('010C', self.tachometer), ('010D', self.speedometer),
+                           ('0105', self.coolant_temp_gauge), ('0142', self.voltmeter),
+                           ('0111', self.throttle_gauge), ('0104', self.engine_load_gauge),
+                           ('0110', self.maf_gauge), ('010B', self.map_gauge)):
+            self._all_gauges[pid].append(gauge)
+            
         # Индикаторы состояния
         self.create_status_indicators(layout, 2, 0)
         
@@ -311,32 +1034,32 @@ class LiveDataPanel(QWidget):
         
         # Индикатор проверки двигателя
         self.check_engine_light = WarningLight("Check Engine")
-        self.check_engine_light.setColor(QColor(255, 0, 0))
+        self.check_engine_light.setColor(_COLOR_RED)
         group_layout.addWidget(self.check_engine_light, 0, 0)
         
         # Индикатор ABS
         self.abs_light = WarningLight("ABS")
-        self.abs_light.setColor(QColor(255, 165, 0))
+        self.abs_light.setColor(_COLOR_ORANGE)
         group_layout.addWidget(self.abs_light, 0, 1)
         
         # Индикатор подушек безопасности
         self.airbag_light = WarningLight("Airbag")
-        self.airbag_light.setColor(QColor(255, 0, 0))
+        self.airbag_light.setColor(_COLOR_RED)
         group_layout.addWidget(self.airbag_light, 0, 2)
         
         # Индикатор иммобилайзера
         self.immobilizer_light = WarningLight("Immo")
-        self.immobilizer_light.setColor(QColor(255, 255, 0))
+        self.immobilizer_light.setColor(_COLOR_YELLOW)
         group_layout.addWidget(self.immobilizer_light, 1, 0)
         
         # Индикатор давления масла
         self.oil_pressure_light = WarningLight("Масло")
-        self.oil_pressure_light.setColor(QColor(255, 0, 0))
+        self.oil_pressure_light.setColor(_COLOR_RED)
         group_layout.addWidget(self.oil_pressure_light, 1, 1)
         
         # Индикатор температуры
         self.oil_temp_light = WarningLight("Температура")
-        self.oil_temp_light.setColor(QColor(255, 165, 0))
+        self.oil_temp_light.setColor(_COLOR_ORANGE)
         group_layout.addWidget(self.oil_temp_light, 1, 2)
         
         layout.addWidget(group, row, col, 1, 2)
@@ -352,39 +1075,94 @@ class LiveDataPanel(QWidget):
         self.realtime_chart.setXLabel("Время")
         tabs.addTab(self.realtime_chart, "График")
         
-        # Исторический график
-        self.historical_chart = HistoricalChart()
-        self.historical_chart.setTitle("Исторические данные")
-        tabs.addTab(self.historical_chart, "История")
+        # Исторический график, корреляция и сравнение создаются при первом
+        # открытии вкладки - до этого на их месте пустые заглушки
+        self.historical_chart = None
+        self.scatter_plot = None
+        self.bar_chart = None
+        self._lazy_tabs = {}
+        
+        self.add_lazy_tab(tabs, self.create_historical_chart, "История")
         
         # Таблица значений
         self.data_table = self.create_data_table()
         tabs.addTab(self.data_table, "Таблица")
         
         # Scatter plot
+        self.add_lazy_tab(tabs, self.create_scatter_plot, "Корреляция")
+        
+        # Bar chart
+        self.add_lazy_tab(tabs, self.create_bar_chart, "Сравнение")
+        
+        tabs.currentChanged.connect(self.on_charts_tab_changed)
+        self.charts_tabs = tabs
+        
+        return tabs
+        
+    def add_lazy_tab(self, tabs, factory, label):
+        """Добавление вкладки-заглушки, заменяемой виджетом factory() при первом показе"""
+        index = tabs.addTab(QWidget(), label)
+        self._lazy_tabs[index] = (factory, label)
+        
+    def on_charts_tab_changed(self, index):
+        """Создание графика при первом открытии его вкладки"""
+        lazy = self._lazy_tabs.pop(index, None)
+        if lazy is None:
+            self.refresh_historical_chart()
+            return
+            
+        factory, label = lazy
+        tabs = self.charts_tabs
+        placeholder = tabs.widget(index)
+        
+        # Без блокировки removeTab снова вызвал бы этот слот для соседней вкладки
+        tabs.blockSignals(True)
+        tabs.removeTab(index)
+        tabs.insertTab(index, factory(), label)
+        tabs.setCurrentIndex(index)
+        tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        self.refresh_historical_chart()
+        
+    def refresh_historical_chart(self):
+        """Передача сводки истории графику, если его вкладка открыта"""
+        chart = self.historical_chart
+        if chart is None or self.charts_tabs.currentWidget() is not chart:
+            return
+            
+        summary = self.history_summary
+        if summary.version == self._summary_shown:
+            return
+        self._summary_shown = summary.version
+        
+        timestamps, values = summary.snapshot()
+        chart.set_data(self.wall_time(timestamps), values)
+        
+    def create_historical_chart(self):
+        """Создание исторического графика"""
+        self.historical_chart = HistoricalChart()
+        self.historical_chart.setTitle("Исторические данные")
+        self.historical_chart.range_changed.connect(self.on_history_range_changed)
+        return self.historical_chart
+        
+    def create_scatter_plot(self):
+        """Создание графика корреляции"""
         self.scatter_plot = ScatterPlot()
         self.scatter_plot.setTitle("Корреляция параметров")
-        tabs.addTab(self.scatter_plot, "Корреляция")
+        return self.scatter_plot
         
-        # Bar chart
+    def create_bar_chart(self):
+        """Создание диаграммы сравнения"""
         self.bar_chart = BarChart()
         self.bar_chart.setTitle("Сравнение параметров")
-        tabs.addTab(self.bar_chart, "Сравнение")
-        
-        return tabs
+        return self.bar_chart
         
     def create_data_table(self):
         """Создание таблицы данных"""
-        table = QTableWidget()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "Параметр", 
-            "Текущее значение", 
-            "Минимум", 
-            "Максимум", 
-            "Среднее", 
-            "Единицы"
-        ])
+        self.table_model = LiveDataModel(self.historical_data, self)
+        table = QTableView()
+        table.setModel(self.table_model)
         
         # Настройка внешнего вида
         table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
@@ -427,12 +1205,12 @@ class LiveDataPanel(QWidget):
         
         # Индикатор подключения
         self.connection_indicator = LEDIndicator("Связь")
-        self.connection_indicator.setColor(QColor(255, 0, 0))
+        self.connection_indicator.setColor(_COLOR_RED)
         layout.addWidget(self.connection_indicator)
         
         # Индикатор записи
         self.recording_indicator = LEDIndicator("Запись")
-        self.recording_indicator.setColor(QColor(255, 0, 0))
+        self.recording_indicator.setColor(_COLOR_RED)
         layout.addWidget(self.recording_indicator)
         
         # Счетчик кадров
@@ -471,7 +1249,6 @@ class LiveDataPanel(QWidget):
         
         # Сигналы от графиков
         self.realtime_chart.parameter_selected.connect(self.on_parameter_selected)
-        self.historical_chart.range_changed.connect(self.on_history_range_changed)
         
         # Сигналы от датчиков
         self.data_updated.connect(self.update_all_gauges)
@@ -479,45 +1256,29 @@ class LiveDataPanel(QWidget):
     def load_pid_list(self):
         """Загрузка списка PID из конфигурации"""
         try:
-            # Загрузка из файла конфигурации
             config_path = os.path.join("config", "pid_list.json")
             if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    pid_data = json.load(f)
-                    
-                for category, pids in pid_data.items():
-                    self.pid_combo.addItem(f"--- {category} ---")
-                    for pid_info in pids:
-                        name = pid_info.get('name', '')
-                        pid = pid_info.get('pid', '')
-                        unit = pid_info.get('unit', '')
-                        display_text = f"{name} ({pid}) - {unit}"
-                        self.pid_combo.addItem(display_text, pid_info)
+                # Разобранный файл кэшируется до его изменения
+                entries = load_pid_entries(config_path, os.path.getmtime(config_path))
             else:
-                # Стандартные PID
-                default_pids = [
-                    {"name": "Обороты двигателя", "pid": "010C", "unit": "об/мин"},
-                    {"name": "Скорость", "pid": "010D", "unit": "км/ч"},
-                    {"name": "Температура ОЖ", "pid": "0105", "unit": "°C"},
-                    {"name": "Положение дросселя", "pid": "0111", "unit": "%"},
-                    {"name": "Напряжение", "pid": "0142", "unit": "V"},
-                    {"name": "Расход воздуха", "pid": "0110", "unit": "г/с"},
-                    {"name": "Давление в коллекторе", "pid": "010B", "unit": "кПа"},
-                    {"name": "Температура впускного воздуха", "pid": "010F", "unit": "°C"},
-                    {"name": "Угол опережения", "pid": "010E", "unit": "град"},
-                    {"name": "Долговременная коррекция топлива", "pid": "0107", "unit": "%"},
-                    {"name": "Кратковременная коррекция топлива", "pid": "0106", "unit": "%"},
-                    {"name": "Давление топлива", "pid": "010A", "unit": "кПа"},
-                    {"name": "Уровень топлива", "pid": "012F", "unit": "%"},
-                    {"name": "Пробег", "pid": "0131", "unit": "км"},
-                    {"name": "Температура масла", "pid": "015C", "unit": "°C"},
-                    {"name": "Абсолютное давление", "pid": "0133", "unit": "кПа"},
-                ]
+                entries = DEFAULT_PID_ENTRIES
                 
-                for pid_info in default_pids:
-                    display_text = f"{pid_info['name']} ({pid_info['pid']}) - {pid_info['unit']}"
-                    self.pid_combo.addItem(display_text, pid_info)
-                    
+            # Модель заполняется отдельно от списка и подключается одним вызовом -
+            # без сигнала вставки и перекомпоновки списка на каждый пункт
+            model = QStandardItemModel(self.pid_combo)
+            pid_info_map = {}
+            for display_text, pid_info in entries:
+                item = QStandardItem(display_text)
+                item.setData(pid_info, Qt.UserRole)
+                model.appendRow(item)
+                if isinstance(pid_info, dict):
+                    pid = pid_info.get('pid')
+                    # Как и при поиске по списку, используется первый пункт PID
+                    if pid not in pid_info_map:
+                        pid_info_map[pid] = (pid_info.get('name', pid), pid_info.get('unit', ''))
+            self.pid_combo.setModel(model)
+            self._pid_info = pid_info_map
+            
         except Exception as e:
             self.logger.error(f"Ошибка загрузки PID: {e}")
             
@@ -531,19 +1292,36 @@ class LiveDataPanel(QWidget):
         if not pid_data or isinstance(pid_data, str):
             return
             
-        pid = pid_data.get('pid')
-        name = pid_data.get('name')
+        self.add_selected_pids([pid_data])
         
-        if pid not in self.selected_pids:
-            self.selected_pids.append(pid)
-            
-            # Создание нового датчика
-            self.create_dynamic_gauge(pid, name, pid_data.get('unit', ''))
-            
-            # Добавление в график
-            self.realtime_chart.add_parameter(pid, name, pid_data.get('unit', ''))
-            
-            self.logger.info(f"Добавлен PID: {name} ({pid})")
+    def add_selected_pids(self, pid_list):
+        """Добавление нескольких PID с одной перестройкой компоновки датчиков"""
+        with self.gauges_batch():
+            for pid_data in pid_list:
+                pid = pid_data.get('pid')
+                name = pid_data.get('name')
+                
+                if pid not in self.selected_pids:
+                    self.selected_pids.append(pid)
+                    
+                    # Создание нового датчика
+                    self.create_dynamic_gauge(pid, name, pid_data.get('unit', ''))
+                    
+                    # Добавление в график
+                    self.realtime_chart.add_parameter(pid, name, pid_data.get('unit', ''))
+                    
+                    self.logger.info(f"Добавлен PID: {name} ({pid})")
+                    
+    @contextmanager
+    def gauges_batch(self):
+        """Пакетное добавление датчиков: размер контейнера и перерисовка - один раз на выходе"""
+        self.gauges_container.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.gauges_container.setUpdatesEnabled(True)
+            rows = (len(self.gauges) + 3) // 4
+            self.gauges_container.setMinimumHeight(rows * 200)
             
     def create_dynamic_gauge(self, pid, name, unit):
         """Создание динамического датчика"""
@@ -580,44 +1358,42 @@ class LiveDataPanel(QWidget):
         
         self.gauges_layout.addWidget(gauge, row, col)
         self.gauges[pid] = gauge
-        
-        # Обновление размера контейнера
-        self.gauges_container.setMinimumHeight((row + 1) * 200)
+        self._all_gauges[pid].append(gauge)
         
     def toggle_data_stream(self, enabled):
         """Включение/выключение потока данных"""
         if enabled:
             self.start_data_stream()
-            self.start_stop_btn.setIcon(QIcon("assets/icons/pause.png"))
+            self.start_stop_btn.setIcon(get_icon("pause"))
             self.start_stop_btn.setText("Стоп")
         else:
             self.stop_data_stream()
-            self.start_stop_btn.setIcon(QIcon("assets/icons/play.png"))
+            self.start_stop_btn.setIcon(get_icon("play"))
             self.start_stop_btn.setText("Старт")
             
     def start_data_stream(self):
         """Запуск потока данных"""
         if not self.data_timer.isActive():
             self.data_timer.start(self.sampling_interval)
-            self.connection_indicator.setColor(QColor(0, 255, 0))
+            self.connection_indicator.setColor(_COLOR_GREEN)
             self.logger.info("Поток данных запущен")
             
     def stop_data_stream(self):
         """Остановка потока данных"""
         if self.data_timer.isActive():
             self.data_timer.stop()
-            self.connection_indicator.setColor(QColor(255, 0, 0))
+            self.connection_indicator.setColor(_COLOR_RED)
             self.logger.info("Поток данных остановлен")
             
     def toggle_recording(self, enabled):
         """Включение/выключение записи данных"""
         if enabled:
             self.start_recording()
-            self.record_btn.setIcon(QIcon("assets/icons/stop_record.png"))
+            self.record_btn.setIcon(get_icon("stop_record"))
             self.record_btn.setText("Стоп запись")
         else:
             self.stop_recording()
-            self.record_btn.setIcon(QIcon("assets/icons/record.png"))
+            self.record_btn.setIcon(get_icon("record"))
             self.record_btn.setText("Запись")
             
     def start_recording(self):
@@ -633,16 +1409,19 @@ class LiveDataPanel(QWidget):
             
             self.recording_file = os.path.join(folder, filename)
             
-            # Создание CSV файла
-            with open(self.recording_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                # Заголовок
-                headers = ['Timestamp'] + [pid for pid in self.selected_pids]
-                writer.writerow(headers)
+            # Файл создается и пишется в отдельном потоке
+            self.recording_worker = RecordingWorker(self.recording_file, self.history,
+                                                    self.selected_pids,
+                                                    self._wall_epoch, self._mono_epoch)
+            self.recording_worker.write_failed.connect(self.on_recording_failed)
+            self.recording_worker.bytes_written_changed.connect(self.on_recording_size_changed)
+            self.recording_worker.frames_dropped.connect(self.on_recording_frames_dropped)
+            self.recording_worker.start()
                 
             self.is_recording = True
             self.recording_start_time = datetime.now()
-            self.recording_indicator.setColor(QColor(255, 0, 0))
+            self._recording_start_ns = time.monotonic_ns()
+            self.recording_indicator.setColor(_COLOR_RED)
             self.recording_indicator.blink(True)
             
             self.recording_changed.emit(True)
@@ -656,7 +1435,13 @@ class LiveDataPanel(QWidget):
         """Остановка записи данных"""
         self.is_recording = False
         self.recording_indicator.blink(False)
-        self.recording_indicator.setColor(QColor(255, 0, 0))
+        self.recording_indicator.setColor(_COLOR_RED)
+        
+        if self.recording_worker:
+            # Дописываем оставшиеся в очереди строки
+            self.recording_worker.stop()
+            self.recording_worker.wait()
+            self.recording_worker = None
         
         if self.recording_file:
             # Запись статистики
@@ -665,6 +1450,19 @@ class LiveDataPanel(QWidget):
         self.recording_changed.emit(False)
         self.logger.info("Запись остановлена")
         
+    def on_recording_failed(self, error):
+        """Ошибка записи в файл"""
+        self.logger.error(f"Ошибка записи в файл: {error}")
+        self.record_btn.setChecked(False)
+        
+    def on_recording_frames_dropped(self, total):
+        """Запись не успела прочитать кадры до их перезаписи в буфере истории"""
+        self.logger.warning(f"Запись отстает от опроса, пропущено кадров: {total}")
+        
+    def on_recording_size_changed(self, size):
+        """Обновление размера файла записи"""
+        self.file_size_label.setText(f"Файл: {size / 1024:.1f} KB")
+        
     def save_recording_stats(self):
         """Сохранение статистики записи"""
         try:
@@ -700,7 +1498,7 @@ class LiveDataPanel(QWidget):
         """Обновление отображения данных"""
         try:
             # Имитация получения данных (в реальном приложении здесь будет работа с ELM327)
-            current_time = datetime.now()
+            current_time = time.monotonic_ns()
             mock_data = self.generate_mock_data()
             
             # Обновление текущих данных
@@ -710,10 +1508,11 @@ class LiveDataPanel(QWidget):
             self.update_historical_data(mock_data, current_time)
             
             # Обновление датчиков
-            self.data_updated.emit(mock_data)
+            self.emit_changed_data(mock_data)
             
             # Обновление графиков
             self.realtime_chart.update_data(mock_data, current_time)
+            self.refresh_historical_chart()
             
             # Обновление таблицы
             self.update_data_table(mock_data)
@@ -733,150 +1532,98 @@ class LiveDataPanel(QWidget):
             
     def generate_mock_data(self):
         """Генерация тестовых данных (для демонстрации)"""
-        import random
-        import math
+        key = tuple(self.selected_pids)
+        if self._mock_layout is None or self._mock_layout[0] != key:
+            self._mock_layout = (key,) + self.build_mock_layout(key)
+        _, pids, low, high = self._mock_layout
         
-        data = {}
+        # Все значения кадра - одним вызовом генератора
+        values = self._rng.uniform(low, high)
         
-        # Основные параметры
-        if '010C' in self.selected_pids or not self.selected_pids:
+        if pids[0] == '010C':
             # RPM с имитацией работы двигателя
-            time_factor = datetime.now().timestamp() / 10
-            base_rpm = 800 + math.sin(time_factor) * 200
-            noise = random.uniform(-50, 50)
-            data['010C'] = max(0, base_rpm + noise)
-            
-        if '010D' in self.selected_pids or not self.selected_pids:
-            data['010D'] = random.uniform(0, 120)
-            
-        if '0105' in self.selected_pids or not self.selected_pids:
-            data['0105'] = random.uniform(85, 95)
+            base_rpm = 800 + math.sin(time.monotonic() / 10) * 200
+            values[0] = max(0, base_rpm + values[0])
+            
+        return dict(zip(pids, values.tolist()))
+        
+    @staticmethod
+    def build_mock_layout(selected):
+        """PID тестового кадра и массивы границ их значений"""
+        # Основные параметры (все, если ничего не выбрано) и остальные выбранные PID
+        pids = [pid for pid in _MOCK_RANGES if not selected or pid in selected]
+        pids += [pid for pid in selected if pid not in _MOCK_RANGES]
+        
+        bounds = np.array([_MOCK_RANGES.get(pid, _MOCK_DEFAULT_RANGE) for pid in pids])
+        return pids, bounds[:, 0].copy(), bounds[:, 1].copy()
+        
+    def wall_time(self, timestamp):
+        """Настенное время (с от эпохи) для отметки time.monotonic_ns()
+        
+        Принимает как одну отметку, так и массив отметок.
+        """
+        return self._wall_epoch + (timestamp - self._mono_epoch) / 1e9
+        
+    def emit_changed_data(self, data):
+        """Отправка датчикам только заметно изменившихся значений"""
+        last = self._last_emitted
+        get_step = _GAUGE_RESOLUTION.get
+        changed = {pid: value for pid, value in data.items()
+                   if abs(value - last.get(pid, math.inf)) >= get_step(pid, _DEFAULT_RESOLUTION)}
+        if changed:
+            last.update(changed)
+            self.data_updated.emit(changed)
             
-        if '0111' in self.selected_pids or not self.selected_pids:
-            data['0111'] = random.uniform(0, 30)
-            
-        if '0142' in self.selected_pids or not self.selected_pids:
-            data['0142'] = random.uniform(13.5, 14.5)
-            
-        if '0110' in self.selected_pids or not self.selected_pids:
-            data['0110'] = random.uniform(5, 20)
-            
-        if '010B' in self.selected_pids or not self.selected_pids:
-            data['010B'] = random.uniform(95, 105)
-            
-        # Добавление остальных выбранных PID
-        for pid in self.selected_pids:
-            if pid not in data:
-                data[pid] = random.uniform(0, 100)
-                
-        return data
-        
     def update_historical_data(self, data, timestamp):
         """Обновление исторических данных"""
-        for pid, value in data.items():
-            if pid not in self.historical_data:
-                self.historical_data[pid] = {
-                    'timestamps': deque(maxlen=self.max_history_points),
-                    'values': deque(maxlen=self.max_history_points),
-                    'min': float('inf'),
-                    'max': float('-inf'),
-                    'sum': 0,
-                    'count': 0
-                }
-                
-            history = self.historical_data[pid]
-            history['timestamps'].append(timestamp)
-            history['values'].append(value)
-            
-            # Обновление статистики
-            history['min'] = min(history['min'], value)
-            history['max'] = max(history['max'], value)
-            history['sum'] += value
-            history['count'] += 1
-            
+        self.history.append(data, timestamp)
+        self.history_summary.ingest(data, timestamp)
+        
     def update_all_gauges(self, data):
-        """Обновление всех датчиков"""
-        # Основные датчики
-        if '010C' in data:
-            self.tachometer.setValue(data['010C'])
-            
-        if '010D' in data:
-            self.speedometer.setValue(data['010D'])
-            
-        if '0105' in data:
-            self.coolant_temp_gauge.setValue(data['0105'])
-            
-        if '0142' in data:
-            self.voltmeter.setValue(data['0142'])
-            
-        if '0111' in data:
-            self.throttle_gauge.setValue(data['0111'])
-            
-        if '0104' in data:
-            self.engine_load_gauge.setValue(data.get('0104', 0))
-            
-        if '0110' in data:
-            self.maf_gauge.setValue(data['0110'])
-            
-        if '010B' in data:
-            self.map_gauge.setValue(data['010B'])
-            
-        # Динамические датчики
-        for pid, gauge in self.gauges.items():
-            if pid in data:
-                gauge.setValue(data[pid])
-                
+        """Обновление всех датчиков
+        
+        Скрытые датчики пропускаются; при показе панели они получают
+        последние значения в showEvent.
+        """
+        all_gauges = self._all_gauges
+        for pid, value in data.items():
+            for gauge in all_gauges.get(pid, ()):
+                if gauge.isVisible():
+                    gauge.setValue(value)
+                    
     def update_data_table(self, data):
-        """Обновление таблицы данных"""
-        self.data_table.setRowCount(len(data))
-        
-        for row, (pid, value) in enumerate(data.items()):
-            # Получение информации о параметре
-            param_name = self.get_parameter_name(pid)
-            unit = self.get_parameter_unit(pid)
-            
-            # Текущее значение
-            value_item = QTableWidgetItem(format_value(value, unit))
-            value_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            # Минимальное значение
-            min_value = self.historical_data.get(pid, {}).get('min', value)
-            min_item = QTableWidgetItem(format_value(min_value, unit))
-            min_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            # Максимальное значение
-            max_value = self.historical_data.get(pid, {}).get('max', value)
-            max_item = QTableWidgetItem(format_value(max_value, unit))
-            max_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            # Среднее значение
-            avg_value = self.calculate_average(pid)
-            avg_item = QTableWidgetItem(format_value(avg_value, unit))
-            avg_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            # Заполнение строки
-            self.data_table.setItem(row, 0, QTableWidgetItem(param_name))
-            self.data_table.setItem(row, 1, value_item)
-            self.data_table.setItem(row, 2, min_item)
-            self.data_table.setItem(row, 3, max_item)
-            self.data_table.setItem(row, 4, avg_item)
-            self.data_table.setItem(row, 5, QTableWidgetItem(unit))
-            
+        """Обновление таблицы данных
+        
+        Кадр только запоминается - таблица перерисовывается таймером
+        не чаще TABLE_REFRESH_INTERVAL.
+        """
+        self._table_pending = data
+        if not self.table_timer.isActive():
+            self.table_timer.start()
+            
+    def refresh_data_table(self):
+        """Вывод последнего кадра в таблицу"""
+        data = self._table_pending
+        if data is None:
+            # Новых данных нет - таймер не нужен до следующего кадра
+            self.table_timer.stop()
+            return
+        self._table_pending = None
+        
+        model = self.table_model
+        pid_info = self._pid_info
+        new_rows = [(pid,) + pid_info.get(pid, (pid, ''))
+                    for pid in data if not model.has_row(pid)]
+        model.append_rows(new_rows)
+        model.set_values(data)
+        
     def get_parameter_name(self, pid):
         """Получение имени параметра по PID"""
-        for i in range(self.pid_combo.count()):
-            data = self.pid_combo.itemData(i)
-            if isinstance(data, dict) and data.get('pid') == pid:
-                return data.get('name', pid)
-        return pid
+        return self._pid_info.get(pid, (pid, ''))[0]
         
     def get_parameter_unit(self, pid):
         """Получение единиц измерения по PID"""
-        for i in range(self.pid_combo.count()):
-            data = self.pid_combo.itemData(i)
-            if isinstance(data, dict) and data.get('pid') == pid:
-                return data.get('unit', '')
-        return ''
+        return self._pid_info.get(pid, (pid, ''))[1]
         
     def calculate_average(self, pid):
         """Расчет среднего значения"""
@@ -889,8 +1636,6 @@ class LiveDataPanel(QWidget):
     def update_status_indicators(self, data):
         """Обновление индикаторов состояния"""
         # Имитация состояния систем
-        import random
-        
         self.check_engine_light.setState(random.random() > 0.9)
         self.abs_light.setState(random.random() > 0.95)
         self.airbag_light.setState(random.random() > 0.98)
@@ -905,47 +1650,32 @@ class LiveDataPanel(QWidget):
         self.oil_temp_light.setState(oil_temp_warning)
         
     def write_to_recording_file(self, data, timestamp):
-        """Запись данных в файл"""
-        try:
-            with open(self.recording_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                row = [timestamp.isoformat()]
-                
-                for pid in self.selected_pids:
-                    row.append(data.get(pid, ''))
-                    
-                writer.writerow(row)
-                
-        except Exception as e:
-            self.logger.error(f"Ошибка записи в файл: {e}")
+        """Передача кадра в поток записи (кадр уже записан в буфер истории)"""
+        if self.recording_worker:
+            self.recording_worker.notify()
             
     def update_status_panel(self, timestamp):
-        """Обновление панели статуса"""
-        # Счетчик кадров
-        total_frames = sum(h['count'] for h in self.historical_data.values())
-        self.frame_counter.setText(f"Кадры: {total_frames}")
+        """Обновление панели статуса (не чаще STATUS_REFRESH_INTERVAL)"""
+        if timestamp - self._status_shown < STATUS_REFRESH_INTERVAL:
+            return
+        self._status_shown = timestamp
+        
+        # Счетчик кадров - число кадров, записанных в буфер истории
+        self.frame_counter.setText(f"Кадры: {self.history.write}")
         
         # Время записи
         if self.is_recording and self.recording_start_time:
-            duration = timestamp - self.recording_start_time
-            hours, remainder = divmod(duration.seconds, 3600)
+            duration = (timestamp - self._recording_start_ns) // 1_000_000_000
+            hours, remainder = divmod(duration, 3600)
             minutes, seconds = divmod(remainder, 60)
             self.recording_time.setText(f"Время: {hours:02d}:{minutes:02d}:{seconds:02d}")
             
-        # Размер файла
-        if self.recording_file and os.path.exists(self.recording_file):
-            size_kb = os.path.getsize(self.recording_file) / 1024
-            self.file_size_label.setText(f"Файл: {size_kb:.1f} KB")
-            
-        # Прогресс
-        if self.historical_data:
-            first_pid = next(iter(self.historical_data))
-            count = self.historical_data[first_pid]['count']
-            progress = min(100, int(count * 100 / self.max_history_points))
-            self.data_progress.setValue(progress)
+        # Прогресс заполнения окна истории
+        if self.history.write:
+            self.data_progress.setValue(len(self.history) * 100 // self.max_history_points)
             
         # Время последнего обновления
-        time_str = timestamp.strftime("%H:%M:%S")
+        time_str = time.strftime("%H:%M:%S", time.localtime(self.wall_time(timestamp)))
         self.last_update_label.setText(f"Последнее обновление: {time_str}")
         
     def clear_data(self):
@@ -959,14 +1689,19 @@ class LiveDataPanel(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            self.historical_data.clear()
+            # Вместе с буфером очищается и статистика historical_data
+            self.history.clear()
+            self.history_summary.clear()
             self.realtime_chart.clear()
-            self.historical_chart.clear()
-            self.data_table.setRowCount(0)
+            if self.historical_chart:
+                self.historical_chart.clear()
+            self.clear_table()
             self.data_progress.setValue(0)
             self.frame_counter.setText("Кадры: 0")
+            self._status_shown = 0
             
             # Сброс датчиков
+            self._last_emitted.clear()
             for gauge in self.gauges.values():
                 gauge.setValue(0)
                 
@@ -978,6 +1713,10 @@ class LiveDataPanel(QWidget):
             QMessageBox.warning(self, "Нет данных", "Нет данных для сохранения")
             return
             
+        if self.export_thread and self.export_thread.isRunning():
+            QMessageBox.warning(self, "Сохранение", "Предыдущее сохранение еще не завершено")
+            return
+            
         try:
             # Выбор формата
             formats = ["CSV (*.csv)", "JSON (*.json)", "Excel (*.xlsx)"]
@@ -995,138 +1734,62 @@ class LiveDataPanel(QWidget):
                 
             # Определение формата
             if "CSV" in selected_filter:
-                self.save_to_csv(filename)
+                format_type = 'csv'
             elif "JSON" in selected_filter:
-                self.save_to_json(filename)
+                format_type = 'json'
             elif "Excel" in selected_filter:
-                self.save_to_excel(filename)
+                format_type = 'excel'
+            else:
+                return
                 
-            self.logger.info(f"Данные сохранены в {filename}")
-            QMessageBox.information(self, "Сохранено", "Данные успешно сохранены")
+            # Снимок истории делается здесь, форматирование и запись - в отдельном потоке
+            self.export_thread = ExportThread(filename, format_type, self.history_snapshot())
+            self.export_thread.export_finished.connect(self.on_data_saved)
+            self.export_thread.export_failed.connect(self.on_data_save_failed)
+            self.export_thread.start()
             
         except Exception as e:
-            self.logger.error(f"Ошибка сохранения данных: {e}")
-            QMessageBox.critical(self, "Ошибка", f"Не удалось сохранить данные: {e}")
-            
-    def save_to_csv(self, filename):
-        """Сохранение в CSV"""
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Заголовок
-            headers = ['Timestamp']
-            for pid in self.historical_data.keys():
-                headers.append(self.get_parameter_name(pid))
-            writer.writerow(headers)
-            
-            # Данные
-            if self.historical_data:
-                first_pid = next(iter(self.historical_data))
-                timestamps = list(self.historical_data[first_pid]['timestamps'])
-                
-                for i, timestamp in enumerate(timestamps):
-                    row = [timestamp.isoformat()]
-                    for pid in self.historical_data.keys():
-                        values = list(self.historical_data[pid]['values'])
-                        if i < len(values):
-                            row.append(values[i])
-                        else:
-                            row.append('')
-                    writer.writerow(row)
-                    
-    def save_to_json(self, filename):
-        """Сохранение в JSON"""
-        data = {
-            'metadata': {
-                'export_time': datetime.now().isoformat(),
-                'parameters_count': len(self.historical_data),
-                'data_points': len(next(iter(self.historical_data.values()))['timestamps']) if self.historical_data else 0
-            },
-            'parameters': {},
-            'data': []
+            self.on_data_save_failed(str(e))
+            
+    def history_snapshot(self):
+        """Копия истории и статистики для сохранения в отдельном потоке"""
+        pids = list(self.historical_data)
+        _, timestamps, values = self.history.snapshot(0, pids)
+        if timestamps is None:
+            times = np.empty(0)
+            values = np.empty((len(pids), 0))
+        else:
+            times = self.wall_time(timestamps)
+        return {
+            'pids': pids,
+            'names': [self.get_parameter_name(pid) for pid in pids],
+            'units': [self.get_parameter_unit(pid) for pid in pids],
+            'stats': [self.historical_data[pid] for pid in pids],
+            'times': times,
+            'values': values
         }
         
-        # Параметры
-        for pid, history in self.historical_data.items():
-            data['parameters'][pid] = {
-                'name': self.get_parameter_name(pid),
-                'unit': self.get_parameter_unit(pid),
-                'min': history['min'],
-                'max': history['max'],
-                'average': history['sum'] / history['count'] if history['count'] > 0 else 0
-            }
-            
-        # Данные
-        if self.historical_data:
-            first_pid = next(iter(self.historical_data))
-            timestamps = list(self.historical_data[first_pid]['timestamps'])
-            
-            for i, timestamp in enumerate(timestamps):
-                entry = {'timestamp': timestamp.isoformat()}
-                for pid, history in self.historical_data.items():
-                    values = list(history['values'])
-                    if i < len(values):
-                        entry[pid] = values[i]
-                data['data'].append(entry)
-                
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            
-    def save_to_excel(self, filename):
-        """Сохранение в Excel"""
-        try:
-            import pandas as pd
-            
-            # Подготовка данных
-            data_dict = {}
-            
-            if self.historical_data:
-                first_pid = next(iter(self.historical_data))
-                timestamps = list(self.historical_data[first_pid]['timestamps'])
-                
-                data_dict['Timestamp'] = [ts.isoformat() for ts in timestamps]
-                
-                for pid, history in self.historical_data.items():
-                    param_name = self.get_parameter_name(pid)
-                    values = list(history['values'])
-                    # Дополнение значений если нужно
-                    if len(values) < len(timestamps):
-                        values.extend([None] * (len(timestamps) - len(values)))
-                    data_dict[param_name] = values
-                    
-            # Создание DataFrame
-            df = pd.DataFrame(data_dict)
-            
-            # Сохранение
-            df.to_excel(filename, index=False)
-            
-        except ImportError:
-            QMessageBox.warning(
-                self,
-                "Библиотека не установлена",
-                "Для сохранения в Excel установите библиотеку pandas и openpyxl"
-            )
-            
+    def on_data_saved(self, filename):
+        """Завершение сохранения данных"""
+        self.logger.info(f"Данные сохранены в {filename}")
+        QMessageBox.information(self, "Сохранено", "Данные успешно сохранены")
+        
+    def on_data_save_failed(self, error):
+        """Ошибка сохранения данных"""
+        self.logger.error(f"Ошибка сохранения данных: {error}")
+        QMessageBox.critical(self, "Ошибка", f"Не удалось сохранить данные: {error}")
+        
     def copy_table_data(self):
         """Копирование данных из таблицы"""
         try:
             import pandas as pd
             
             # Получение данных из таблицы
-            data = []
-            for row in range(self.data_table.rowCount()):
-                row_data = []
-                for col in range(self.data_table.columnCount()):
-                    item = self.data_table.item(row, col)
-                    row_data.append(item.text() if item else '')
-                data.append(row_data)
-                
+            data = self.table_model.text_rows()
+            
             # Создание DataFrame и копирование в буфер
             if data:
-                df = pd.DataFrame(data, columns=[
-                    self.data_table.horizontalHeaderItem(i).text() 
-                    for i in range(self.data_table.columnCount())
-                ])
+                df = pd.DataFrame(data, columns=LiveDataModel.HEADERS)
                 df.to_clipboard(index=False, sep='\t')
                 
                 QMessageBox.information(self, "Скопировано", "Данные скопированы в буфер обмена")
@@ -1149,19 +1812,10 @@ class LiveDataPanel(QWidget):
                     writer = csv.writer(f)
                     
                     # Заголовок
-                    headers = [
-                        self.data_table.horizontalHeaderItem(i).text() 
-                        for i in range(self.data_table.columnCount())
-                    ]
-                    writer.writerow(headers)
+                    writer.writerow(LiveDataModel.HEADERS)
                     
                     # Данные
-                    for row in range(self.data_table.rowCount()):
-                        row_data = []
-                        for col in range(self.data_table.columnCount()):
-                            item = self.data_table.item(row, col)
-                            row_data.append(item.text() if item else '')
-                        writer.writerow(row_data)
+                    writer.writerows(self.table_model.text_rows())
                         
                 self.logger.info(f"Таблица экспортирована в {filename}")
                 QMessageBox.information(self, "Экспорт", "Таблица успешно экспортирована")
@@ -1171,7 +1825,8 @@ class LiveDataPanel(QWidget):
             
     def clear_table(self):
         """Очистка таблицы"""
-        self.data_table.setRowCount(0)
+        self._table_pending = None
+        self.table_model.clear()
         
     def on_parameter_selected(self, pid):
         """Обработка выбора параметра на графике"""
@@ -1245,47 +1900,58 @@ class LiveDataPanel(QWidget):
         if saved_pids:
             self.selected_pids = saved_pids
             # Восстановление датчиков
-            for pid in saved_pids:
-                self.restore_gauge(pid)
+            with self.gauges_batch():
+                for pid in saved_pids:
+                    self.restore_gauge(pid)
                 
     def restore_gauge(self, pid):
         """Восстановление датчика по PID"""
         # Поиск информации о PID
-        for i in range(self.pid_combo.count()):
-            data = self.pid_combo.itemData(i)
-            if isinstance(data, dict) and data.get('pid') == pid:
-                self.create_dynamic_gauge(
-                    pid, 
-                    data.get('name', pid), 
-                    data.get('unit', '')
-                )
-                break
+        info = self._pid_info.get(pid)
+        if info is not None:
+            self.create_dynamic_gauge(pid, *info)
                 
     def save_settings(self):
         """Сохранение настроек"""
         self.settings.setValue("sampling_interval", self.sampling_interval)
         self.settings.setValue("selected_pids", self.selected_pids)
         
-    def closeEvent(self, event):
-        """Обработка закрытия"""
+    def showEvent(self, event):
+        """Обработка показа панели"""
+        super().showEvent(event)
+        # Пока панель была скрыта, датчики не обновлялись
+        self.update_all_gauges(self._last_emitted)
+        
+    def shutdown(self):
+        """Остановка потока данных, записи и сохранения (повторный вызов безопасен)"""
         self.save_settings()
         self.stop_data_stream()
-        self.stop_recording()
+        if self.recording_worker:
+            # Буфер файла записи сбрасывается на диск, пишется статистика записи
+            self.stop_recording()
+        if self.export_thread:
+            # Файл сохранения дописывается до конца
+            self.export_thread.wait()
+            
+    def closeEvent(self, event):
+        """Обработка закрытия"""
+        self.shutdown()
         super().closeEvent(event)
         
     @pyqtSlot(dict)
     def on_diagnostic_data_received(self, data):
         """Обработка полученных диагностических данных"""
         # Этот метод будет вызываться извне при получении реальных данных
-        current_time = datetime.now()
+        current_time = time.monotonic_ns()
         self.current_data = data
         
         # Обновление исторических данных
         self.update_historical_data(data, current_time)
         
         # Обновление UI
-        self.data_updated.emit(data)
+        self.emit_changed_data(data)
         self.realtime_chart.update_data(data, current_time)
+        self.refresh_historical_chart()
         self.update_data_table(data)
         self.update_status_panel(current_time)
         
@@ -1295,7 +1961,7 @@ class LiveDataPanel(QWidget):
             
     def set_connection_status(self, connected):
         """Установка статуса подключения"""
-        color = QColor(0, 255, 0) if connected else QColor(255, 0, 0)
+        color = _COLOR_GREEN if connected else _COLOR_RED
         self.connection_indicator.setColor(color)
         
         if not connected:
@@ -1307,8 +1973,17 @@ class LiveDataPanel(QWidget):
         return self.current_data.copy()
         
     def get_historical_data(self):
-        """Получение исторических данных"""
-        return self.historical_data.copy()
+        """Получение исторических данных (статистика и окно значений по PID)"""
+        pids = list(self.historical_data)
+        _, timestamps, values = self.history.snapshot(0, pids)
+        if timestamps is None:
+            return {pid: dict(self.historical_data[pid], timestamps=np.empty(0), values=np.empty(0))
+                    for pid in pids}
+        timestamps = self.wall_time(timestamps)
+        return {
+            pid: dict(self.historical_data[pid], timestamps=timestamps, values=row)
+            for pid, row in zip(pids, values)
+        }
         
     def reset(self):
         """Сброс панели"""
@@ -1321,7 +1996,7 @@ class LiveDataPanel(QWidget):
         self.record_btn.setChecked(False)
         
         # Сброс индикаторов
-        self.connection_indicator.setColor(QColor(255, 0, 0))
-        self.recording_indicator.setColor(QColor(255, 0, 0))
+        self.connection_indicator.setColor(_COLOR_RED)
+        self.recording_indicator.setColor(_COLOR_RED)
         
         self.logger.info("Панель текущих данных сброшена")
\ No newline at end of file
@@ -23,6 +23,7 @@ from PyQt5.QtChart import (QChart, QChartView, QLineSeries, QValueAxis,
                           QDateTimeAxis, QBarSeries, QBarSet, QBarCategoryAxis,
                           QPieSeries, QPieSlice)
 
+from ui.icons import ICONS_DIR
 from ui.connection_panel import ConnectionPanel
 from ui.diagnostic_panel import DiagnosticPanel
 from ui.live_data_panel import LiveDataPanel
@@ -73,7 +74,7 @@ class MainWindow(QMainWindow):
             self.setGeometry(100, 100, 1600, 900)
         
         # Установка иконки
-        self.setWindowIcon(QIcon("assets/icons/app_icon.ico"))
+        self.setWindowIcon(QIcon(f"{ICONS_DIR}/app_icon.ico"))
         
         # Загрузка кастомного шрифта
         self.load_fonts()
@@ -134,7 +135,7 @@ class MainWindow(QMainWindow):
         
         # Логотип и название
         logo_label = QLabel()
-        logo_pixmap = QPixmap("assets/icons/logo.png")
+        logo_pixmap = QPixmap(f"{ICONS_DIR}/logo.png")
         if logo_pixmap.isNull():
             logo_label.setText("NIVA PRO")
             logo_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #2c3e50;")
@@ -159,7 +160,7 @@ class MainWindow(QMainWindow):
         
         # Кнопка быстрого подключения
         self.quick_connect_btn = QPushButton("Быстрое подключение")
-        self.quick_connect_btn.setIcon(QIcon("assets/icons/quick_connect.png"))
+        self.quick_connect_btn.setIcon(QIcon(f"{ICONS_DIR}/quick_connect.png"))
         self.quick_connect_btn.setObjectName("quickConnectBtn")
         self.quick_connect_btn.clicked.connect(self.quick_connect)
         
@@ -219,7 +220,7 @@ class MainWindow(QMainWindow):
         self.vin_label.setWordWrap(True)
         
         self.read_vin_btn = QPushButton("Считать VIN")
-        self.read_vin_btn.setIcon(QIcon("assets/icons/vin.png"))
+        self.read_vin_btn.setIcon(QIcon(f"{ICONS_DIR}/vin.png"))
         self.read_vin_btn.clicked.connect(self.read_vin)
         
         vehicle_layout.addWidget(QLabel("Модель:"))
@@ -234,12 +235,12 @@ class MainWindow(QMainWindow):
         nav_layout = QVBoxLayout()
         
         nav_buttons = [
-            ("Диагностика двигателя", "engine_diag", "assets/icons/engine.png"),
-            ("Проверка ABS", "abs_diag", "assets/icons/abs.png"),
-            ("Диагностика подушек", "airbag_diag", "assets/icons/airbag.png"),
-            ("Иммобилайзер", "immo_diag", "assets/icons/immo.png"),
-            ("Приборная панель", "cluster_diag", "assets/icons/cluster.png"),
-            ("Климат-контроль", "ac_diag", "assets/icons/ac.png"),
+            ("Диагностика двигателя", "engine_diag", f"{ICONS_DIR}/engine.png"),
+            ("Проверка ABS", "abs_diag", f"{ICONS_DIR}/abs.png"),
+            ("Диагностика подушек", "airbag_diag", f"{ICONS_DIR}/airbag.png"),
+            ("Иммобилайзер", "immo_diag", f"{ICONS_DIR}/immo.png"),
+            ("Приборная панель", "cluster_diag", f"{ICONS_DIR}/cluster.png"),
+            ("Климат-контроль", "ac_diag", f"{ICONS_DIR}/ac.png"),
         ]
         
         self.nav_buttons = {}
@@ -332,7 +333,7 @@ class MainWindow(QMainWindow):
         self.progress_label = QLabel("Выполнение диагностики...")
         
         self.cancel_btn = QPushButton("Отмена")
-        self.cancel_btn.setIcon(QIcon("assets/icons/cancel.png"))
+        self.cancel_btn.setIcon(QIcon(f"{ICONS_DIR}/cancel.png"))
         self.cancel_btn.clicked.connect(self.cancel_operation)
         
         progress_layout.addWidget(self.progress_label)
@@ -347,39 +348,39 @@ class MainWindow(QMainWindow):
         """Создание основных вкладок"""
         # Вкладка подключения
         self.connection_tab = ConnectionPanel()
-        self.tab_widget.addTab(self.connection_tab, QIcon("assets/icons/connection.png"), "Подключение")
+        self.tab_widget.addTab(self.connection_tab, QIcon(f"{ICONS_DIR}/connection.png"), "Подключение")
         
         # Вкладка диагностики
         self.diagnostic_tab = DiagnosticPanel()
-        self.tab_widget.addTab(self.diagnostic_tab, QIcon("assets/icons/diagnostic.png"), "Диагностика")
+        self.tab_widget.addTab(self.diagnostic_tab, QIcon(f"{ICONS_DIR}/diagnostic.png"), "Диагностика")
         
         # Вкладка живых данных
         self.live_data_tab = LiveDataPanel()
-        self.tab_widget.addTab(self.live_data_tab, QIcon("assets/icons/live_data.png"), "Живые данные")
+        self.tab_widget.addTab(self.live_data_tab, QIcon(f"{ICONS_DIR}/live_data.png"), "Живые данные")
         
         # Вкладка ошибок
         self.error_tab = ErrorPanel()
-        self.tab_widget.addTab(self.error_tab, QIcon("assets/icons/error.png"), "Ошибки")
+        self.tab_widget.addTab(self.error_tab, QIcon(f"{ICONS_DIR}/error.png"), "Ошибки")
         
         # Вкладка адаптации
         self.adaptation_tab = AdaptationPanel()
-        self.tab_widget.addTab(self.adaptation_tab, QIcon("assets/icons/adaptation.png"), "Адаптация")
+        self.tab_widget.addTab(self.adaptation_tab, QIcon(f"{ICONS_DIR}/adaptation.png"), "Адаптация")
         
         # Вкладка осциллографа
         self.oscilloscope_tab = self.create_oscilloscope_tab()
-        self.tab_widget.addTab(self.oscilloscope_tab, QIcon("assets/icons/oscilloscope.png"), "Осциллограф")
+        self.tab_widget.addTab(self.oscilloscope_tab, QIcon(f"{ICONS_DIR}/oscilloscope.png"), "Осциллограф")
         
         # Вкладка отчетов
         self.reports_tab = ReportsPanel()
-        self.tab_widget.addTab(self.reports_tab, QIcon("assets/icons/reports.png"), "Отчеты")
+        self.tab_widget.addTab(self.reports_tab, QIcon(f"{ICONS_DIR}/reports.png"), "Отчеты")
         
         # Вкладка карт
         self.maps_tab = self.create_maps_tab()
-        self.tab_widget.addTab(self.maps_tab, QIcon("assets/icons/maps.png"), "Карты")
+        self.tab_widget.addTab(self.maps_tab, QIcon(f"{ICONS_DIR}/maps.png"), "Карты")
         
         # Вкладка логирования
         self.logging_tab = self.create_logging_tab()
-        self.tab_widget.addTab(self.logging_tab, QIcon("assets/icons/logging.png"), "Логи")
+        self.tab_widget.addTab(self.logging_tab, QIcon(f"{ICONS_DIR}/logging.png"), "Логи")
         
         # Изначально отключаем все вкладки кроме подключения
         for i in range(1, self.tab_widget.count()):
@@ -411,10 +412,10 @@ class MainWindow(QMainWindow):
         self.osc_voltage_spin.setSuffix(" В/дел")
         
         self.osc_start_btn = QPushButton("Старт")
-        self.osc_start_btn.setIcon(QIcon("assets/icons/start.png"))
+        self.osc_start_btn.setIcon(QIcon(f"{ICONS_DIR}/start.png"))
         
         self.osc_stop_btn = QPushButton("Стоп")
-        self.osc_stop_btn.setIcon(QIcon("assets/icons/stop.png"))
+        self.osc_stop_btn.setIcon(QIcon(f"{ICONS_DIR}/stop.png"))
         
         control_layout.addWidget(QLabel("Канал:"))
         control_layout.addWidget(self.osc_channel_combo)
@@ -455,13 +456,13 @@ class MainWindow(QMainWindow):
         ])
         
         self.map_load_btn = QPushButton("Загрузить карту")
-        self.map_load_btn.setIcon(QIcon("assets/icons/load.png"))
+        self.map_load_btn.setIcon(QIcon(f"{ICONS_DIR}/load.png"))
         
         self.map_save_btn = QPushButton("Сохранить карту")
-        self.map_save_btn.setIcon(QIcon("assets/icons/save.png"))
+        self.map_save_btn.setIcon(QIcon(f"{ICONS_DIR}/save.png"))
         
         self.map_edit_btn = QPushButton("Редактировать")
-        self.map_edit_btn.setIcon(QIcon("assets/icons/edit.png"))
+        self.map_edit_btn.setIcon(QIcon(f"{ICONS_DIR}/edit.png"))
         
         map_control_layout.addWidget(QLabel("Тип карты:"))
         map_control_layout.addWidget(self.map_type_combo, 1)
@@ -494,16 +495,16 @@ class MainWindow(QMainWindow):
         log_control_layout = QHBoxLayout(log_control)
         
         self.log_start_btn = QPushButton("Начать запись")
-        self.log_start_btn.setIcon(QIcon("assets/icons/record.png"))
+        self.log_start_btn.setIcon(QIcon(f"{ICONS_DIR}/record.png"))
         
         self.log_stop_btn = QPushButton("Остановить")
-        self.log_stop_btn.setIcon(QIcon("assets/icons/stop.png"))
+        self.log_stop_btn.setIcon(QIcon(f"{ICONS_DIR}/stop.png"))
         
         self.log_clear_btn = QPushButton("Очистить")
-        self.log_clear_btn.setIcon(QIcon("assets/icons/clear.png"))
+        self.log_clear_btn.setIcon(QIcon(f"{ICONS_DIR}/clear.png"))
         
         self.log_save_btn = QPushButton("Сохранить лог")
-        self.log_save_btn.setIcon(QIcon("assets/icons/save_log.png"))
+        self.log_save_btn.setIcon(QIcon(f"{ICONS_DIR}/save_log.png"))
         
         log_control_layout.addWidget(self.log_start_btn)
         log_control_layout.addWidget(self.log_stop_btn)
@@ -560,12 +561,12 @@ class MainWindow(QMainWindow):
         actions_layout = QVBoxLayout()
         
         quick_actions = [
-            ("Эмуляция неисправностей", "fault_emulation", "assets/icons/fault.png"),
-            ("Калибровка датчиков", "sensor_calibration", "assets/icons/calibrate.png"),
-            ("Тест форсунок", "injector_test", "assets/icons/injector.png"),
-            ("Тест катушек", "coil_test", "assets/icons/coil.png"),
-            ("Проверка компрессии", "compression_test", "assets/icons/compression.png"),
-            ("Сброс адаптаций", "reset_adaptations", "assets/icons/reset.png"),
+            ("Эмуляция неисправностей", "fault_emulation", f"{ICONS_DIR}/fault.png"),
+            ("Калибровка датчиков", "sensor_calibration", f"{ICONS_DIR}/calibrate.png"),
+            ("Тест форсунок", "injector_test", f"{ICONS_DIR}/injector.png"),
+            ("Тест катушек", "coil_test", f"{ICONS_DIR}/coil.png"),
+            ("Проверка компрессии", "compression_test", f"{ICONS_DIR}/compression.png"),
+            ("Сброс адаптаций", "reset_adaptations", f"{ICONS_DIR}/reset.png"),
         ]
         
         self.quick_action_buttons = {}
@@ -598,7 +599,7 @@ class MainWindow(QMainWindow):
         
         # Кнопка завершения сеанса
         self.end_session_btn = QPushButton("Завершить сеанс")
-        self.end_session_btn.setIcon(QIcon("assets/icons/end_session.png"))
+        self.end_session_btn.setIcon(QIcon(f"{ICONS_DIR}/end_session.png"))
         self.end_session_btn.clicked.connect(self.end_session)
         
         session_layout.addWidget(self.end_session_btn)
@@ -638,31 +639,31 @@ class MainWindow(QMainWindow):
         # Меню Файл
         file_menu = menubar.addMenu("&Файл")
         
-        new_action = QAction(QIcon("assets/icons/new.png"), "&Новый сеанс", self)
+        new_action = QAction(QIcon(f"{ICONS_DIR}/new.png"), "&Новый сеанс", self)
         new_action.setShortcut("Ctrl+N")
         new_action.triggered.connect(self.new_session)
         file_menu.addAction(new_action)
         
-        open_action = QAction(QIcon("assets/icons/open.png"), "&Открыть...", self)
+        open_action = QAction(QIcon(f"{ICONS_DIR}/open.png"), "&Открыть...", self)
         open_action.setShortcut("Ctrl+O")
         open_action.triggered.connect(self.open_file)
         file_menu.addAction(open_action)
         
         file_menu.addSeparator()
         
-        save_action = QAction(QIcon("assets/icons/save.png"), "&Сохранить", self)
+        save_action = QAction(QIcon(f"{ICONS_DIR}/save.png"), "&Сохранить", self)
         save_action.setShortcut("Ctrl+S")
         save_action.triggered.connect(self.save_file)
         file_menu.addAction(save_action)
         
-        save_as_action = QAction(QIcon("assets/icons/save_as.png"), "Сохранить &как...", self)
+        save_as_action = QAction(QIcon(f"{ICONS_DIR}/save_as.png"), "Сохранить &как...", self)
         save_as_action.setShortcut("Ctrl+Shift+S")
         save_as_action.triggered.connect(self.save_file_as)
         file_menu.addAction(save_as_action)
         
         file_menu.addSeparator()
         
-        export_menu = file_menu.addMenu(QIcon("assets/icons/export.png"), "&Экспорт")
+        export_menu = file_menu.addMenu(QIcon(f"{ICONS_DIR}/export.png"), "&Экспорт")
         
         export_pdf_action = QAction("В PDF", self)
         export_pdf_action.triggered.connect(lambda: self.export_report("pdf"))
@@ -678,14 +679,14 @@ class MainWindow(QMainWindow):
         
         file_menu.addSeparator()
         
-        print_action = QAction(QIcon("assets/icons/print.png"), "&Печать...", self)
+        print_action = QAction(QIcon(f"{ICONS_DIR}/print.png"), "&Печать...", self)
         print_action.setShortcut("Ctrl+P")
         print_action.triggered.connect(self.print_report)
         file_menu.addAction(print_action)
         
         file_menu.addSeparator()
         
-        exit_action = QAction(QIcon("assets/icons/exit.png"), "&Выход", self)
+        exit_action = QAction(QIcon(f"{ICONS_DIR}/exit.png"), "&Выход", self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
@@ -693,28 +694,28 @@ class MainWindow(QMainWindow):
         # Меню Правка
         edit_menu = menubar.addMenu("&Правка")
         
-        undo_action = QAction(QIcon("assets/icons/undo.png"), "&Отменить", self)
+        undo_action = QAction(QIcon(f"{ICONS_DIR}/undo.png"), "&Отменить", self)
         undo_action.setShortcut("Ctrl+Z")
         edit_menu.addAction(undo_action)
         
-        redo_action = QAction(QIcon("assets/icons/redo.png"), "&Повторить", self)
+        redo_action = QAction(QIcon(f"{ICONS_DIR}/redo.png"), "&Повторить", self)
         redo_action.setShortcut("Ctrl+Y")
         edit_menu.addAction(redo_action)
         
         edit_menu.addSeparator()
         
-        copy_action = QAction(QIcon("assets/icons/copy.png"), "&Копировать", self)
+        copy_action = QAction(QIcon(f"{ICONS_DIR}/copy.png"), "&Копировать", self)
         copy_action.setShortcut("Ctrl+C")
         copy_action.triggered.connect(self.copy_data)
         edit_menu.addAction(copy_action)
         
-        paste_action = QAction(QIcon("assets/icons/paste.png"), "&Вставить", self)
+        paste_action = QAction(QIcon(f"{ICONS_DIR}/paste.png"), "&Вставить", self)
         paste_action.setShortcut("Ctrl+V")
         edit_menu.addAction(paste_action)
         
         edit_menu.addSeparator()
         
-        find_action = QAction(QIcon("assets/icons/find.png"), "&Найти...", self)
+        find_action = QAction(QIcon(f"{ICONS_DIR}/find.png"), "&Найти...", self)
         find_action.setShortcut("Ctrl+F")
         edit_menu.addAction(find_action)
         
@@ -743,29 +744,29 @@ class MainWindow(QMainWindow):
         # Меню Диагностика
         diag_menu = menubar.addMenu("&Диагностика")
         
-        quick_diag_action = QAction(QIcon("assets/icons/quick_diag.png"), "&Быстрая диагностика", self)
+        quick_diag_action = QAction(QIcon(f"{ICONS_DIR}/quick_diag.png"), "&Быстрая диагностика", self)
         quick_diag_action.setShortcut("F5")
         quick_diag_action.triggered.connect(self.quick_diagnostic)
         diag_menu.addAction(quick_diag_action)
         
-        full_diag_action = QAction(QIcon("assets/icons/full_diag.png"), "&Полная диагностика", self)
+        full_diag_action = QAction(QIcon(f"{ICONS_DIR}/full_diag.png"), "&Полная диагностика", self)
         full_diag_action.setShortcut("F6")
         full_diag_action.triggered.connect(self.full_diagnostic)
         diag_menu.addAction(full_diag_action)
         
         diag_menu.addSeparator()
         
-        engine_diag_action = QAction(QIcon("assets/icons/engine.png"), "Диагностика &двигателя", self)
+        engine_diag_action = QAction(QIcon(f"{ICONS_DIR}/engine.png"), "Диагностика &двигателя", self)
         engine_diag_action.triggered.connect(lambda: self.system_diagnostic("engine"))
         diag_menu.addAction(engine_diag_action)
         
-        abs_diag_action = QAction(QIcon("assets/icons/abs.png"), "Диагностика &ABS", self)
+        abs_diag_action = QAction(QIcon(f"{ICONS_DIR}/abs.png"), "Диагностика &ABS", self)
         abs_diag_action.triggered.connect(lambda: self.system_diagnostic("abs"))
         diag_menu.addAction(abs_diag_action)
         
         diag_menu.addSeparator()
         
-        clear_errors_action = QAction(QIcon("assets/icons/clear_errors.png"), "&Очистить ошибки", self)
+        clear_errors_action = QAction(QIcon(f"{ICONS_DIR}/clear_errors.png"), "&Очистить ошибки", self)
         clear_errors_action.setShortcut("Ctrl+E")
         clear_errors_action.triggered.connect(self.clear_all_errors)
         diag_menu.addAction(clear_errors_action)
@@ -773,22 +774,22 @@ class MainWindow(QMainWindow):
         # Меню Настройки
         settings_menu = menubar.addMenu("&Настройки")
         
-        preferences_action = QAction(QIcon("assets/icons/preferences.png"), "&Настройки программы", self)
+        preferences_action = QAction(QIcon(f"{ICONS_DIR}/preferences.png"), "&Настройки программы", self)
         preferences_action.setShortcut("Ctrl+,")
         preferences_action.triggered.connect(self.open_preferences)
         settings_menu.addAction(preferences_action)
         
-        vehicle_settings_action = QAction(QIcon("assets/icons/vehicle_settings.png"), "Настройки &автомобиля", self)
+        vehicle_settings_action = QAction(QIcon(f"{ICONS_DIR}/vehicle_settings.png"), "Настройки &автомобиля", self)
         vehicle_settings_action.triggered.connect(self.open_vehicle_settings)
         settings_menu.addAction(vehicle_settings_action)
         
-        connection_settings_action = QAction(QIcon("assets/icons/connection_settings.png"), "Настройки &подключения", self)
+        connection_settings_action = QAction(QIcon(f"{ICONS_DIR}/connection_settings.png"), "Настройки &подключения", self)
         connection_settings_action.triggered.connect(self.open_connection_settings)
         settings_menu.addAction(connection_settings_action)
         
         settings_menu.addSeparator()
         
-        themes_menu = settings_menu.addMenu(QIcon("assets/icons/themes.png"), "&Темы")
+        themes_menu = settings_menu.addMenu(QIcon(f"{ICONS_DIR}/themes.png"), "&Темы")
         
         dark_theme_action = QAction("Темная", self)
         dark_theme_action.triggered.connect(lambda: self.change_theme("dark"))
@@ -805,45 +806,45 @@ class MainWindow(QMainWindow):
         # Меню Сервис
         service_menu = menubar.addMenu("&Сервис")
         
-        calibration_action = QAction(QIcon("assets/icons/calibration.png"), "&Калибровка", self)
+        calibration_action = QAction(QIcon(f"{ICONS_DIR}/calibration.png"), "&Калибровка", self)
         calibration_action.triggered.connect(self.open_calibration)
         service_menu.addAction(calibration_action)
         
-        adaptation_action = QAction(QIcon("assets/icons/adaptation.png"), "&Адаптация", self)
+        adaptation_action = QAction(QIcon(f"{ICONS_DIR}/adaptation.png"), "&Адаптация", self)
         adaptation_action.triggered.connect(self.open_adaptation)
         service_menu.addAction(adaptation_action)
         
         service_menu.addSeparator()
         
-        coding_action = QAction(QIcon("assets/icons/coding.png"), "&Кодирование", self)
+        coding_action = QAction(QIcon(f"{ICONS_DIR}/coding.png"), "&Кодирование", self)
         coding_action.triggered.connect(self.open_coding)
         service_menu.addAction(coding_action)
         
-        flashing_action = QAction(QIcon("assets/icons/flashing.png"), "&Прошивка", self)
+        flashing_action = QAction(QIcon(f"{ICONS_DIR}/flashing.png"), "&Прошивка", self)
         flashing_action.triggered.connect(self.open_flashing)
         service_menu.addAction(flashing_action)
         
         # Меню Помощь
         help_menu = menubar.addMenu("&Помощь")
         
-        help_action = QAction(QIcon("assets/icons/help.png"), "&Справка", self)
+        help_action = QAction(QIcon(f"{ICONS_DIR}/help.png"), "&Справка", self)
         help_action.setShortcut("F1")
         help_action.triggered.connect(self.show_help)
         help_menu.addAction(help_action)
         
-        tutorial_action = QAction(QIcon("assets/icons/tutorial.png"), "&Обучение", self)
+        tutorial_action = QAction(QIcon(f"{ICONS_DIR}/tutorial.png"), "&Обучение", self)
         tutorial_action.triggered.connect(self.show_tutorial)
         help_menu.addAction(tutorial_action)
         
         help_menu.addSeparator()
         
-        check_updates_action = QAction(QIcon("assets/icons/update.png"), "Проверить &обновления", self)
+        check_updates_action = QAction(QIcon(f"{ICONS_DIR}/update.png"), "Проверить &обновления", self)
         check_updates_action.triggered.connect(self.check_for_updates)
         help_menu.addAction(check_updates_action)
         
         help_menu.addSeparator()
         
-        about_action = QAction(QIcon("assets/icons/about.png"), "&О программе", self)
+        about_action = QAction(QIcon(f"{ICONS_DIR}/about.png"), "&О программе", self)
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
         
@@ -856,42 +857,42 @@ class MainWindow(QMainWindow):
         self.addToolBar(self.main_toolbar)
         
         # Кнопки главного тулбара
-        self.connect_action = QAction(QIcon("assets/icons/connect.png"), "Подключиться", self)
+        self.connect_action = QAction(QIcon(f"{ICONS_DIR}/connect.png"), "Подключиться", self)
         self.connect_action.triggered.connect(self.connection_tab.connect_device)
         self.main_toolbar.addAction(self.connect_action)
         
-        self.disconnect_action = QAction(QIcon("assets/icons/disconnect.png"), "Отключиться", self)
+        self.disconnect_action = QAction(QIcon(f"{ICONS_DIR}/disconnect.png"), "Отключиться", self)
         self.disconnect_action.triggered.connect(self.connection_tab.disconnect_device)
         self.disconnect_action.setEnabled(False)
         self.main_toolbar.addAction(self.disconnect_action)
         
         self.main_toolbar.addSeparator()
         
-        self.diagnostic_action = QAction(QIcon("assets/icons/diagnostic.png"), "Диагностика", self)
+        self.diagnostic_action = QAction(QIcon(f"{ICONS_DIR}/diagnostic.png"), "Диагностика", self)
         self.diagnostic_action.triggered.connect(self.start_diagnostic)
         self.main_toolbar.addAction(self.diagnostic_action)
         
-        self.clear_errors_action = QAction(QIcon("assets/icons/clear_errors.png"), "Очистить ошибки", self)
+        self.clear_errors_action = QAction(QIcon(f"{ICONS_DIR}/clear_errors.png"), "Очистить ошибки", self)
         self.clear_errors_action.triggered.connect(self.clear_errors)
         self.main_toolbar.addAction(self.clear_errors_action)
         
         self.main_toolbar.addSeparator()
         
-        self.live_data_action = QAction(QIcon("assets/icons/live_data.png"), "Живые данные", self)
+        self.live_data_action = QAction(QIcon(f"{ICONS_DIR}/live_data.png"), "Живые данные", self)
         self.live_data_action.triggered.connect(self.start_live_data)
         self.main_toolbar.addAction(self.live_data_action)
         
-        self.graph_action = QAction(QIcon("assets/icons/graph.png"), "Графики", self)
+        self.graph_action = QAction(QIcon(f"{ICONS_DIR}/graph.png"), "Графики", self)
         self.graph_action.triggered.connect(self.show_graphs)
         self.main_toolbar.addAction(self.graph_action)
         
         self.main_toolbar.addSeparator()
         
-        self.report_action = QAction(QIcon("assets/icons/report.png"), "Отчет", self)
+        self.report_action = QAction(QIcon(f"{ICONS_DIR}/report.png"), "Отчет", self)
         self.report_action.triggered.connect(self.generate_report)
         self.main_toolbar.addAction(self.report_action)
         
-        self.print_action = QAction(QIcon("assets/icons/print.png"), "Печать", self)
+        self.print_action = QAction(QIcon(f"{ICONS_DIR}/print.png"), "Печать", self)
         self.print_action.triggered.connect(self.print_report)
         self.main_toolbar.addAction(self.print_action)
         
@@ -902,21 +903,21 @@ class MainWindow(QMainWindow):
         self.addToolBar(Qt.RightToolBarArea, self.tools_toolbar)
         
         # Кнопки тулбара инструментов
-        self.oscilloscope_action = QAction(QIcon("assets/icons/oscilloscope.png"), "Осциллограф", self)
+        self.oscilloscope_action = QAction(QIcon(f"{ICONS_DIR}/oscilloscope.png"), "Осциллограф", self)
         self.oscilloscope_action.triggered.connect(self.open_oscilloscope)
         self.tools_toolbar.addAction(self.oscilloscope_action)
         
-        self.scope_action = QAction(QIcon("assets/icons/scope.png"), "Сканирование", self)
+        self.scope_action = QAction(QIcon(f"{ICONS_DIR}/scope.png"), "Сканирование", self)
         self.scope_action.triggered.connect(self.open_scope)
         self.tools_toolbar.addAction(self.scope_action)
         
         self.tools_toolbar.addSeparator()
         
-        self.hex_editor_action = QAction(QIcon("assets/icons/hex.png"), "Hex редактор", self)
+        self.hex_editor_action = QAction(QIcon(f"{ICONS_DIR}/hex.png"), "Hex редактор", self)
         self.hex_editor_action.triggered.connect(self.open_hex_editor)
         self.tools_toolbar.addAction(self.hex_editor_action)
         
-        self.map_editor_action = QAction(QIcon("assets/icons/map_editor.png"), "Редактор карт", self)
+        self.map_editor_action = QAction(QIcon(f"{ICONS_DIR}/map_editor.png"), "Редактор карт", self)
         self.map_editor_action.triggered.connect(self.open_map_editor)
         self.tools_toolbar.addAction(self.map_editor_action)
         
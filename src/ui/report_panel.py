@@ -40,6 +40,7 @@ import tempfile
 import webbrowser
 from io import BytesIO
 
+from ui.icons import ICONS_DIR
 from utils.logger import setup_logger
 from config_manager import ConfigManager
 
@@ -1620,19 +1621,19 @@ class ReportPanel(QWidget):
         button_layout = QHBoxLayout()
         
         self.generate_button = QPushButton("Сгенерировать отчет")
-        self.generate_button.setIcon(QIcon("assets/icons/generate.png"))
+        self.generate_button.setIcon(QIcon(f"{ICONS_DIR}/generate.png"))
         self.generate_button.clicked.connect(self.generate_report)
         self.generate_button.setEnabled(False)
         button_layout.addWidget(self.generate_button)
         
         self.preview_button = QPushButton("Предпросмотр")
-        self.preview_button.setIcon(QIcon("assets/icons/preview.png"))
+        self.preview_button.setIcon(QIcon(f"{ICONS_DIR}/preview.png"))
         self.preview_button.clicked.connect(self.preview_report)
         self.preview_button.setEnabled(False)
         button_layout.addWidget(self.preview_button)
         
         self.cancel_button = QPushButton("Отмена")
-        self.cancel_button.setIcon(QIcon("assets/icons/cancel.png"))
+        self.cancel_button.setIcon(QIcon(f"{ICONS_DIR}/cancel.png"))
         self.cancel_button.clicked.connect(self.cancel_generation)
         button_layout.addWidget(self.cancel_button)
         
@@ -140,17 +140,22 @@ class RealTimeChart(QWidget):
         
     def setup_data(self):
         """Инициализация данных"""
-        self.time_data = deque(maxlen=self.buffer_size)
-        self.value_data = deque(maxlen=self.buffer_size)
-        self.mean_data = deque(maxlen=self.buffer_size)
+        # Кольцевые буферы удвоенной длины: каждая точка пишется в слот и его
+        # зеркало, поэтому окно всегда является непрерывным срезом без копирования
+        self.time_data = np.empty(self.buffer_size * 2, np.float64)
+        self.value_data = np.empty(self.buffer_size * 2, np.float64)
+        self.mean_data = np.empty(self.buffer_size * 2, np.float64)
+        self.write_index = 0
         
         self.start_time = time.time()
         self.last_update = self.start_time
         
-        # Таймер обновления
+        # Перерисовка запускается поступлением данных: точки, пришедшие
+        # за sample_rate, отображаются одним обновлением кривой
         self.update_timer = QTimer()
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(self.sample_rate)
         self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(self.sample_rate)
         
     def add_data_point(self, value):
         """Добавление точки данных"""
@@ -158,14 +163,20 @@ class RealTimeChart(QWidget):
             return
             
         current_time = time.time() - self.start_time
-        self.time_data.append(current_time)
-        self.value_data.append(value)
-        
-        # Расчет скользящего среднего
-        window_size = min(10, len(self.value_data))
-        if window_size > 0:
-            mean_value = sum(list(self.value_data)[-window_size:]) / window_size
-            self.mean_data.append(mean_value)
+        size = self.buffer_size
+        slot = self.write_index % size
+        self.time_data[slot] = self.time_data[slot + size] = current_time
+        self.value_data[slot] = self.value_data[slot + size] = value
+        self.write_index += 1
+        
+        # Расчет скользящего среднего по последним точкам
+        window_size = min(10, self.write_index)
+        end = slot + size + 1
+        mean_value = self.value_data[end - window_size:end].mean()
+        self.mean_data[slot] = self.mean_data[slot + size] = mean_value
+        
+        if not self.update_timer.isActive():
+            self.update_timer.start()
             
         # Запись данных
         if self.is_recording:
@@ -177,41 +188,51 @@ class RealTimeChart(QWidget):
             
         self.update_statistics()
         
+    def window(self, buffer):
+        """Окно буфера от старых точек к новым (срез без копирования)"""
+        count = min(self.write_index, self.buffer_size)
+        end = (self.write_index - 1) % self.buffer_size + self.buffer_size + 1
+        return buffer[end - count:end]
+        
     def update_display(self):
         """Обновление отображения графика"""
-        if not self.value_data:
+        if not self.write_index:
             return
             
         # Обновление кривой
-        self.curve.setData(list(self.time_data), list(self.value_data))
+        times = self.window(self.time_data)
+        self.curve.setData(times, self.window(self.value_data))
         
-        if self.show_mean_cb.isChecked() and self.mean_data:
-            self.mean_curve.setData(list(self.time_data), list(self.mean_data))
+        if self.show_mean_cb.isChecked():
+            self.mean_curve.setData(times, self.window(self.mean_data))
             
         # Автомасштабирование
-        if len(self.value_data) > 1:
+        if self.write_index > 1:
             self.plot_widget.enableAutoRange()
             
     def update_statistics(self):
         """Обновление статистики"""
-        if not self.value_data:
+        if not self.write_index:
             return
             
-        values = list(self.value_data)
+        values = self.window(self.value_data)
         current_value = values[-1]
+        min_value = values.min()
+        max_value = values.max()
+        mean_value = values.mean()
         
         # Обновление меток
         self.current_label.setText(f"Текущее: {current_value:.2f} {self.unit}")
-        self.min_label.setText(f"Мин: {min(values):.2f} {self.unit}")
-        self.max_label.setText(f"Макс: {max(values):.2f} {self.unit}")
-        self.mean_label.setText(f"Среднее: {np.mean(values):.2f} {self.unit}")
+        self.min_label.setText(f"Мин: {min_value:.2f} {self.unit}")
+        self.max_label.setText(f"Макс: {max_value:.2f} {self.unit}")
+        self.mean_label.setText(f"Среднее: {mean_value:.2f} {self.unit}")
         
         # Обновление текста на графике
         stats_text = (
             f"Текущее: {current_value:.2f}{self.unit}\n"
-            f"Мин: {min(values):.2f}{self.unit}\n"
-            f"Макс: {max(values):.2f}{self.unit}\n"
-            f"Среднее: {np.mean(values):.2f}{self.unit}"
+            f"Мин: {min_value:.2f}{self.unit}\n"
+            f"Макс: {max_value:.2f}{self.unit}\n"
+            f"Среднее: {mean_value:.2f}{self.unit}"
         )
         self.stats_text.setText(stats_text)
         
@@ -239,9 +260,7 @@ class RealTimeChart(QWidget):
     @pyqtSlot()
     def clear_chart(self):
         """Очистка графика"""
-        self.time_data.clear()
-        self.value_data.clear()
-        self.mean_data.clear()
+        self.write_index = 0
         self.curve.clear()
         self.mean_curve.clear()
         self.start_time = time.time()
@@ -250,21 +269,23 @@ class RealTimeChart(QWidget):
     @pyqtSlot()
     def export_data(self):
         """Экспорт данных"""
-        if not self.value_data:
+        if not self.write_index:
             return
             
+        values = self.window(self.value_data)
+        
         # Здесь должна быть реализация диалога сохранения
         # Пока просто сохраняем в файл
         data = {
             'title': self.title,
             'y_label': self.y_label,
             'unit': self.unit,
-            'data': list(zip(list(self.time_data), list(self.value_data))),
+            'data': list(zip(self.window(self.time_data).tolist(), values.tolist())),
             'statistics': {
-                'min': min(self.value_data),
-                'max': max(self.value_data),
-                'mean': np.mean(list(self.value_data)),
-                'std': np.std(list(self.value_data))
+                'min': values.min(),
+                'max': values.max(),
+                'mean': values.mean(),
+                'std': values.std()
             }
         }
         
@@ -1191,6 +1212,77 @@ class PerformanceChart(QWidget):
         self.plot_widget.getAxis('bottom').setTicks([list(zip(x, names))])
 
 
+class HistoricalChart(QWidget):
+    """График всей истории параметров по настенному времени"""
+    
+    range_changed = pyqtSignal(float, float)
+    
+    COLORS = ['#00ff00', '#ffaa00', '#00aaff', '#ff5555',
+              '#ff00ff', '#ffff00', '#00ffff', '#aaaaaa']
+    
+    def __init__(self, title="", parent=None):
+        super().__init__(parent)
+        self.title = title
+        # Кривые по PID создаются при первом появлении параметра
+        self.curves = {}
+        self.setup_ui()
+        
+    def setup_ui(self):
+        """Настройка интерфейса"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(5, 5, 5, 5)
+        
+        self.title_label = QLabel(f"<h3>{self.title}</h3>")
+        layout.addWidget(self.title_label)
+        
+        # Ось X подписывается датой и временем (секунды от эпохи)
+        self.plot_widget = pg.PlotWidget(axisItems={'bottom': pg.DateAxisItem()})
+        self.plot_widget.setBackground('#1e1e1e')
+        self.plot_widget.setLabel('left', 'Значение')
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
+        self.plot_widget.addLegend(offset=(10, 10))
+        
+        # Вне видимого диапазона точки не рисуются, плотные участки прореживаются
+        self.plot_widget.setClipToView(True)
+        self.plot_widget.setDownsampling(auto=True, mode='peak')
+        self.plot_widget.sigXRangeChanged.connect(self.on_range_changed)
+        
+        layout.addWidget(self.plot_widget)
+        
+    def setTitle(self, title):
+        """Установка заголовка"""
+        self.title = title
+        self.title_label.setText(f"<h3>{title}</h3>")
+        
+    def set_data(self, times, values):
+        """Установка данных: общие отметки времени и {pid: массив значений}
+        
+        Пропуски (NaN) отображаются разрывами кривой.
+        """
+        for pid in list(self.curves):
+            if pid not in values:
+                self.plot_widget.removeItem(self.curves.pop(pid))
+                
+        for pid, series in values.items():
+            curve = self.curves.get(pid)
+            if curve is None:
+                color = self.COLORS[len(self.curves) % len(self.COLORS)]
+                curve = self.plot_widget.plot(pen=pg.mkPen(color=color, width=2),
+                                              name=str(pid))
+                self.curves[pid] = curve
+            curve.setData(times, series, connect='finite')
+            
+    def clear(self):
+        """Удаление всех кривых"""
+        for curve in self.curves.values():
+            self.plot_widget.removeItem(curve)
+        self.curves.clear()
+        
+    def on_range_changed(self, view, x_range):
+        """Сообщение о смене видимого диапазона времени"""
+        self.range_changed.emit(float(x_range[0]), float(x_range[1]))
+
+
 # Фабрика графиков
 class ChartFactory:
     """Фабрика для создания графиков"""
@@ -1212,6 +1304,8 @@ class ChartFactory:
             return CompareChart(**kwargs)
         elif chart_type == "performance":
             return PerformanceChart(**kwargs)
+        elif chart_type == "historical":
+            return HistoricalChart(**kwargs)
         else:
             raise ValueError(f"Неизвестный тип графика: {chart_type}")
 
@@ -7,6 +7,7 @@ import os
 import unittest
 import tempfile
 import json
+import numpy as np
 from unittest.mock import Mock, MagicMock, patch, call, create_autospec
 from PyQt5.QtWidgets import (QApplication, QWidget, QPushButton, QLineEdit, 
                              QComboBox, QTableWidget, QTabWidget, QLabel,
@@ -22,8 +23,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from ui.main_window import MainWindow
 from ui.connection_panel import ConnectionPanel
 from ui.diagnostic_panel import DiagnosticPanel
-from ui.live_data_panel import LiveDataPanel
-from ui.error_panel import ErrorPanel
+from ui.live_data_panel import (LiveDataPanel, LiveDataModel, HistoryRing, HistoryStats,
+                                StretchedHistory, RecordingWorker, iso_timestamps)
+from ui.error_panel import (ErrorPanel, ErrorTableModel, LoadedError, write_errors_json,
+                            json_dumps, json_loads, write_errors_csv, write_errors_txt)
 from ui.adaptation_panel import AdaptationPanel
 from ui.reports_panel import ReportsPanel
 from config_manager import ConfigManager
@@ -961,6 +964,260 @@ class TestLiveDataPanel(unittest.TestCase):
             self.assertEqual(formatted, test_case['expected'])
 
 
+class TestHistoryRing(unittest.TestCase):
+    """Тестирование кольцевого буфера истории"""
+    
+    def fill(self, ring, count, start=0):
+        """Запись count кадров {'a': i} с отметкой времени i"""
+        for i in range(start, start + count):
+            ring.append({'a': float(i)}, i)
+            
+    def test_wraparound(self):
+        """Тест перезаписи старых кадров по кругу"""
+        ring = HistoryRing(4, pid_capacity=1)
+        self.fill(ring, 6)
+        
+        self.assertEqual(len(ring), 4)
+        position, timestamps, values = ring.snapshot(0, ['a'])
+        
+        # Снимок собирается из двух срезов - после и до точки переноса
+        self.assertEqual(position, 6)
+        self.assertEqual(timestamps.tolist(), [2, 3, 4, 5])
+        self.assertEqual(values.tolist(), [[2.0, 3.0, 4.0, 5.0]])
+        
+    def test_snapshot_since_position(self):
+        """Тест снимка только новых кадров"""
+        ring = HistoryRing(4, pid_capacity=1)
+        self.fill(ring, 6)
+        
+        position, timestamps, values = ring.snapshot(4, ['a', 'b'])
+        self.assertEqual(timestamps.tolist(), [4, 5])
+        self.assertEqual(values[0].tolist(), [4.0, 5.0])
+        # Неизвестный PID возвращается пропусками
+        self.assertTrue(np.isnan(values[1]).all())
+        
+        self.assertEqual(ring.snapshot(position, ['a']), (6, None, None))
+        
+    def test_snapshot_after_clear(self):
+        """Тест снимка с позиции, полученной до очистки буфера"""
+        ring = HistoryRing(4, pid_capacity=1)
+        self.fill(ring, 6)
+        position = ring.snapshot(0, ['a'])[0]
+        
+        ring.clear()
+        self.assertEqual(ring.snapshot(position, ['a']), (0, None, None))
+        
+        self.fill(ring, 2, start=10)
+        position, timestamps, values = ring.snapshot(position, ['a'])
+        self.assertEqual(position, 2)
+        self.assertEqual(timestamps.tolist(), [10, 11])
+        self.assertEqual(values.tolist(), [[10.0, 11.0]])
+        
+    def test_row_growth(self):
+        """Тест расширения массивов при появлении новых PID"""
+        ring = HistoryRing(4, pid_capacity=1)
+        ring.append({'a': 1.0}, 0)
+        ring.append({'a': 2.0, 'b': 3.0, 'c': 4.0}, 1)
+        
+        _, _, values = ring.snapshot(0, ['a', 'b', 'c'])
+        self.assertEqual(values[0].tolist(), [1.0, 2.0])
+        self.assertTrue(np.isnan(values[1, 0]))
+        self.assertEqual(values[2, 1], 4.0)
+        self.assertEqual(ring.stats('c')['count'], 1)
+        
+    def test_values_keep_precision(self):
+        """Тест хранения значений без потери точности"""
+        ring = HistoryRing(4)
+        ring.append({'a': 0.1, 'b': 123456.789}, 0)
+        
+        _, _, values = ring.snapshot(0, ['a', 'b'])
+        self.assertEqual(values[:, 0].tolist(), [0.1, 123456.789])
+        
+    def test_stats_with_absent_pids(self):
+        """Тест статистики PID, отсутствующих в части кадров"""
+        ring = HistoryRing(4)
+        ring.append({'a': 1.0, 'b': 5.0}, 0)
+        ring.append({'a': 3.0}, 1)
+        ring.append({'a': -1.0}, 2)
+        
+        self.assertEqual(ring.stats('a'), {'min': -1.0, 'max': 3.0, 'sum': 3.0, 'count': 3})
+        self.assertEqual(ring.stats('b'), {'min': 5.0, 'max': 5.0, 'sum': 5.0, 'count': 1})
+        self.assertIsNone(ring.stats('c'))
+        
+        stats = HistoryStats(ring)
+        self.assertEqual(list(stats), ['a', 'b'])
+        self.assertNotIn('c', stats)
+        
+    def test_stats_survive_wraparound(self):
+        """Тест статистики за всё время, а не только за окно буфера"""
+        ring = HistoryRing(2)
+        self.fill(ring, 5)
+        
+        stats = ring.stats('a')
+        self.assertEqual(stats['min'], 0.0)
+        self.assertEqual(stats['count'], 5)
+        
+        ring.clear()
+        self.assertIsNone(ring.stats('a'))
+
+
+class TestStretchedHistory(unittest.TestCase):
+    """Тестирование прореженной сводки истории"""
+    
+    def test_stride_doubling(self):
+        """Тест прореживания при заполнении сводки"""
+        summary = StretchedHistory(4, pid_capacity=1)
+        for i in range(5):
+            summary.ingest({'a': float(i)}, i)
+            
+        # Остается каждая вторая точка, шаг удваивается
+        self.assertEqual(summary.stride, 2)
+        timestamps, values = summary.snapshot()
+        self.assertEqual(timestamps.tolist(), [0, 2, 4])
+        self.assertEqual(values['a'].tolist(), [0.0, 2.0, 4.0])
+        
+        # Теперь принимается только каждый второй кадр
+        summary.ingest({'a': 5.0}, 5)
+        self.assertEqual(len(summary), 3)
+        summary.ingest({'a': 6.0}, 6)
+        self.assertEqual(summary.snapshot()[0].tolist(), [0, 2, 4, 6])
+        
+    def test_version_and_clear(self):
+        """Тест номера изменения и очистки сводки"""
+        summary = StretchedHistory(4)
+        summary.ingest({'a': 1.0}, 0)
+        version = summary.version
+        
+        summary.clear()
+        self.assertGreater(summary.version, version)
+        self.assertEqual(len(summary), 0)
+        self.assertEqual(summary.stride, 1)
+        self.assertEqual(summary.snapshot()[1], {})
+
+
+class TestLiveDataModel(unittest.TestCase):
+    """Тестирование модели таблицы текущих данных"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.model = LiveDataModel({})
+        self.model.append_rows([('0C', 'Обороты', 'об/мин'),
+                                ('05', 'Температура', '°C'),
+                                ('0D', 'Скорость', 'км/ч')])
+        self.model.set_values({'0C': 800.0, '05': 90.0, '0D': 40.0})
+        
+    def names(self):
+        """Имена параметров в порядке строк"""
+        return [self.model.data(self.model.index(row, 0))
+                for row in range(self.model.rowCount())]
+                
+    def assertRowIndex(self):
+        """Проверка соответствия индекса PID порядку строк"""
+        for pid, row in self.model._row_index.items():
+            self.assertEqual(self.model._rows[row][0], pid)
+        self.assertEqual(len(self.model._row_index), self.model.rowCount())
+        
+    def test_sort_by_value(self):
+        """Тест сортировки по текущему значению"""
+        self.model.sort(1, Qt.AscendingOrder)
+        self.assertEqual(self.names(), ['Скорость', 'Температура', 'Обороты'])
+        self.assertRowIndex()
+        
+        # Новые значения меняют порядок строк
+        self.model.set_values({'0D': 1000.0})
+        self.assertEqual(self.names(), ['Температура', 'Обороты', 'Скорость'])
+        self.assertRowIndex()
+        
+    def test_sort_by_name_descending(self):
+        """Тест сортировки по имени"""
+        self.model.sort(0, Qt.DescendingOrder)
+        self.assertEqual(self.names(), ['Температура', 'Скорость', 'Обороты'])
+        self.assertRowIndex()
+        
+    def test_append_rows_keeps_sort(self):
+        """Тест вставки строк в отсортированную таблицу"""
+        self.model.sort(1, Qt.AscendingOrder)
+        self.model.append_rows([('0F', 'Воздух', '°C')])
+        self.model.set_values({'0F': 20.0})
+        
+        self.assertEqual(self.names()[0], 'Воздух')
+        self.assertTrue(self.model.has_row('0F'))
+        self.assertRowIndex()
+        
+    def test_set_values_changed_rows(self):
+        """Тест перерисовки только строк PID кадра"""
+        changed = []
+        self.model.dataChanged.connect(
+            lambda first, last, roles: changed.append((first.row(), last.row())))
+            
+        self.model.set_values({'05': 95.0})
+        self.assertEqual(changed, [(1, 1)])
+        
+    def test_value_sort_skips_data_changed(self):
+        """Тест обновления таблицы, отсортированной по значению, без dataChanged"""
+        self.model.sort(1, Qt.AscendingOrder)
+        changed = []
+        self.model.dataChanged.connect(lambda *args: changed.append(args))
+        
+        # Пересортировка и так перерисовывает все строки
+        self.model.set_values({'0D': 1000.0})
+        self.assertEqual(changed, [])
+        
+    def test_clear(self):
+        """Тест очистки модели"""
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertFalse(self.model.has_row('0C'))
+
+
+class TestRecordingWorker(unittest.TestCase):
+    """Тестирование потока записи данных"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, 'recording.csv')
+        
+    def tearDown(self):
+        """Очистка после каждого теста"""
+        self.tmpdir.cleanup()
+        
+    def read_lines(self):
+        """Строки записанного файла"""
+        with open(self.filename, encoding='utf-8', newline='') as f:
+            return f.read().split('\r\n')
+            
+    def test_format_rows_with_missing_values(self):
+        """Тест пустых полей на месте отсутствующих значений"""
+        worker = RecordingWorker(os.devnull, HistoryRing(4), ['a', 'b'], 0.0, 0)
+        timestamps = np.array([0, 1_000_000_000], np.int64)
+        values = np.array([[1.0, 2.0], [np.nan, 4.5]])
+        
+        lines = worker.format_rows(timestamps, values).decode().split("\r\n")
+        
+        self.assertEqual(lines[-1], "")
+        self.assertEqual(lines[0].split(",")[1:], ["1.000", ""])
+        self.assertEqual(lines[1].split(",")[1:], ["2.000", "4.500"])
+        self.assertEqual(lines[0].split(",")[0], iso_timestamps(np.array([0.0]))[0])
+        
+    def test_counts_frames_lost_to_wraparound(self):
+        """Тест подсчета кадров, перезаписанных до чтения потоком записи"""
+        history = HistoryRing(4, pid_capacity=1)
+        worker = RecordingWorker(self.filename, history, ['a'], 0.0, 0)
+        for i in range(6):
+            history.append({'a': float(i)}, i)
+        worker.stop()
+        
+        # run() выполняется в текущем потоке: один снимок и выход
+        worker.run()
+        
+        self.assertEqual(worker.dropped, 2)
+        lines = self.read_lines()
+        self.assertEqual(lines[0], 'Timestamp,a')
+        self.assertEqual([line.split(',')[1] for line in lines[1:-1]],
+                         ['2.000', '3.000', '4.000', '5.000'])
+
+
 class TestErrorPanel(unittest.TestCase):
     """Тестирование панели ошибок"""
     
@@ -1150,6 +1407,121 @@ class TestErrorPanel(unittest.TestCase):
         self.assertNotEqual(error_item.text(2), '')  # Описание не должно быть пустым
 
 
+class TestErrorTableModel(unittest.TestCase):
+    """Тестирование модели таблицы ошибок"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.panel = ErrorPanel()
+        self.model = ErrorTableModel(self.panel)
+        self.model.set_rows([('ENGINE', self.error('P0300', 2)),
+                             ('ABS', self.error('C0035', 1)),
+                             ('ENGINE', self.error('P0171', 2)),
+                             ('ABS', self.error('C0040', 1))])
+                             
+    def tearDown(self):
+        """Очистка после каждого теста"""
+        self.panel.close()
+        
+    def error(self, code, count):
+        """Запись ошибки с кодом и числом появлений"""
+        return LoadedError(code=code, status='ACTIVE', first_occurrence='',
+                           last_occurrence='', count=count, freeze_frame={})
+                           
+    def codes(self):
+        """Коды ошибок в порядке видимых строк"""
+        return [self.model.row_at(row)[1].code for row in range(self.model.rowCount())]
+        
+    def test_sort_descending_is_stable(self):
+        """Тест устойчивой сортировки по убыванию"""
+        self.model.sort(7, Qt.DescendingOrder)
+        # Равные строки идут в том же порядке, что и при сортировке по возрастанию
+        self.assertEqual(self.codes(), ['P0300', 'P0171', 'C0035', 'C0040'])
+        
+        self.model.sort(7, Qt.AscendingOrder)
+        self.assertEqual(self.codes(), ['C0035', 'C0040', 'P0300', 'P0171'])
+        
+    def test_module_filter(self):
+        """Тест фильтра строк по модулю"""
+        self.model.set_module_filter('ABS')
+        self.assertEqual(self.codes(), ['C0035', 'C0040'])
+        
+        # Строка другого модуля в видимые не попадает
+        self.model.append_row('ENGINE', self.error('P0420', 1))
+        self.model.append_row('ABS', self.error('C0050', 1))
+        self.assertEqual(self.codes(), ['C0035', 'C0040', 'C0050'])
+        
+        self.model.set_module_filter(None)
+        self.assertEqual(self.model.rowCount(), 6)
+
+
+class TestErrorReportFiles(unittest.TestCase):
+    """Тестирование сохранения и загрузки отчетов об ошибках"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.panel = ErrorPanel()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.errors = {
+            'ENGINE': [
+                LoadedError(code='P0300', status='ACTIVE',
+                            first_occurrence='2024-01-15 10:30:00',
+                            last_occurrence='2024-01-16 08:15:00',
+                            count=3, freeze_frame={}),
+                LoadedError(code='P0171', status='STORED',
+                            first_occurrence='2024-01-10 09:00:00',
+                            last_occurrence='2024-01-10 09:00:00',
+                            count=1, freeze_frame={})
+            ],
+            'ABS': [
+                LoadedError(code='C0035', status='PENDING',
+                            first_occurrence='2024-01-12 18:45:00',
+                            last_occurrence='2024-01-14 07:20:00',
+                            count=12, freeze_frame={})
+            ]
+        }
+        
+    def tearDown(self):
+        """Очистка после каждого теста"""
+        self.panel.close()
+        self.tmpdir.cleanup()
+        
+    def path(self, name):
+        """Путь к файлу во временной папке"""
+        return os.path.join(self.tmpdir.name, name)
+        
+    def test_json_round_trip(self):
+        """Тест сохранения и загрузки JSON отчета"""
+        self.errors['ENGINE'][0].freeze_frame = {'RPM': 850, 'Температура': 92.5}
+        write_errors_json(self.path('errors.json'), self.errors, {})
+        
+        self.panel.load_errors_json(self.path('errors.json'))
+        self.assertEqual(self.panel.loaded_errors, self.errors)
+        
+    def test_json_helpers(self):
+        """Тест JSON в байтах UTF-8 без экранирования кириллицы"""
+        data = {'module': 'Двигатель', 'count': 3}
+        raw = json_dumps(data)
+        
+        self.assertIsInstance(raw, bytes)
+        self.assertIn('Двигатель'.encode('utf-8'), raw)
+        self.assertEqual(json_loads(raw), data)
+        
+    def test_csv_round_trip(self):
+        """Тест сохранения и загрузки CSV отчета"""
+        write_errors_csv(self.path('errors.csv'), self.errors, {})
+        
+        self.panel.load_errors_csv(self.path('errors.csv'))
+        self.assertEqual(self.panel.loaded_errors, self.errors)
+        
+    def test_txt_round_trip(self):
+        """Тест сохранения и загрузки текстового отчета"""
+        write_errors_txt(self.path('errors.txt'), self.errors, {})
+        
+        self.panel.load_errors_txt(self.path('errors.txt'))
+        self.assertEqual(self.panel.loaded_errors, self.errors)
+
+
 class TestAdaptationPanel(unittest.TestCase):
     """Тестирование панели адаптации"""
     